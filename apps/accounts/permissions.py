@@ -1,8 +1,6 @@
 from rest_framework import permissions
 
-from apps.accounts.models import CustomGroup
-
-from apps.clients.models import TenantUser
+from apps.share.services.permission_resolver import permission_resolver
 
 
 class GroupPermission(permissions.BasePermission):
@@ -23,10 +21,16 @@ class GroupPermission(permissions.BasePermission):
         return codename
 
     def has_permission(self, request, view):
-        user = request.user
-        tenant_user = TenantUser.objects.get(user=user)
+        if not request.user or not request.user.is_authenticated:
+            return False
+
+        # Tenant role and group codenames are resolved once and cached
+        resolved = permission_resolver.resolve(request)
+
+        if not resolved["is_tenant_user"]:
+            return False
 
-        if tenant_user.is_superuser:
+        if resolved["is_superuser"]:
             # Superusers have permission to perform any action
             return True
         else:
@@ -38,15 +42,5 @@ class GroupPermission(permissions.BasePermission):
                 # Users have permission to view data
                 return True
 
-            groups = CustomGroup.objects.filter(users=user)
-            is_exists = False
-
-            for group in groups:
-                # Check if the user belongs to any group that has the required permission
-                permission_check = group.permissions.filter(codename=codename)
-
-                if permission_check.exists():
-                    is_exists = True
-                    break
-
-            return is_exists
+            # Check if the user belongs to any group that has the required permission
+            return codename in resolved["codenames"]
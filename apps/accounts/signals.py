@@ -0,0 +1,26 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from apps.accounts.models import CustomGroup
+from apps.clients.models import TenantUser
+from apps.share.services.permission_resolver import invalidate_permissions
+
+
+@receiver(m2m_changed, sender=CustomGroup.permissions.through)
+@receiver(m2m_changed, sender=CustomGroup.users.through)
+def group_members_changed(sender, action, **kwargs):
+    """
+    Invalidate cached permission sets when group permissions or users change.
+    """
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_permissions()
+
+
+@receiver(post_delete, sender=CustomGroup)
+@receiver(post_save, sender=TenantUser)
+@receiver(post_delete, sender=TenantUser)
+def permission_owner_changed(sender, **kwargs):
+    """
+    Invalidate cached permission sets when a group or tenant user changes.
+    """
+    invalidate_permissions()
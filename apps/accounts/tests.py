@@ -1,2 +1,53 @@
+from datetime import date
+from types import SimpleNamespace
 
-# Create your tests here.
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.test import TestCase
+
+from apps.accounts.models import CustomGroup
+from apps.accounts.permissions import GroupPermission
+from apps.clients.models import ClientModel, TenantUser
+from apps.users.models import User
+
+
+class GroupPermissionTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.tenant = ClientModel.objects.create(
+            tenant_name="Tenant 1", paid_until=date(2099, 1, 1)
+        )
+        self.user = User.objects.create_user(
+            email="member@email.com", password="testpassword"
+        )
+        TenantUser.objects.create(user=self.user, tenant=self.tenant)
+        self.group = CustomGroup.objects.create(name="Sales", tenant=self.tenant)
+        self.group.users.add(self.user)
+        self.view = SimpleNamespace(queryset=CustomGroup)
+
+    def request(self, method):
+        return SimpleNamespace(user=self.user, method=method)
+
+    def test_warm_permission_check_runs_no_queries(self):
+        self.group.add_permissions("add_customgroup")
+        permission = GroupPermission()
+
+        self.assertTrue(permission.has_permission(self.request("POST"), self.view))
+
+        with self.assertNumQueries(0):
+            self.assertTrue(
+                permission.has_permission(self.request("POST"), self.view)
+            )
+            self.assertFalse(
+                permission.has_permission(self.request("DELETE"), self.view)
+            )
+
+    def test_group_change_invalidates_cached_permissions(self):
+        permission = GroupPermission()
+        self.assertFalse(permission.has_permission(self.request("DELETE"), self.view))
+
+        self.group.permissions.add(Permission.objects.get(codename="delete_customgroup"))
+        self.assertTrue(permission.has_permission(self.request("DELETE"), self.view))
+
+        self.group.users.remove(self.user)
+        self.assertFalse(permission.has_permission(self.request("DELETE"), self.view))
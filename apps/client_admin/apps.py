@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ClientAdminConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.client_admin"
+
+    def ready(self):
+        # Register master data cache invalidation handlers
+        from apps.client_admin import signals  # noqa: F401
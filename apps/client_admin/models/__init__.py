@@ -1 +1,2 @@
-from .preference import Preference
\ No newline at end of file
+from .preference import Preference
+from .document_sequence import DocumentSequence
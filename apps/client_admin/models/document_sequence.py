@@ -0,0 +1,20 @@
+from apps.share.models.base_model import BaseModel
+from django.db import models
+
+
+class DocumentSequence(BaseModel):
+    """
+    Last number handed out for a tenant's document prefix in a given year.
+
+    Rows are locked with SELECT ... FOR UPDATE while a number is allocated, see
+    ``apps.share.services.document_sequence``. ``year`` is 0 for sequences that
+    never restart.
+    """
+
+    prefix = models.CharField(max_length=20)
+    year = models.PositiveIntegerField(default=0)
+    last_value = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = "TM_DocumentSequence"
+        unique_together = ("tenant", "prefix", "year")
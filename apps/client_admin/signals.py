@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.client_admin.models import Preference
+from apps.share.services.master_data import invalidate_master_data
+
+
+@receiver(post_save, sender=Preference)
+@receiver(post_delete, sender=Preference)
+def preference_changed(sender, instance, **kwargs):
+    """
+    Invalidate the cached preference of the preference's tenant.
+    """
+    invalidate_master_data(Preference, instance.tenant_id)
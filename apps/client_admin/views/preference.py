@@ -8,6 +8,7 @@ from apps.accounts.permissions import GroupPermission
 from apps.share.services.tenant_error_logger import TenantLogger
 from apps.client_admin.models import Preference
 from apps.client_admin.serializers.preference import PreferenceSerializer
+from apps.share.services.master_data import master_data
 
 
 class PreferenceView(generics.ListCreateAPIView):
@@ -17,11 +18,13 @@ class PreferenceView(generics.ListCreateAPIView):
         IsAuthenticated,
         GroupPermission,
     )
+    # A tenant has a single preference, listed as a plain list
+    pagination_class = None
 
     def get_queryset(self):
         tenant = self.request.tenant
         if tenant is not None:
-            preference = tenant.preference_base_models.last()
+            preference = master_data.last(Preference, tenant)
             return [preference]
 
         else:
@@ -1,6 +1,11 @@
 from django.apps import AppConfig
 
+
 class FinanceConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.finance"
     APP_LABEL = "finance"
+
+    def ready(self):
+        # Register transaction type cache invalidation handlers
+        from apps.finance import signals  # noqa: F401
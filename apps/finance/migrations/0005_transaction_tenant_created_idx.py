@@ -0,0 +1,19 @@
+# Generated by Django 4.2.1 on 2026-10-18 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("finance", "0004_customerreceivable_comitted_payment_date_and_more"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["tenant", "created_at", "id"],
+                name="fm_tran_tenant_created_idx",
+            ),
+        ),
+    ]
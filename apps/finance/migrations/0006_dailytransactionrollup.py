@@ -0,0 +1,150 @@
+# Generated by Django 4.2.1 on 2026-10-18 16:10
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import F, Max, Sum
+from django.db.models.functions import TruncDate
+
+SALARY_TRAN_TYPE = 1011
+
+
+def day_tran_number(day):
+    # Same as apps.share.services.daily_rollup.tran_number
+    return f"DAY-{SALARY_TRAN_TYPE}-{day.isoformat()}"
+
+
+def legacy_salary_transactions(Transaction):
+    # Salaries used to post one ledger row each, numbered by their created_at
+    return Transaction.objects.filter(
+        tran_type=SALARY_TRAN_TYPE, tran_group=103, tran_head=6
+    ).exclude(tran_number__startswith="DAY-")
+
+
+def seed_salary_rollups(apps, schema_editor):
+    # Total every tenant's existing salaries per day, then keep one ledger
+    # row per day carrying that total in place of the per-salary rows
+    Salary = apps.get_model("hr", "Salary")
+    Transaction = apps.get_model("finance", "Transaction")
+    DailyTransactionRollup = apps.get_model("finance", "DailyTransactionRollup")
+
+    days = (
+        Salary.objects.filter(tenant__isnull=False, created_at__isnull=False)
+        .values("tenant_id", day=TruncDate("created_at"))
+        .annotate(amount=Sum(F("salary") + F("advance")))
+        .order_by()
+    )
+    for group in days:
+        DailyTransactionRollup.objects.create(
+            tenant_id=group["tenant_id"],
+            date=group["day"],
+            tran_type=SALARY_TRAN_TYPE,
+            amount=group["amount"],
+        )
+        legacy = legacy_salary_transactions(Transaction).filter(
+            tenant_id=group["tenant_id"], created_at__date=group["day"]
+        )
+        kept = legacy.order_by("id").first()
+        if kept is None:
+            Transaction.objects.create(
+                tenant_id=group["tenant_id"],
+                tran_number=day_tran_number(group["day"]),
+                tran_group=103,
+                tran_type=SALARY_TRAN_TYPE,
+                tran_head=6,
+                amount=group["amount"],
+            )
+            continue
+        legacy.exclude(id=kept.id).delete()
+        Transaction.objects.filter(id=kept.id).update(
+            tran_number=day_tran_number(group["day"]), amount=group["amount"]
+        )
+
+    # Days whose salaries were all deleted
+    legacy_salary_transactions(Transaction).delete()
+
+
+def unseed_salary_rollups(apps, schema_editor):
+    # Number each day's ledger row by its latest salary again, as the
+    # per-salary posting last left it
+    Salary = apps.get_model("hr", "Salary")
+    Transaction = apps.get_model("finance", "Transaction")
+
+    days = Transaction.objects.filter(
+        tran_type=SALARY_TRAN_TYPE, tran_number__startswith="DAY-"
+    )
+    for row in days:
+        latest = Salary.objects.filter(
+            tenant_id=row.tenant_id,
+            created_at__date=row.tran_number[len(f"DAY-{SALARY_TRAN_TYPE}-"):],
+        ).aggregate(created_at=Max("created_at"))["created_at"]
+        if latest is None:
+            row.delete()
+            continue
+        Transaction.objects.filter(id=row.id).update(tran_number=str(latest))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clients", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("finance", "0005_transaction_tenant_created_idx"),
+        ("hr", "0003_attendance_employee_date_uniq"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyTransactionRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("edited_at", models.DateTimeField(auto_now=True)),
+                ("date", models.DateField()),
+                ("tran_type", models.IntegerField()),
+                ("amount", models.FloatField(default=0)),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="%(class)s_created_models",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "tenant",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s_base_models",
+                        to="clients.clientmodel",
+                    ),
+                ),
+                (
+                    "updated_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="%(class)s_updated_models",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "FM_Daily_Tran_Rollup",
+                "unique_together": {("tenant", "date", "tran_type")},
+            },
+        ),
+        migrations.RunPython(seed_salary_rollups, unseed_salary_rollups),
+    ]
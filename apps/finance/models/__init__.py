@@ -6,3 +6,4 @@ from .vendor_pay import VendorPay
 from .transaction import Transaction
 from .customer_collection import CustomerCollection
 from .customer_receivable import CustomerReceivable
+from .daily_rollup import DailyTransactionRollup
@@ -0,0 +1,20 @@
+from django.db import models
+from apps.share.models.base_model import BaseModel
+
+
+class DailyTransactionRollup(BaseModel):
+    """
+    Running total of a tenant's postings of one transaction type on one day.
+
+    Maintained incrementally with ``F()`` updates by
+    ``apps.share.services.daily_rollup``, inside the transaction that saves
+    the source document, and posted to the transaction ledger from there.
+    """
+
+    date = models.DateField()
+    tran_type = models.IntegerField()
+    amount = models.FloatField(default=0)
+
+    class Meta:
+        db_table = "FM_Daily_Tran_Rollup"
+        unique_together = ("tenant", "date", "tran_type")
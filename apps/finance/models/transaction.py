@@ -1,12 +1,6 @@
 from django.db import models
-from apps.finance.models.inc_exp_type import IncExpType
 from apps.share.models.base_model import BaseModel
 
-try:
-    incTypes = list(IncExpType.objects.all().values_list("code", "type"))
-except:
-    incTypes = []
-
 
 class Transaction(BaseModel):
     tran_number = models.CharField(max_length=50, blank=True, null=True)
@@ -28,7 +22,9 @@ class Transaction(BaseModel):
         (1012, "Utility"),
         (1013, "Rent"),
         (1014, "Advance"),
-    ] + incTypes
+    ]
+    # The tenant's income and expense types extend these at runtime, see
+    # apps.share.services.tran_type_choices
     tran_type = models.IntegerField(choices=TYPE, blank=True, null=True)
 
     GROUP = ((102, "Income"), (103, "Expense"), (101, "Receivables"), (104, "Payables"))
@@ -50,6 +46,18 @@ class Transaction(BaseModel):
 
     class Meta:
         db_table = "FM_Transaction"
+        indexes = [
+            # Keyset pagination of a tenant's transactions, newest first
+            models.Index(
+                fields=["tenant", "created_at", "id"],
+                name="fm_tran_tenant_created_idx",
+            ),
+        ]
+
+    def get_tran_type_display(self):
+        from apps.share.services.tran_type_choices import tran_type_choices
+
+        return tran_type_choices.label(self.tenant_id, self.tran_type)
 
     def __str__(self) -> str:
         return self.tran_number
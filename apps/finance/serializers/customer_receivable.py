@@ -8,6 +8,8 @@ class CustomerReceivableSerializer(serializers.ModelSerializer):
     class Meta:
         model = CustomerReceivable
         fields = ('id', 'receivable_num','customer', 'amount', 'note', 'status', 'created_at', 'edited_at')
+        # Allocated by the document sequence on create
+        extra_kwargs = {"receivable_num": {"required": False}}
 
     def to_representation(self, instance):
         representation = super().to_representation(instance)
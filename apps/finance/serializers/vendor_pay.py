@@ -28,6 +28,8 @@ class VendorPaySerializer(serializers.ModelSerializer):
             "created_at",
             "edited_at",
         )
+        # Allocated by the document sequence on create
+        extra_kwargs = {"pay_num": {"required": False}}
 
     def to_representation(self, instance):
         """
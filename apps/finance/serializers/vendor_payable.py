@@ -28,6 +28,8 @@ class VendorPayableSerializer(serializers.ModelSerializer):
             "created_at",
             "edited_at",
         )
+        # Allocated by the document sequence on create
+        extra_kwargs = {"payable_num": {"required": False}}
 
     def to_representation(self, instance):
         """
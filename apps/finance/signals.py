@@ -0,0 +1,15 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.finance.models.inc_exp_type import IncExpType
+from apps.share.services.tran_type_choices import invalidate_tran_type_choices
+
+
+@receiver(post_save, sender=IncExpType)
+@receiver(post_delete, sender=IncExpType)
+def inc_exp_type_changed(sender, instance, **kwargs):
+    """
+    Invalidate the cached transaction types of the income or expense type's
+    tenant.
+    """
+    invalidate_tran_type_choices(instance.tenant_id)
@@ -1,3 +1,5 @@
+from django.db import transaction
+
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
@@ -8,11 +10,9 @@ from apps.finance.models.customer_collection import CustomerCollection
 from apps.finance.serializers.customer_collection import CustomerCollectionSerializer
 
 from apps.share.views import get_tenant_user
-from apps.share.views import number_generate
+from apps.share.services.document_sequence import document_sequence
 from apps.share.services.transaction_manager import TransactionManager
 
-from datetime import datetime
-
 
 class CustomerCollectionView(generics.ListCreateAPIView):
     queryset = CustomerCollection
@@ -38,29 +38,31 @@ class CustomerCollectionView(generics.ListCreateAPIView):
         user_tenant = get_tenant_user(self).tenant
         data = request.data
         if user_tenant is not None:
-            try:
-                last_rec = user_tenant.customercollection_base_models.last()
-                previous_number = last_rec.collection_num
-            except:
-                previous_number = f"COL-{datetime.now().year}-{0}"
-
-            collection_number = number_generate(previous_number)
-            data["collection_num"] = collection_number
-
             serializer = self.get_serializer(data=data)
 
             if serializer.is_valid():
                 try:
-                    collection = serializer.save(tenant=user_tenant)
-                    transaction_manage = TransactionManager(
-                        tenant=user_tenant, tran_number=data["collection_num"]
-                    )
-                    transaction_manage.transaction_create_or_update(
-                        tran_group=102,
-                        amount=data["amount"],
-                        tran_type=1008,
-                        tran_head=3,
-                    )
+                    # The number is allocated in the same transaction as the
+                    # collection, so a failed create hands it back
+                    with transaction.atomic():
+                        collection = serializer.save(
+                            tenant=user_tenant,
+                            collection_num=document_sequence.next_number(
+                                user_tenant,
+                                "COL",
+                                user_tenant.customercollection_base_models,
+                                "collection_num",
+                            ),
+                        )
+                        transaction_manage = TransactionManager(
+                            tenant=user_tenant, tran_number=collection.collection_num
+                        )
+                        transaction_manage.transaction_create_or_update(
+                            tran_group=102,
+                            amount=data["amount"],
+                            tran_type=1008,
+                            tran_head=3,
+                        )
 
                     return Response(serializer.data, status=status.HTTP_201_CREATED)
                 except Exception as e:
@@ -10,11 +10,9 @@ from apps.finance.models.customer_receivable import CustomerReceivable
 from apps.finance.serializers.customer_receivable import CustomerReceivableSerializer
 
 from apps.share.views import get_tenant_user
-from apps.share.views import number_generate
+from apps.share.services.document_sequence import document_sequence
 from apps.share.services.transaction_manager import TransactionManager
 
-from datetime import datetime
-
 
 class CustomerReceivableView(generics.ListCreateAPIView):
     queryset = CustomerReceivable
@@ -41,22 +39,21 @@ class CustomerReceivableView(generics.ListCreateAPIView):
             user_tenant = get_tenant_user(self).tenant
             data = request.data
             if user_tenant is not None:
-                try:
-                    last_rec = user_tenant.customerreceivable_base_models.last()
-                    previous_number = last_rec.receivable_num
-                except:
-                    previous_number = f"REC-{datetime.now().year}-{0}"
-
-                receivable_number = number_generate(previous_number)
-                data["receivable_num"] = receivable_number
-
                 serializer = self.get_serializer(data=data)
 
                 if serializer.is_valid():
                     try:
-                        rcvble = serializer.save(tenant=user_tenant)
+                        rcvble = serializer.save(
+                            tenant=user_tenant,
+                            receivable_num=document_sequence.next_number(
+                                user_tenant,
+                                "REC",
+                                user_tenant.customerreceivable_base_models,
+                                "receivable_num",
+                            ),
+                        )
                         transaction_manage = TransactionManager(
-                            tenant=user_tenant, tran_number=data["receivable_num"]
+                            tenant=user_tenant, tran_number=rcvble.receivable_num
                         )
                         transaction_manage.transaction_create_or_update(
                             tran_group=101,
@@ -67,6 +64,7 @@ class CustomerReceivableView(generics.ListCreateAPIView):
 
                         return Response(serializer.data, status=status.HTTP_201_CREATED)
                     except Exception as e:
+                        transaction.set_rollback(True)
                         return Response(
                             str(e), status=status.HTTP_500_INTERNAL_SERVER_ERROR
                         )
@@ -1,3 +1,5 @@
+from django.db import transaction
+
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
@@ -7,12 +9,11 @@ from apps.accounts.permissions import GroupPermission
 from apps.finance.models.inc_exp import IncExp
 from apps.finance.serializers.inc_exp import IncExpSerializer
 
-from apps.share.views import validate_tenant_user, number_generate
+from apps.share.views import validate_tenant_user
+from apps.share.services.document_sequence import document_sequence
 from apps.share.services.tenant_error_logger import TenantLogger
 from apps.share.services.transaction_manager import TransactionManager
 
-from datetime import datetime
-
 
 class IncExpView(generics.ListCreateAPIView):
     """
@@ -91,25 +92,25 @@ class IncExpView(generics.ListCreateAPIView):
 
         if self.tenant:
             if serializer.is_valid():
-                try:
-                    previous_num = (
-                        self.tenant.incexp_base_models.filter(source_type=source_type)
-                        .last()
-                        .num
+                # The number is allocated in the same transaction as the
+                # entry, so a failed create hands it back
+                with transaction.atomic():
+                    num = document_sequence.next_number(
+                        self.tenant,
+                        source_type_short_name,
+                        self.tenant.incexp_base_models,
+                        "num",
+                    )
+                    inc_exp = serializer.save(tenant=self.tenant, num=num)
+                    transaction_manager = TransactionManager(
+                        tran_number=num, tenant=self.tenant
+                    )
+                    transaction_manager.transaction_create_or_update(
+                        tran_group=tran_group,
+                        amount=inc_exp.amt,
+                        tran_type=inc_exp.type,
+                        tran_head=tran_head,
                     )
-                except:
-                    previous_num = f"{source_type_short_name}-{datetime.now().year}-{0}"
-                num = number_generate(previous_num)
-                inc_exp = serializer.save(tenant=self.tenant, num=num)
-                transaction_manager = TransactionManager(
-                    tran_number=num, tenant=self.tenant
-                )
-                transaction_manager.transaction_create_or_update(
-                    tran_group=tran_group,
-                    amount=inc_exp.amt,
-                    tran_type=inc_exp.type,
-                    tran_head=tran_head,
-                )
 
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
             else:
@@ -9,7 +9,7 @@ from apps.finance.serializers.transaction import TransactionSerializer
 
 from apps.share.views import validate_tenant_user
 from apps.share.services.tenant_error_logger import TenantLogger
-from apps.share.services.custom_pagination import CustomPageNumberPagination
+from apps.share.services.custom_pagination import PageNumberKeysetPagination
 
 
 class TransactionView(generics.ListAPIView):
@@ -34,7 +34,9 @@ class TransactionView(generics.ListAPIView):
         IsAuthenticated,
         GroupPermission,
     )
-    pagination_class = CustomPageNumberPagination
+    # Paginated by page number before keyset pagination became the default;
+    # its clients rely on that response shape and its count
+    pagination_class = PageNumberKeysetPagination
 
     def dispatch(self, request, *args, **kwargs):
         """
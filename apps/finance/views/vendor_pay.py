@@ -8,13 +8,11 @@ from apps.accounts.permissions import GroupPermission
 
 from apps.finance.models.vendor_pay import VendorPay
 from apps.finance.serializers.vendor_pay import VendorPaySerializer
-from apps.share.views import get_tenant_user, number_generate
-from datetime import datetime
+from apps.share.views import get_tenant_user
+from apps.share.services.document_sequence import document_sequence
 
 from apps.share.services.transaction_manager import TransactionManager
 
-from datetime import datetime
-
 
 class VendorPayView(generics.ListCreateAPIView):
     """
@@ -64,18 +62,18 @@ class VendorPayView(generics.ListCreateAPIView):
             try:
                 tenant = get_tenant_user(self).tenant
                 data = request.data
-                try:
-                    previous_number = tenant.vendorpay_base_models.last().pay_num
-                except:
-                    previous_number = f"VPAY-{datetime.now().year}-{0}"
-                data["pay_num"] = number_generate(previous_number)
                 serializer = self.get_serializer(data=data)
 
                 # Create or update the transaction associated with the payment
                 if serializer.is_valid():
-                    serializer.save(tenant=tenant)
+                    vendor_pay = serializer.save(
+                        tenant=tenant,
+                        pay_num=document_sequence.next_number(
+                            tenant, "VPAY", tenant.vendorpay_base_models, "pay_num"
+                        ),
+                    )
                     transaction_manage = TransactionManager(
-                        tenant=tenant, tran_number=data["pay_num"]
+                        tenant=tenant, tran_number=vendor_pay.pay_num
                     )
 
                     transaction_manage.transaction_create_or_update(
@@ -88,6 +86,7 @@ class VendorPayView(generics.ListCreateAPIView):
                         serializer.errors, status=status.HTTP_400_BAD_REQUEST
                     )
             except Exception as e:
+                transaction.set_rollback(True)
                 return Response(str(e), status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
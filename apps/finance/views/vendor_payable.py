@@ -9,11 +9,10 @@ from apps.accounts.permissions import GroupPermission
 from apps.finance.models.vendor_payable import VendorPayable
 from apps.finance.serializers.vendor_payable import VendorPayableSerializer
 
-from apps.share.views import get_tenant_user, number_generate
+from apps.share.views import get_tenant_user
+from apps.share.services.document_sequence import document_sequence
 from apps.share.services.transaction_manager import TransactionManager
 
-from datetime import datetime
-
 
 class VendorPayableView(generics.ListCreateAPIView):
     """
@@ -65,24 +64,22 @@ class VendorPayableView(generics.ListCreateAPIView):
             try:
                 tenant = get_tenant_user(self).tenant
                 data = request.data
-                try:
-                    previous_number = (
-                        tenant.vendorpayable_base_models.last().payable_num
-                    )
-                except:
-                    previous_number = f"VPAYABLE-{datetime.now().year}-{0}"
-                data["payable_num"] = number_generate(previous_number)
                 serializer = self.get_serializer(data=data)
 
                 if serializer.is_valid():
-                    serializer.save(tenant=tenant)
-                    transaction_manage = TransactionManager(
-                        tenant=tenant, tran_number=data["payable_num"]
+                    vendor_payable = serializer.save(
+                        tenant=tenant,
+                        payable_num=document_sequence.next_number(
+                            tenant,
+                            "VPAYABLE",
+                            tenant.vendorpayable_base_models,
+                            "payable_num",
+                        ),
                     )
 
                     # Create or update the transaction associated with the payable
                     transaction_manage = TransactionManager(
-                        tenant=tenant, tran_number=data["payable_num"]
+                        tenant=tenant, tran_number=vendor_payable.payable_num
                     )
                     transaction_manage.transaction_create_or_update(
                         tran_group=104,
@@ -97,6 +94,7 @@ class VendorPayableView(generics.ListCreateAPIView):
                         serializer.errors, status=status.HTTP_400_BAD_REQUEST
                     )
             except Exception as e:
+                transaction.set_rollback(True)
                 return Response(str(e), status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
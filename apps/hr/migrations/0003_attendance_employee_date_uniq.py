@@ -0,0 +1,41 @@
+# Generated by Django 4.2.1 on 2026-10-18 16:40
+
+from django.db import migrations, models
+from django.db.models import Count, Max
+from django.db.models.functions import Trunc, TruncDate
+
+
+def normalize_attendance_dates(apps, schema_editor):
+    # Keep the latest record of each employee's day, then store every date at
+    # midnight so the unique constraint covers the whole day
+    Attendance = apps.get_model("hr", "Attendance")
+    duplicates = (
+        Attendance.objects.filter(date__isnull=False)
+        .values("tenant_id", "employee_id", day=TruncDate("date"))
+        .annotate(rows=Count("id"), keep_id=Max("id"))
+        .filter(rows__gt=1)
+    )
+    for group in duplicates:
+        Attendance.objects.filter(
+            tenant_id=group["tenant_id"],
+            employee_id=group["employee_id"],
+            date__date=group["day"],
+        ).exclude(id=group["keep_id"]).delete()
+    Attendance.objects.filter(date__isnull=False).update(date=Trunc("date", "day"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("hr", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_attendance_dates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="attendance",
+            constraint=models.UniqueConstraint(
+                fields=("tenant", "employee", "date"),
+                name="hr_attend_employee_date_uniq",
+            ),
+        ),
+    ]
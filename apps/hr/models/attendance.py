@@ -18,4 +18,11 @@ class Attendance(BaseModel):
     
     
     class Meta:
-        db_table = "HR_Attend"
\ No newline at end of file
+        db_table = "HR_Attend"
+        constraints = [
+            # Dates are stored at midnight, so this is one row per day
+            models.UniqueConstraint(
+                fields=["tenant", "employee", "date"],
+                name="hr_attend_employee_date_uniq",
+            ),
+        ]
\ No newline at end of file
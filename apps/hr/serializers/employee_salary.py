@@ -17,6 +17,12 @@ class EmployeeSalarySerializer(serializers.ModelSerializer):
         representation["emp_status"] = (
             "Active" if instance.status == 1 else "Terminated"
         )
+        # Reports annotate the counts for every employee in one query
+        if hasattr(instance, "total_absences"):
+            representation["total_absences"] = instance.total_absences
+            representation["total_leaves"] = instance.total_leaves
+            return representation
+
         attendances = Attendance.objects.filter(employee=instance)
 
         representation["total_absences"] = attendances.filter(attend_status=2).count()
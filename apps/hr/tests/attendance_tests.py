@@ -0,0 +1,61 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+
+from apps.hr.models.attendance import Attendance
+from apps.hr.models.employee import Employee
+from apps.share.test.base import BaseTestCase
+
+
+class AttendanceUpsertTestCase(BaseTestCase):
+    def create_employees(self, count):
+        return Employee.objects.bulk_create(
+            Employee(tenant=self.tenant, name=f"employee_{n}", emp_wage_type=1)
+            for n in range(count)
+        )
+
+    def post_sheet(self, employees, attend_status=1, date="2023-07-10T00:00:00.000Z"):
+        data = {
+            "date": date,
+            "week": 28,
+            "employee_lines": [
+                {"employee": employee.id, "attend_status": attend_status, "time": "09:00"}
+                for employee in employees
+            ],
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse("attendance-list"), data, format="json")
+        return response, len(queries)
+
+    def test_sheet_is_upserted_per_employee_and_day(self):
+        employees = self.create_employees(3)
+
+        self.post_sheet(employees, attend_status=1)
+        response, _ = self.post_sheet(
+            employees, attend_status=2, date="2023-07-10T18:30:00.000Z"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        attendances = Attendance.objects.filter(employee__in=employees)
+        self.assertEqual(attendances.count(), 3)
+        self.assertEqual(set(attendances.values_list("attend_status", flat=True)), {2})
+        self.assertEqual(len(response.data), 3)
+
+    def test_unknown_employee_rejects_the_sheet(self):
+        employees = self.create_employees(2)
+        employees[1].id += 1000
+
+        response, _ = self.post_sheet(employees)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertFalse(Attendance.objects.exists())
+
+    def test_query_count_does_not_grow_with_employees(self):
+        _, single = self.post_sheet(self.create_employees(1))
+
+        _, many = self.post_sheet(self.create_employees(200))
+
+        self.assertEqual(many, single)
@@ -0,0 +1,77 @@
+import json
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+
+from apps.hr.models.attendance import Attendance
+from apps.hr.models.employee import Employee
+from apps.hr.models.salary import Salary
+from apps.share.test.base import BaseTestCase
+
+
+class FilterSalaryListTestCase(BaseTestCase):
+    form_data = {
+        "emp_type": 1,
+        "from": "2023-07-01T00:00:00.000Z",
+        "to": "2023-07-31T23:59:59.000Z",
+    }
+
+    def create_employees(self, count):
+        employees = Employee.objects.bulk_create(
+            Employee(tenant=self.tenant, name=f"employee_{n}", emp_wage_type=1, salary=6000)
+            for n in range(count)
+        )
+        Salary.objects.bulk_create(
+            Salary(
+                tenant=self.tenant,
+                employee=employee,
+                dt_from="2023-07-01T00:00:00Z",
+                dt_to="2023-07-15T00:00:00Z",
+                salary=2000,
+                advance=500,
+                bonus=100,
+                deduct=50,
+            )
+            for employee in employees
+            for _ in range(2)
+        )
+        Attendance.objects.bulk_create(
+            Attendance(tenant=self.tenant, employee=employee, attend_status=attend_status)
+            for employee in employees
+            for attend_status in (1, 2, 2, 3)
+        )
+        return employees
+
+    def report(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse("filter-salary-list"), {"form_data": json.dumps(self.form_data)}
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(queries)
+
+    def test_report_totals(self):
+        self.create_employees(1)
+
+        response, _ = self.report()
+
+        row = response.data[0]
+        self.assertEqual(row["deduction"], 100)
+        self.assertEqual(row["bonus"], 200)
+        self.assertEqual(row["paid"], 5000)
+        self.assertEqual(row["due"], 6000 - 100 + 200 - 5000)
+        self.assertEqual((row["total_absences"], row["total_leaves"]), (2, 1))
+        self.assertEqual(len(row["salary_data"]), 2)
+
+    def test_query_count_does_not_grow_with_employees(self):
+        self.create_employees(1)
+        _, single = self.report()
+
+        self.create_employees(50)
+        response, many = self.report()
+
+        self.assertEqual(len(response.data), 51)
+        self.assertEqual(many, single)
@@ -0,0 +1,51 @@
+from datetime import date
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.clients.models import ClientModel
+from apps.finance.models import DailyTransactionRollup, Transaction
+from apps.hr.views.salary import SALARY_TRAN_TYPE
+from apps.share.services.daily_rollup import daily_rollup
+from apps.share.test.base import BaseTestCase
+
+
+class DailyRollupTestCase(BaseTestCase):
+    day = date(2023, 7, 10)
+
+    def add(self, tenant, delta):
+        return daily_rollup.add(
+            tenant, self.day, SALARY_TRAN_TYPE, delta, tran_group=103, tran_head=6
+        )
+
+    def test_totals_are_incremental_and_per_tenant(self):
+        other = ClientModel.objects.create(
+            tenant_name="Tenant 2", paid_until=date(2099, 1, 1)
+        )
+
+        self.add(self.tenant, 2500)
+        self.add(self.tenant, 1000)
+        self.add(other, 700)
+        total = self.add(self.tenant, -500)
+
+        self.assertEqual(total, 3000)
+        rollups = DailyTransactionRollup.objects.filter(date=self.day)
+        self.assertEqual(rollups.get(tenant=self.tenant).amount, 3000)
+        self.assertEqual(rollups.get(tenant=other).amount, 700)
+
+        tran_number = daily_rollup.tran_number(self.day, SALARY_TRAN_TYPE)
+        transactions = Transaction.objects.filter(tran_number=tran_number)
+        self.assertEqual(transactions.get(tenant=self.tenant).amount, 3000)
+        self.assertEqual(transactions.get(tenant=other).amount, 700)
+
+    def test_posting_cost_does_not_depend_on_the_day(self):
+        self.add(self.tenant, 100)
+        with CaptureQueriesContext(connection) as first:
+            self.add(self.tenant, 100)
+
+        for _ in range(50):
+            self.add(self.tenant, 100)
+        with CaptureQueriesContext(connection) as later:
+            self.add(self.tenant, 100)
+
+        self.assertEqual(len(later), len(first))
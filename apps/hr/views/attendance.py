@@ -8,6 +8,7 @@ from apps.hr.models.attendance import Attendance
 from apps.hr.serializers.attendance import AttendanceSerializer
 
 from apps.share.views import get_tenant_user
+from apps.share.services.attendance_upsert import AttendanceUpsert
 
 from datetime import datetime
 
@@ -39,38 +40,17 @@ class AttendanceView(generics.ListCreateAPIView):
 
     def create(self, request, *args, **kwargs):
         tenant = get_tenant_user(self).tenant
-        employee_lines = request.data["employee_lines"]
-        date = datetime.fromisoformat(request.data["date"][:-1])
-        week = request.data["week"]
-        created_attendances = []
         if tenant is not None:
-            for line in employee_lines:
-                if line["attend_status"] != None:
-                    # Check if there is an existing record for the employee and date
-                    attendance = Attendance.objects.filter(
-                        employee=line["employee"],
-                        date__date=date,
-                    ).first()
-
-                    print(attendance)
-                    # print(attendance.date)
-
-                    if attendance:
-                        # If an attendance record exists, update it with the new data
-                        serializer = AttendanceSerializer(attendance, data=line)
-                    else:
-                        # If no attendance record exists, create a new one
-                        line["date"] = date
-                        line["week"] = week
-                        serializer = AttendanceSerializer(data=line)
-
-                    if serializer.is_valid():
-                        serializer.save(tenant=tenant)
-                        created_attendances.append(serializer.data)
-                    else:
-                        print(serializer.errors)
-
-            return Response(created_attendances, status=status.HTTP_201_CREATED)
+            date = datetime.fromisoformat(request.data["date"][:-1])
+            week = request.data["week"]
+            attendance_upsert = AttendanceUpsert(tenant)
+            lines, errors = attendance_upsert.validate(request.data["employee_lines"])
+            if errors:
+                return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+            attendances = attendance_upsert.save(lines, date, week)
+            serializer = AttendanceSerializer(attendances, many=True)
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
 
         else:
             print("Tenant not found.")
@@ -9,11 +9,11 @@ from apps.accounts.permissions import GroupPermission
 from apps.hr.models.employee import Employee
 from apps.hr.serializers.employee import EmployeeSerializer
 
-from apps.share.views import get_tenant_user, number_generate
+from apps.share.views import get_tenant_user
+from apps.share.services.document_sequence import document_sequence
 
 
 import json
-from datetime import datetime
 
 
 class EmployeeView(generics.ListCreateAPIView):
@@ -65,19 +65,18 @@ class EmployeeView(generics.ListCreateAPIView):
         serializer = self.get_serializer(data=data)
         with transaction.atomic():
             try:
-                try:
-                    last_number = tenant.employee_base_models.last().employee_service_id
-                except:
-                    last_number = f"EMP-{datetime.now().year}-{0}"
-                employee_service_id = number_generate(last_number)
-
                 photo = request.data.get("photo", None)
 
                 if serializer.is_valid():
                     serializer.save(
                         tenant=tenant,
                         photo=photo,
-                        employee_service_id=employee_service_id,
+                        employee_service_id=document_sequence.next_number(
+                            tenant,
+                            "EMP",
+                            tenant.employee_base_models,
+                            "employee_service_id",
+                        ),
                     )
                     return Response(serializer.data, status=status.HTTP_201_CREATED)
                 else:
@@ -85,6 +84,8 @@ class EmployeeView(generics.ListCreateAPIView):
                         serializer.errors, status=status.HTTP_400_BAD_REQUEST
                     )
             except:
+                # Also hands the allocated employee number back
+                transaction.set_rollback(True)
                 return Response(status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
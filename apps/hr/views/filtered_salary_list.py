@@ -1,4 +1,4 @@
-from django.db.models import Sum
+from django.db.models import Count, Prefetch, Q, Sum
 
 from rest_framework import status
 from rest_framework.views import APIView
@@ -33,6 +33,79 @@ class FilterSalaryListView(APIView):
         GroupPermission,
     )
 
+    def salary_report(self, employees, from_date, to_date):
+        """
+        Build the salary report rows of ``employees`` for salaries paid between
+        ``from_date`` and ``to_date``.
+
+        Runs a fixed number of queries for any number of employees: the
+        employees with their attendance counts, the prefetched salary rows and
+        the grouped salary totals.
+        """
+        salaries = Salary.objects.filter(
+            employee__in=employees, dt_from__gte=from_date, dt_to__lte=to_date
+        )
+        employees = employees.annotate(
+            total_absences=Count(
+                "employee_attendance",
+                filter=Q(employee_attendance__attend_status=2),
+            ),
+            total_leaves=Count(
+                "employee_attendance",
+                filter=Q(employee_attendance__attend_status=3),
+            ),
+        ).prefetch_related(
+            Prefetch("employee_salary", queryset=salaries, to_attr="period_salaries")
+        )
+        totals = {
+            row["employee"]: row
+            for row in salaries.values("employee").annotate(
+                deduct_sum=Sum("deduct"),
+                bonus_sum=Sum("bonus"),
+                advance_sum=Sum("advance"),
+                salary_sum=Sum("salary"),
+            )
+        }
+
+        employee_salaries = []
+        for employee in employees:
+            employee_serializer = self.serializer_class(employee)
+            salary_data = dict(employee_serializer.data)
+            total = totals.get(employee.id)
+            if total is not None:
+                salary_data["deduction"] = total["deduct_sum"]
+                salary_data["bonus"] = total["bonus_sum"]
+                salary_data["advance"] = total["advance_sum"]
+                salary_data["paid"] = total["salary_sum"] + salary_data["advance"]
+                salary_data["deduct"] = total["deduct_sum"]
+                salary_data["due"] = (
+                    employee.salary
+                    - salary_data["deduction"]
+                    + salary_data["bonus"]
+                    - salary_data["paid"]
+                )
+                salary_data["status"] = 2 if salary_data["due"] > 0 else 1
+                salary_data["status_list"] = (
+                    ["error", "Unpaid"]
+                    if salary_data["due"] > 0
+                    else ["success", "Paid"]
+                )
+                salary_data["salary_data"] = SalarySerializer(
+                    employee.period_salaries, many=True
+                ).data
+            else:
+                salary_data["deduction"] = 0
+                salary_data["bonus"] = 0
+                salary_data["due"] = 0
+                salary_data["advance"] = 0
+                salary_data["paid"] = 0
+                salary_data["deduct"] = 0
+                salary_data["status"] = 2
+                salary_data["status_list"] = ["error", "Unpaid"]
+                salary_data["salary_data"] = []
+            employee_salaries.append(salary_data)
+        return employee_salaries
+
     def get(self, request):
         """
         Handle GET requests to filter and list employee salaries.
@@ -53,58 +126,10 @@ class FilterSalaryListView(APIView):
                 emp_wage_type=data["emp_type"]
             ).order_by("-created_at")
 
-            employee_salaries = []
-
             from_date = datetime.fromisoformat(data["from"][:-1])
             to_date = datetime.fromisoformat(data["to"][:-1])
 
-            for employee in employees:
-                employee_serializer = self.serializer_class(employee)
-                salary_data = dict(employee_serializer.data)
-                salary = Salary.objects.filter(
-                    employee=employee, dt_from__gte=from_date, dt_to__lte=to_date
-                )
-                if salary.exists():
-                    salary_data["deduction"] = salary.aggregate(Sum("deduct"))[
-                        "deduct__sum"
-                    ]
-                    salary_data["bonus"] = salary.aggregate(Sum("bonus"))["bonus__sum"]
-                    salary_data["advance"] = salary.aggregate(Sum("advance"))[
-                        "advance__sum"
-                    ]
-                    salary_data["paid"] = (
-                        salary.aggregate(Sum("salary"))["salary__sum"]
-                        + salary_data["advance"]
-                    )
-                    salary_data["deduct"] = salary.aggregate(Sum("deduct"))[
-                        "deduct__sum"
-                    ]
-                    salary_data["due"] = (
-                        employee.salary
-                        - salary_data["deduction"]
-                        + salary_data["bonus"]
-                        - salary_data["paid"]
-                    )
-                    salary_data["status"] = 2 if salary_data["due"] > 0 else 1
-                    salary_data["status_list"] = (
-                        ["error", "Unpaid"]
-                        if salary_data["due"] > 0
-                        else ["success", "Paid"]
-                    )
-                    salary_data["salary_data"] = SalarySerializer(
-                        salary, many=True
-                    ).data
-                else:
-                    salary_data["deduction"] = 0
-                    salary_data["bonus"] = 0
-                    salary_data["due"] = 0
-                    salary_data["advance"] = 0
-                    salary_data["paid"] = 0
-                    salary_data["deduct"] = 0
-                    salary_data["status"] = 2
-                    salary_data["status_list"] = ["error", "Unpaid"]
-                    salary_data["salary_data"] = []
-                employee_salaries.append(salary_data)
+            employee_salaries = self.salary_report(employees, from_date, to_date)
             return Response(employee_salaries)
         else:
             return Response("Tenant not valid", status=status.HTTP_404_NOT_FOUND)
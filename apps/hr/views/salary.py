@@ -1,4 +1,5 @@
-from django.db.models import Q, Sum
+from django.db import transaction
+from django.db.models import Q
 
 from rest_framework import generics, status
 from rest_framework.response import Response
@@ -11,9 +12,29 @@ from apps.hr.serializers.salary import SalarySerializer
 from apps.hr.models.employee import Employee
 
 from apps.share.views import get_tenant_user
-from apps.share.services.transaction_manager import TransactionManager
+from apps.share.services.daily_rollup import daily_rollup
 
-from datetime import datetime, date
+from datetime import datetime
+
+SALARY_TRAN_TYPE = 1011
+
+
+def post_salary_rollup(tenant, salary, delta):
+    """
+    Move the tenant's payroll total for the salary's creation day by ``delta``.
+    """
+    daily_rollup.add(
+        tenant,
+        salary.created_at.date(),
+        SALARY_TRAN_TYPE,
+        delta,
+        tran_group=103,
+        tran_head=6,
+    )
+
+
+def salary_amount(salary):
+    return salary.salary + salary.advance
 
 
 class SalaryView(generics.ListCreateAPIView):
@@ -72,34 +93,16 @@ class SalaryView(generics.ListCreateAPIView):
             tenant = user_tenant.tenant
             serializer = self.serializer_class(data=data)
             if serializer.is_valid():
-                salary = serializer.save(tenant=tenant)
-
-                # Start employee advance collection
-                employee = Employee.objects.get(id=data["employee"])
-                employee.advance_due = employee.advance_due - float(data["advance"])
-                employee.save()
-                # End employee advance collection
-
-                # Start transaction manager collection
-                salary_today = Salary.objects.filter(
-                    created_at__year=date.today().year,
-                    created_at__month=date.today().month,
-                    created_at__day=date.today().day,
-                )
-                paid_salary_today = salary_today.aggregate(Sum("salary"))["salary__sum"]
-                advance_salary_today = salary_today.aggregate(Sum("advance"))[
-                    "advance__sum"
-                ]
-                transaction_manager = TransactionManager(
-                    tenant=tenant, tran_number=salary.created_at
-                )
-                transaction_manager.transaction_create_or_update(
-                    tran_group=103,
-                    amount=paid_salary_today + advance_salary_today,
-                    tran_type=1011,
-                    tran_head=6,
-                )
-                # End transaction manager collection
+                with transaction.atomic():
+                    salary = serializer.save(tenant=tenant)
+
+                    # Start employee advance collection
+                    employee = Employee.objects.get(id=data["employee"])
+                    employee.advance_due = employee.advance_due - float(data["advance"])
+                    employee.save()
+                    # End employee advance collection
+
+                    post_salary_rollup(tenant, salary, salary_amount(salary))
 
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -121,6 +124,15 @@ class SalaryDetailView(generics.RetrieveUpdateDestroyAPIView):
         GroupPermission,
     )
 
+    def perform_update(self, serializer):
+        """
+        Save the salary and move the payroll rollup by the change in amount.
+        """
+        with transaction.atomic():
+            previous = salary_amount(serializer.instance)
+            salary = serializer.save()
+            post_salary_rollup(salary.tenant, salary, salary_amount(salary) - previous)
+
     def delete(self, request, *args, **kwargs):
         """
         Handle DELETE requests to delete an employee salary.
@@ -133,10 +145,13 @@ class SalaryDetailView(generics.RetrieveUpdateDestroyAPIView):
         """
         salary = self.get_object()
 
-        # Start employee advance collection
-        employee = Employee.objects.get(id=salary.employee_id)
-        employee.advance_due = employee.advance_due + salary.advance
-        employee.save()
-        # End employee advance collection
+        with transaction.atomic():
+            # Start employee advance collection
+            employee = Employee.objects.get(id=salary.employee_id)
+            employee.advance_due = employee.advance_due + salary.advance
+            employee.save()
+            # End employee advance collection
+
+            post_salary_rollup(salary.tenant, salary, -salary_amount(salary))
 
-        return super().delete(request, *args, **kwargs)
+            return super().delete(request, *args, **kwargs)
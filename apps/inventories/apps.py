@@ -5,3 +5,7 @@ class InventoriesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.inventories"
     APP_LABEL = "inventories"
+
+    def ready(self):
+        # Register category tree and master data cache invalidation handlers
+        from apps.inventories import signals  # noqa: F401
@@ -0,0 +1,45 @@
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django_tenants.utils import get_public_schema_name, schema_context
+
+from apps.clients.models import ClientModel
+from apps.share.services.low_stock import low_stock
+
+
+class Command(BaseCommand):
+    help = (
+        "Bring the low stock alerts of every tenant up to date. Meant to run "
+        "on a schedule, e.g. from cron; each run only rechecks the items "
+        "changed since the previous one."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tenant",
+            type=uuid.UUID,
+            help="Only check this tenant (tenant id). Defaults to all tenants.",
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Recheck every item, not only the ones changed since the last check.",
+        )
+
+    def handle(self, *args, **options):
+        # The public tenant has no inventory tables
+        tenants = ClientModel.objects.exclude(
+            schema_name=get_public_schema_name()
+        ).order_by("id")
+        if options["tenant"] is not None:
+            tenants = tenants.filter(id=options["tenant"])
+            if not tenants.exists():
+                raise CommandError(f"Tenant {options['tenant']} does not exist.")
+
+        for tenant in tenants.iterator():
+            with schema_context(tenant.schema_name):
+                low = low_stock.check(tenant, full=options["full"])
+            if low:
+                self.stdout.write(f"Tenant {tenant.id}: {low} low stock items.")
+
+        self.stdout.write(self.style.SUCCESS("Checked low stock."))
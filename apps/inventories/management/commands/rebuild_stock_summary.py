@@ -0,0 +1,40 @@
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+from django_tenants.utils import get_public_schema_name, schema_context
+
+from apps.clients.models import ClientModel
+from apps.share.services.stock_summary import stock_summary
+
+
+class Command(BaseCommand):
+    help = "Regenerate the stock summary rows from Stock."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--tenant",
+            type=uuid.UUID,
+            help="Only rebuild this tenant's rows (tenant id). Defaults to all tenants.",
+        )
+
+    def handle(self, *args, **options):
+        tenants = ClientModel.objects.exclude(schema_name=get_public_schema_name())
+        if options["tenant"] is not None:
+            try:
+                tenant = tenants.get(id=options["tenant"])
+            except ClientModel.DoesNotExist:
+                raise CommandError(f"Tenant {options['tenant']} does not exist.")
+
+            # Stock and the summary functions live in the tenant schema
+            with schema_context(tenant.schema_name):
+                stock_summary.rebuild(tenant)
+            self.stdout.write(
+                self.style.SUCCESS(f"Rebuilt the stock summary of tenant {tenant.id}.")
+            )
+            return
+
+        schema_names = tenants.order_by().values_list("schema_name", flat=True).distinct()
+        for schema_name in schema_names:
+            with schema_context(schema_name):
+                stock_summary.rebuild()
+        self.stdout.write(self.style.SUCCESS("Rebuilt the stock summary of all tenants."))
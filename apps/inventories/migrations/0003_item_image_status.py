@@ -0,0 +1,27 @@
+# Generated by Django 4.2.1 on 2026-10-18 13:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("inventories", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="item",
+            name="image_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("pending", "Pending"),
+                    ("processing", "Processing"),
+                    ("done", "Done"),
+                    ("failed", "Failed"),
+                ],
+                max_length=20,
+                null=True,
+            ),
+        ),
+    ]
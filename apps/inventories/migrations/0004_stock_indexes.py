@@ -0,0 +1,75 @@
+# Generated by Django 4.2.1 on 2026-10-18 15:05
+
+from django.db import migrations, models
+from django.db.models import Count, Min, Sum
+
+
+def merge_duplicate_stocks(apps, schema_editor):
+    # Rows sharing a stock identity were created by concurrent receipts; fold
+    # them into the oldest row so the unique constraint can be added
+    Stock = apps.get_model("inventories", "Stock")
+    # Transfer, invoice and challan lines cascade from their stock, so every
+    # reference is moved to the kept row before the extra rows go
+    references = [
+        relation.field
+        for relation in Stock._meta.related_objects
+        if relation.one_to_many
+    ]
+    key = ["tenant_id", "source_id", "item_id", "stock_identity"]
+    duplicates = (
+        Stock.objects.filter(stock_identity__isnull=False)
+        .values(*key)
+        .annotate(
+            rows=Count("id"),
+            keep_id=Min("id"),
+            total_quantity=Sum("quantity"),
+            total_non_pack_qty=Sum("non_pack_qty"),
+        )
+        .filter(rows__gt=1)
+    )
+    for group in duplicates:
+        rows = Stock.objects.filter(**{field: group[field] for field in key})
+        extra = rows.exclude(id=group["keep_id"])
+        for field in references:
+            field.model.objects.filter(**{f"{field.name}__in": extra}).update(
+                **{field.attname: group["keep_id"]}
+            )
+        extra.delete()
+        Stock.objects.filter(id=group["keep_id"]).update(
+            quantity=group["total_quantity"],
+            non_pack_qty=group["total_non_pack_qty"],
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("inventories", "0003_item_image_status"),
+        # Adds the invoice and challan line references to Stock
+        ("sales", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_stocks, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="stock",
+            constraint=models.UniqueConstraint(
+                fields=("tenant", "source", "item", "stock_identity"),
+                name="inv_stock_identity_uniq",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="stock",
+            index=models.Index(
+                condition=models.Q(("quantity__gt", 0)),
+                fields=["tenant", "item", "uom", "source", "exp_date"],
+                name="inv_stock_fefo_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="stock",
+            index=models.Index(
+                fields=["tenant", "source", "created_at"],
+                name="inv_stock_source_created_idx",
+            ),
+        ),
+    ]
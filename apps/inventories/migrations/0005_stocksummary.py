@@ -0,0 +1,294 @@
+# Generated by Django 4.2.1 on 2026-10-18 18:20
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.db.models.functions.comparison
+
+SUMMARY_COLUMNS = (
+    "created_at, edited_at, tenant_id, warehouse_id, item_id, base_uom_id, "
+    "on_hand_qty, pack_qty, non_pack_qty"
+)
+
+CREATE_STATEMENTS = [
+    # What one stock row contributes to its summary row, in base units
+    """
+CREATE FUNCTION inv_stock_summary_delta(
+    p_item_id bigint,
+    p_uom_id bigint,
+    p_quantity double precision,
+    p_per_pack_qty double precision,
+    p_non_pack_qty double precision
+)
+RETURNS TABLE (
+    base_uom_id bigint,
+    on_hand_qty double precision,
+    pack_qty double precision,
+    non_pack_qty double precision
+)
+LANGUAGE sql STABLE AS $$
+    SELECT
+        item.uom_id,
+        CASE WHEN unit.is_pack_unit AND p_per_pack_qty > 0
+            THEN p_quantity * p_per_pack_qty + p_non_pack_qty
+            ELSE p_quantity END,
+        CASE WHEN unit.is_pack_unit AND p_per_pack_qty > 0
+            THEN p_quantity ELSE 0 END,
+        CASE WHEN unit.is_pack_unit AND p_per_pack_qty > 0
+            THEN p_non_pack_qty ELSE p_quantity END
+    FROM "INV_Item" AS item
+    LEFT JOIN "INV_UOM" AS unit ON unit.id = p_uom_id
+    WHERE item.id = p_item_id
+$$
+""",
+    # Regenerate the summary rows of a tenant (or all tenants) and of some
+    # items (or all items) from INV_Stock
+    f"""
+CREATE FUNCTION inv_stock_summary_refresh(p_tenant_id uuid, p_item_ids bigint[])
+RETURNS void
+LANGUAGE sql AS $$
+    DELETE FROM "INV_Stock_Summary"
+    WHERE (p_tenant_id IS NULL OR tenant_id = p_tenant_id)
+        AND (p_item_ids IS NULL OR item_id = ANY (p_item_ids));
+
+    INSERT INTO "INV_Stock_Summary" ({SUMMARY_COLUMNS})
+    SELECT
+        now(), now(), stock.tenant_id, stock.source_id, stock.item_id,
+        delta.base_uom_id, SUM(delta.on_hand_qty), SUM(delta.pack_qty),
+        SUM(delta.non_pack_qty)
+    FROM "INV_Stock" AS stock
+    CROSS JOIN LATERAL inv_stock_summary_delta(
+        stock.item_id, stock.uom_id, stock.quantity, stock.per_pack_qty,
+        stock.non_pack_qty
+    ) AS delta
+    WHERE stock.tenant_id IS NOT NULL
+        AND (p_tenant_id IS NULL OR stock.tenant_id = p_tenant_id)
+        AND (p_item_ids IS NULL OR stock.item_id = ANY (p_item_ids))
+    GROUP BY stock.tenant_id, stock.source_id, stock.item_id, delta.base_uom_id;
+$$
+""",
+    # Move the summary by the old row's contribution out and the new row's
+    # in. Removals only update existing rows, so a summary row deleted by a
+    # cascade is not brought back by the cascade deleting its stocks
+    f"""
+CREATE FUNCTION inv_stock_summary_on_stock()
+RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.tenant_id IS NOT NULL THEN
+        UPDATE "INV_Stock_Summary" AS summary
+        SET
+            on_hand_qty = summary.on_hand_qty - delta.on_hand_qty,
+            pack_qty = summary.pack_qty - delta.pack_qty,
+            non_pack_qty = summary.non_pack_qty - delta.non_pack_qty,
+            edited_at = now()
+        FROM inv_stock_summary_delta(
+            OLD.item_id, OLD.uom_id, OLD.quantity, OLD.per_pack_qty,
+            OLD.non_pack_qty
+        ) AS delta
+        WHERE summary.tenant_id = OLD.tenant_id
+            AND summary.warehouse_id = OLD.source_id
+            AND summary.item_id = OLD.item_id
+            AND COALESCE(summary.base_uom_id, 0) = COALESCE(delta.base_uom_id, 0);
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.tenant_id IS NOT NULL THEN
+        INSERT INTO "INV_Stock_Summary" ({SUMMARY_COLUMNS})
+        SELECT
+            now(), now(), NEW.tenant_id, NEW.source_id, NEW.item_id,
+            delta.base_uom_id, delta.on_hand_qty, delta.pack_qty,
+            delta.non_pack_qty
+        FROM inv_stock_summary_delta(
+            NEW.item_id, NEW.uom_id, NEW.quantity, NEW.per_pack_qty,
+            NEW.non_pack_qty
+        ) AS delta
+        ON CONFLICT (tenant_id, warehouse_id, item_id, COALESCE(base_uom_id, 0))
+        DO UPDATE SET
+            on_hand_qty = "INV_Stock_Summary".on_hand_qty + EXCLUDED.on_hand_qty,
+            pack_qty = "INV_Stock_Summary".pack_qty + EXCLUDED.pack_qty,
+            non_pack_qty = "INV_Stock_Summary".non_pack_qty + EXCLUDED.non_pack_qty,
+            edited_at = EXCLUDED.edited_at;
+    END IF;
+    RETURN NULL;
+END;
+$$
+""",
+    # An item's base UOM is part of the summary key
+    """
+CREATE FUNCTION inv_stock_summary_on_item()
+RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM inv_stock_summary_refresh(NEW.tenant_id, ARRAY[NEW.id]);
+    RETURN NULL;
+END;
+$$
+""",
+    # Whether a unit is a pack unit decides how its lots convert
+    """
+CREATE FUNCTION inv_stock_summary_on_uom()
+RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM inv_stock_summary_refresh(
+        NEW.tenant_id,
+        ARRAY(SELECT DISTINCT item_id FROM "INV_Stock" WHERE uom_id = NEW.id)
+    );
+    RETURN NULL;
+END;
+$$
+""",
+    """
+CREATE TRIGGER inv_stock_summary_stock
+AFTER INSERT OR DELETE ON "INV_Stock"
+FOR EACH ROW EXECUTE FUNCTION inv_stock_summary_on_stock()
+""",
+    # Saves rewrite every column; only changed quantities or keys count
+    """
+CREATE TRIGGER inv_stock_summary_stock_update
+AFTER UPDATE ON "INV_Stock"
+FOR EACH ROW WHEN (
+    (OLD.tenant_id, OLD.source_id, OLD.item_id, OLD.uom_id, OLD.quantity,
+        OLD.per_pack_qty, OLD.non_pack_qty)
+    IS DISTINCT FROM
+    (NEW.tenant_id, NEW.source_id, NEW.item_id, NEW.uom_id, NEW.quantity,
+        NEW.per_pack_qty, NEW.non_pack_qty)
+)
+EXECUTE FUNCTION inv_stock_summary_on_stock()
+""",
+    """
+CREATE TRIGGER inv_stock_summary_item
+AFTER UPDATE OF uom_id ON "INV_Item"
+FOR EACH ROW WHEN (OLD.uom_id IS DISTINCT FROM NEW.uom_id)
+EXECUTE FUNCTION inv_stock_summary_on_item()
+""",
+    """
+CREATE TRIGGER inv_stock_summary_uom
+AFTER UPDATE OF is_pack_unit ON "INV_UOM"
+FOR EACH ROW WHEN (OLD.is_pack_unit IS DISTINCT FROM NEW.is_pack_unit)
+EXECUTE FUNCTION inv_stock_summary_on_uom()
+""",
+    # Summarize the existing stock
+    "SELECT inv_stock_summary_refresh(NULL, NULL)",
+]
+
+DROP_STATEMENTS = [
+    'DROP TRIGGER IF EXISTS inv_stock_summary_uom ON "INV_UOM"',
+    'DROP TRIGGER IF EXISTS inv_stock_summary_item ON "INV_Item"',
+    'DROP TRIGGER IF EXISTS inv_stock_summary_stock_update ON "INV_Stock"',
+    'DROP TRIGGER IF EXISTS inv_stock_summary_stock ON "INV_Stock"',
+    "DROP FUNCTION IF EXISTS inv_stock_summary_on_uom()",
+    "DROP FUNCTION IF EXISTS inv_stock_summary_on_item()",
+    "DROP FUNCTION IF EXISTS inv_stock_summary_on_stock()",
+    "DROP FUNCTION IF EXISTS inv_stock_summary_refresh(uuid, bigint[])",
+    "DROP FUNCTION IF EXISTS inv_stock_summary_delta("
+    "bigint, bigint, double precision, double precision, double precision)",
+]
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clients", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("inventories", "0004_stock_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StockSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("edited_at", models.DateTimeField(auto_now=True)),
+                ("on_hand_qty", models.FloatField(default=0)),
+                ("pack_qty", models.FloatField(default=0)),
+                ("non_pack_qty", models.FloatField(default=0)),
+                (
+                    "base_uom",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="stock_summaries",
+                        to="inventories.uom",
+                    ),
+                ),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="%(class)s_created_models",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "item",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stock_summaries",
+                        to="inventories.item",
+                    ),
+                ),
+                (
+                    "tenant",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s_base_models",
+                        to="clients.clientmodel",
+                    ),
+                ),
+                (
+                    "updated_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="%(class)s_updated_models",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "warehouse",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stock_summaries",
+                        to="inventories.warehouse",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "INV_Stock_Summary",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="stocksummary",
+            constraint=models.UniqueConstraint(
+                models.F("tenant"),
+                models.F("warehouse"),
+                models.F("item"),
+                django.db.models.functions.comparison.Coalesce(
+                    "base_uom", 0, output_field=models.BigIntegerField()
+                ),
+                name="inv_stock_summary_uniq",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="stocksummary",
+            index=models.Index(
+                fields=["tenant", "item"], name="inv_stock_summary_item_idx"
+            ),
+        ),
+        migrations.RunSQL(CREATE_STATEMENTS, DROP_STATEMENTS),
+    ]
@@ -0,0 +1,149 @@
+# Generated by Django 4.2.1 on 2026-10-18 19:40
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clients", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("inventories", "0005_stocksummary"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LowStockAlert",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("edited_at", models.DateTimeField(auto_now=True)),
+                ("on_hand_qty", models.FloatField(default=0)),
+                ("threshold_qty", models.FloatField(default=0)),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="%(class)s_created_models",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "item",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="low_stock_alerts",
+                        to="inventories.item",
+                    ),
+                ),
+                (
+                    "tenant",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s_base_models",
+                        to="clients.clientmodel",
+                    ),
+                ),
+                (
+                    "updated_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="%(class)s_updated_models",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "INV_Low_Stock_Alert",
+            },
+        ),
+        migrations.CreateModel(
+            name="LowStockCheck",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("edited_at", models.DateTimeField(auto_now=True)),
+                ("checked_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="%(class)s_created_models",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "tenant",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="%(class)s_base_models",
+                        to="clients.clientmodel",
+                    ),
+                ),
+                (
+                    "updated_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="%(class)s_updated_models",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "INV_Low_Stock_Check",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="lowstockalert",
+            constraint=models.UniqueConstraint(
+                fields=("tenant", "item"), name="inv_low_stock_alert_uniq"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="lowstockcheck",
+            constraint=models.UniqueConstraint(
+                fields=("tenant",), name="inv_low_stock_check_uniq"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="item",
+            index=models.Index(
+                fields=["tenant", "edited_at"], name="inv_item_edited_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="stocksummary",
+            index=models.Index(
+                fields=["tenant", "edited_at"], name="inv_stock_summary_edited_idx"
+            ),
+        ),
+    ]
@@ -9,3 +9,5 @@ from .transfer import Transfer, TransferItem
 from .adjust import Adjust
 from .item_attribute import ItemAttribute, ItemAttributeValue
 from .stock_price import StockPrice
+from .stock_summary import StockSummary
+from .low_stock import LowStockAlert, LowStockCheck
@@ -8,7 +8,13 @@ from .category import Category
 from .uom import UOM
 
 from apps.share.services.image_delete import storage_image_delete
-from apps.share.services.image_process import image_processing
+from apps.share.services.image_process import rendition_path
+from apps.share.services.image_worker import (
+    IMAGE_STATUS_CHOICES,
+    IMAGE_STATUS_DONE,
+    IMAGE_STATUS_PENDING,
+    image_processing_pool,
+)
 
 
 class Item(BaseModel):
@@ -16,6 +22,9 @@ class Item(BaseModel):
     item_title = models.CharField(max_length=250)
     manufac = models.CharField(max_length=250, blank=True, null=True)
     item_image = models.ImageField(blank=True, null=True)
+    image_status = models.CharField(
+        max_length=20, blank=True, null=True, choices=IMAGE_STATUS_CHOICES
+    )
     sku = models.TextField(blank=True, null=True)
 
     threshold_qty = models.FloatField(default=0)
@@ -50,19 +59,34 @@ class Item(BaseModel):
 
     class Meta:
         db_table = "INV_Item"
+        indexes = [
+            # Items changed since the last low stock check
+            models.Index(fields=["tenant", "edited_at"], name="inv_item_edited_idx"),
+        ]
 
     def delete(self, *args, **kwargs):
         # Delete the file associated with the instance
         if self.item_image:
             storage_image_delete(self.item_image.name)
+            if self.image_status == IMAGE_STATUS_DONE:
+                storage_image_delete(
+                    rendition_path(self.item_image.name, "thumbnail")
+                )
         super(Item, self).delete(*args, **kwargs)
 
     def save(self, *args, **kwargs):
+        # Only a newly uploaded file needs processing, not every later save
+        image_uploaded = bool(self.item_image) and not self.item_image._committed
+        if image_uploaded:
+            self.image_status = IMAGE_STATUS_PENDING
+
         super(Item, self).save(*args, **kwargs)
 
-        if self.item_image:
-            # Call the image_processing function and update item_image
-            image_processing(self.item_image.name)
+        if image_uploaded:
+            # Recompress in the background; image_status tracks the progress
+            image_processing_pool.submit(
+                Item, self.pk, self.item_image.name, self.tenant
+            )
 
 
 class ItemLineAtribute(BaseModel):
@@ -0,0 +1,45 @@
+from django.db import models
+
+from apps.share.models.base_model import BaseModel
+from apps.inventories.models.item import Item
+
+
+class LowStockAlert(BaseModel):
+    """
+    An item whose stock on hand is at or below its ``threshold_qty``.
+
+    Rows are written by ``apps.share.services.low_stock``: an item gets a
+    row when a check finds it low and loses it when a check finds it
+    restocked. ``on_hand_qty`` and ``threshold_qty`` are as of that check.
+    """
+
+    item = models.ForeignKey(
+        Item, on_delete=models.CASCADE, related_name="low_stock_alerts"
+    )
+    on_hand_qty = models.FloatField(default=0)
+    threshold_qty = models.FloatField(default=0)
+
+    class Meta:
+        db_table = "INV_Low_Stock_Alert"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tenant", "item"], name="inv_low_stock_alert_uniq"
+            ),
+        ]
+
+
+class LowStockCheck(BaseModel):
+    """
+    When a tenant's low stock alerts were last brought up to date; the next
+    check only revisits items and stock summaries changed since then.
+    """
+
+    checked_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        db_table = "INV_Low_Stock_Check"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tenant"], name="inv_low_stock_check_uniq"
+            ),
+        ]
@@ -33,6 +33,25 @@ class Stock(BaseModel):
 
     class Meta:
         db_table = 'INV_Stock'
+        constraints = [
+            # One row per lot of an item in a warehouse; stock ledger lookups
+            models.UniqueConstraint(
+                fields=["tenant", "source", "item", "stock_identity"],
+                name="inv_stock_identity_uniq",
+            ),
+        ]
+        indexes = [
+            # First-expiry-first-out allocation only ever reads lots in stock
+            models.Index(
+                fields=["tenant", "item", "uom", "source", "exp_date"],
+                condition=models.Q(quantity__gt=0),
+                name="inv_stock_fefo_idx",
+            ),
+            models.Index(
+                fields=["tenant", "source", "created_at"],
+                name="inv_stock_source_created_idx",
+            ),
+        ]
 
     def save(self, *args, **kwargs):
         self.stock_identity = generate_stock_identity(
@@ -0,0 +1,63 @@
+from django.db import models
+from django.db.models.functions import Coalesce
+
+from apps.share.models.base_model import BaseModel
+from apps.inventories.models.item import Item
+from apps.inventories.models.uom import UOM
+from apps.inventories.models.warehouse import Warehouse
+
+
+class StockSummary(BaseModel):
+    """
+    Stock on hand of an item in a warehouse, summed over all its lots.
+
+    Quantities are in the item's base UOM: a lot in a pack unit counts
+    ``quantity * per_pack_qty + non_pack_qty`` base units, any other lot its
+    ``quantity``. ``pack_qty`` sums the packs of pack unit lots and
+    ``non_pack_qty`` the loose base units of all lots.
+
+    Rows are maintained by database triggers on ``INV_Stock`` (see migration
+    ``0005_stocksummary``), in the transaction of every stock change however
+    it is written, and regenerated from Stock by ``manage.py
+    rebuild_stock_summary``. They are never written from Python.
+    """
+
+    warehouse = models.ForeignKey(
+        Warehouse, on_delete=models.CASCADE, related_name="stock_summaries"
+    )
+    item = models.ForeignKey(
+        Item, on_delete=models.CASCADE, related_name="stock_summaries"
+    )
+    base_uom = models.ForeignKey(
+        UOM,
+        blank=True,
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name="stock_summaries",
+    )
+    on_hand_qty = models.FloatField(default=0)
+    pack_qty = models.FloatField(default=0)
+    non_pack_qty = models.FloatField(default=0)
+
+    class Meta:
+        db_table = "INV_Stock_Summary"
+        constraints = [
+            # The triggers upsert on this key; items without a UOM share key 0
+            models.UniqueConstraint(
+                "tenant",
+                "warehouse",
+                "item",
+                Coalesce("base_uom", 0, output_field=models.BigIntegerField()),
+                name="inv_stock_summary_uniq",
+            ),
+        ]
+        indexes = [
+            # Item by warehouse pivots
+            models.Index(
+                fields=["tenant", "item"], name="inv_stock_summary_item_idx"
+            ),
+            # Summaries changed since the last low stock check
+            models.Index(
+                fields=["tenant", "edited_at"], name="inv_stock_summary_edited_idx"
+            ),
+        ]
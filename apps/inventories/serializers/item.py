@@ -1,6 +1,11 @@
 from rest_framework import serializers
 
+from django.core.files.storage import default_storage
+from django.db.models import Prefetch
+
 from apps.inventories.models.item import Item, ItemLineAtribute
+from apps.share.services.image_process import rendition_path
+from apps.share.services.image_worker import IMAGE_STATUS_DONE
 
 import json
 
@@ -23,6 +28,7 @@ class ItemSerializer(serializers.ModelSerializer):
             "manufac",
             "item_type_code",
             "item_image",
+            "image_status",
             "sku",
             "threshold_qty",
             "category",
@@ -30,10 +36,28 @@ class ItemSerializer(serializers.ModelSerializer):
             "brand",
             "attributes",
         )
+        read_only_fields = ("image_status",)
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Load the related rows every item representation reads, so listing any
+        number of items takes a constant number of queries.
+        """
+        return queryset.select_related("category", "uom", "brand").prefetch_related(
+            Prefetch(
+                "inv_item_attributes",
+                queryset=ItemLineAtribute.objects.order_by("id"),
+                to_attr="prefetched_attributes",
+            )
+        )
 
     def get_attributes(self, instance):
-        item_attributes = ItemLineAtribute.objects.filter(
-            item_id=instance.id).first()
+        if hasattr(instance, "prefetched_attributes"):
+            item_attributes = next(iter(instance.prefetched_attributes), None)
+        else:
+            item_attributes = ItemLineAtribute.objects.filter(
+                item_id=instance.id).first()
 
         if item_attributes:
             return item_attributes.attributes
@@ -49,4 +73,11 @@ class ItemSerializer(serializers.ModelSerializer):
 
         representation['uom_name'] = instance.uom.uom_name if instance.uom else "No Uom Name"
 
+        # Processed images also have a small rendition for list views
+        representation['item_thumbnail'] = (
+            default_storage.url(rendition_path(instance.item_image.name, "thumbnail"))
+            if instance.item_image and instance.image_status == IMAGE_STATUS_DONE
+            else None
+        )
+
         return representation
@@ -13,12 +13,13 @@ class ItemAttributeSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         representation = super().to_representation(instance)
-        try:
-            item_attribute_values = ItemAttributeValue.objects.get(
-                attribute_id=instance.id)
-            representation['attribute_values'] = item_attribute_values.attribute_value
-        except:
-            representation['attribute_values'] = None
+        # Prefetched by the master data cache; an attribute has one value row
+        item_attribute_values = list(instance.item_attribute.all())
+        representation['attribute_values'] = (
+            item_attribute_values[0].attribute_value
+            if len(item_attribute_values) == 1
+            else None
+        )
         representation['value'] = ""
 
         return representation
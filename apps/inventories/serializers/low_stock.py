@@ -0,0 +1,26 @@
+from rest_framework import serializers
+
+from apps.inventories.models.low_stock import LowStockAlert
+
+
+class LowStockAlertSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = LowStockAlert
+        fields = ("id", "item", "on_hand_qty", "threshold_qty", "edited_at")
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Load the item and base unit every alert names with the alerts.
+        """
+        return queryset.select_related("item", "item__uom")
+
+    def to_representation(self, instance):
+        representation = super().to_representation(instance)
+
+        representation['item_title'] = instance.item.item_title
+        representation['sku'] = instance.item.sku
+        representation['base_unit_name'] = instance.item.uom.uom_name if instance.item.uom else "No Base Unit"
+
+        return representation
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from apps.inventories.models.item import Item
 from apps.inventories.models.stock import Stock
 
 
@@ -59,3 +60,82 @@ class StockSerializer(serializers.ModelSerializer):
     #     representation['price'] = stock_price.unit_price if stock_price else None
 
     #     return representation
+
+
+class StockRowSerializer(serializers.BaseSerializer):
+    """
+    Read only StockSerializer for stock listings.
+
+    The listing is projected with ``values()`` into flat rows, joining the
+    item, its base UOM, the stock UOM and the price in the same query, and
+    each row is mapped to the representation StockSerializer gives a Stock
+    instance, without building model instances.
+    """
+
+    stock_fields = (
+        "id",
+        "stock_identity",
+        "per_pack_qty",
+        "non_pack_qty",
+        "quantity",
+        "source",
+        "item",
+        "item_price",
+        "uom",
+        "lot_number",
+        "exp_date",
+        "edited_at",
+    )
+    related_fields = (
+        "item__item_title",
+        "item__item_image",
+        "item__sku",
+        "item__description",
+        "item__uom",
+        "item__uom__uom_name",
+        "item__uom__is_pack_unit",
+        "uom__uom_name",
+        "uom__is_pack_unit",
+        "item_price__sales_price",
+    )
+    date_field = serializers.DateField()
+    datetime_field = serializers.DateTimeField()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Project the stocks into the flat rows this serializer represents,
+        with the position keyset pagination reads.
+        """
+        return queryset.values(*cls.stock_fields, *cls.related_fields, "created_at")
+
+    def to_representation(self, row):
+        representation = {field: row[field] for field in self.stock_fields}
+        if row["exp_date"]:
+            representation["exp_date"] = self.date_field.to_representation(row["exp_date"])
+        if row["edited_at"]:
+            representation["edited_at"] = self.datetime_field.to_representation(row["edited_at"])
+
+        representation['item_title'] = row["item__item_title"]
+        representation['item_image'] = self.image_url(row["item__item_image"])
+        representation['sku'] = row["item__sku"]
+        representation['item_description'] = row["item__description"]
+
+        has_base_unit = row["item__uom"] is not None
+        has_unit = row["uom"] is not None
+        representation['base_unit_name'] = row["item__uom__uom_name"] if has_base_unit else "No Base Unit"
+        representation['uom_name'] = row["uom__uom_name"] if has_unit else "No Stock unit"
+        representation['is_pack'] = row["uom__is_pack_unit"] if has_unit else False
+        representation['base_unit_id'] = row["item__uom"]
+        representation['base_unit_is_pack'] = row["item__uom__is_pack_unit"] if has_base_unit else False
+
+        representation['price'] = row["item_price__sales_price"] if row["item_price"] is not None else None
+
+        return representation
+
+    def image_url(self, name):
+        if not name:
+            return None
+        url = Item._meta.get_field("item_image").storage.url(name)
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request else url
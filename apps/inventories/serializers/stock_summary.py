@@ -0,0 +1,78 @@
+from rest_framework import serializers
+
+from apps.inventories.models.item import Item
+from apps.inventories.models.stock_summary import StockSummary
+
+
+class StockSummarySerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = StockSummary
+        fields = (
+            "id",
+            "warehouse",
+            "item",
+            "base_uom",
+            "on_hand_qty",
+            "pack_qty",
+            "non_pack_qty",
+            "edited_at",
+        )
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Load the warehouse, item and unit every row names with the rows.
+        """
+        return queryset.select_related("warehouse", "item", "base_uom")
+
+    def to_representation(self, instance):
+        representation = super().to_representation(instance)
+
+        representation['warehouse_name'] = instance.warehouse.warehouse_name
+        representation['item_title'] = instance.item.item_title
+        representation['sku'] = instance.item.sku
+        representation['base_unit_name'] = instance.base_uom.uom_name if instance.base_uom else "No Base Unit"
+
+        return representation
+
+
+class StockSummaryPivotSerializer(serializers.ModelSerializer):
+    """
+    An item with its stock on hand in each warehouse.
+
+    The summary rows are handed in by the view as ``context["summaries"]``,
+    a dict of item id to rows, so a page of items costs one query for them.
+    """
+
+    warehouses = serializers.SerializerMethodField()
+    total_qty = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Item
+        fields = ("id", "item_title", "sku", "uom", "warehouses", "total_qty")
+
+    def summaries(self, instance):
+        return self.context.get("summaries", {}).get(instance.id, [])
+
+    def get_warehouses(self, instance):
+        return [
+            {
+                "warehouse": summary.warehouse_id,
+                "warehouse_name": summary.warehouse.warehouse_name,
+                "on_hand_qty": summary.on_hand_qty,
+                "pack_qty": summary.pack_qty,
+                "non_pack_qty": summary.non_pack_qty,
+            }
+            for summary in self.summaries(instance)
+        ]
+
+    def get_total_qty(self, instance):
+        return sum(summary.on_hand_qty for summary in self.summaries(instance))
+
+    def to_representation(self, instance):
+        representation = super().to_representation(instance)
+
+        representation['base_unit_name'] = instance.uom.uom_name if instance.uom else "No Base Unit"
+
+        return representation
@@ -1,7 +1,38 @@
+from django.db import models
+from django.db.models import Prefetch
 from rest_framework import serializers
 
 from apps.inventories.models.transfer import Transfer, TransferItem
 from apps.inventories.models.item import ItemLineAtribute
+from apps.inventories.models.stock import Stock
+
+
+def resolve_destination_stocks(transfers):
+    """
+    Return the destination stocks of every line of ``transfers``, keyed by
+    (to_stk_id, stock_identity, item_id), fetched with one query.
+    """
+    keys = {
+        (transfer.to_stk_id, item.des_stock_identity, item.stock.item_id)
+        for transfer in transfers
+        for item in transfer.transfers.all()
+    }
+    if not keys:
+        return {}
+
+    warehouses, identities, item_ids = (set(values) for values in zip(*keys))
+    stocks = Stock.objects.filter(
+        tenant_id__in={transfer.tenant_id for transfer in transfers},
+        source_id__in=warehouses,
+        stock_identity__in=identities,
+        item_id__in=item_ids,
+    )
+    destination_stocks = {}
+    for stock in stocks:
+        key = (stock.source_id, stock.stock_identity, stock.item_id)
+        if key in keys:
+            destination_stocks.setdefault(key, stock)
+    return destination_stocks
 
 
 class TransferItemSerializer(serializers.ModelSerializer):
@@ -24,7 +55,11 @@ class TransferItemSerializer(serializers.ModelSerializer):
         Returns:
             dict: A dictionary representing the attributes, or None if no attributes are found.
         """
-        item_attributes = ItemLineAtribute.objects.filter(item_id=instance.id).first()
+        item = instance.stock.item
+        if hasattr(item, "prefetched_attributes"):
+            item_attributes = next(iter(item.prefetched_attributes), None)
+        else:
+            item_attributes = ItemLineAtribute.objects.filter(item_id=item.id).first()
 
         if item_attributes:
             return item_attributes.attributes
@@ -47,11 +82,16 @@ class TransferItemSerializer(serializers.ModelSerializer):
         representation = super().to_representation(instance)
         request = self.context.get("request")
 
-        # Fetch destination stock
-        instance.des_stock = instance.tenant.stock_base_models.get(
-            source=instance.transfer.to_stk,
-            stock_identity=instance.des_stock_identity,
-            item_id=instance.stock.item.id,
+        # Destination stocks are resolved for the whole response at once
+        destination_stocks = self.context.get("destination_stocks")
+        if destination_stocks is None:
+            destination_stocks = resolve_destination_stocks([instance.transfer])
+        instance.des_stock = destination_stocks.get(
+            (
+                instance.transfer.to_stk_id,
+                instance.des_stock_identity,
+                instance.stock.item_id,
+            )
         )
 
         # Add item-related information to the representation
@@ -120,6 +160,13 @@ class TransferItemSerializer(serializers.ModelSerializer):
         return representation
 
 
+class TransferListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        data = list(data.all() if isinstance(data, models.Manager) else data)
+        self.context.setdefault("destination_stocks", resolve_destination_stocks(data))
+        return super().to_representation(data)
+
+
 class TransferSerializer(serializers.ModelSerializer):
     transfers = TransferItemSerializer(many=True, read_only=True)
     purpose_cd_label = serializers.CharField(
@@ -139,6 +186,28 @@ class TransferSerializer(serializers.ModelSerializer):
             "transfers",
             "edited_at",
         )
+        list_serializer_class = TransferListSerializer
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Load every row the transfer representation reads. Together with the
+        destination stocks resolved by TransferListSerializer, any number of
+        transfers and lines is serialized with a constant number of queries.
+        """
+        return queryset.select_related("from_stk", "to_stk").prefetch_related(
+            Prefetch(
+                "transfers",
+                queryset=TransferItem.objects.select_related(
+                    "stock__item__uom", "stock__uom", "stock__item_price", "trans_unit"
+                ),
+            ),
+            Prefetch(
+                "transfers__stock__item__inv_item_attributes",
+                queryset=ItemLineAtribute.objects.order_by("id"),
+                to_attr="prefetched_attributes",
+            ),
+        )
 
     def to_representation(self, instance):
         """
@@ -153,6 +222,8 @@ class TransferSerializer(serializers.ModelSerializer):
         Returns:
             dict: The customized representation of the Transfer instance.
         """
+        if "destination_stocks" not in self.context and self.parent is None:
+            self.context["destination_stocks"] = resolve_destination_stocks([instance])
         representation = super().to_representation(instance)
 
         # Add warehouse names to the representation
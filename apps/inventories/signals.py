@@ -0,0 +1,45 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.inventories.models.brand import Brand
+from apps.inventories.models.category import Category
+from apps.inventories.models.item_attribute import ItemAttribute, ItemAttributeValue
+from apps.inventories.models.uom import UOM
+from apps.inventories.models.warehouse import Warehouse
+from apps.share.services.category_tree import invalidate_category_tree
+from apps.share.services.master_data import invalidate_master_data
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def category_changed(sender, instance, **kwargs):
+    """
+    Invalidate the cached category tree of the category's tenant.
+    """
+    invalidate_category_tree(instance.tenant_id)
+
+
+@receiver(post_save, sender=UOM)
+@receiver(post_delete, sender=UOM)
+@receiver(post_save, sender=Warehouse)
+@receiver(post_delete, sender=Warehouse)
+@receiver(post_save, sender=Brand)
+@receiver(post_delete, sender=Brand)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=ItemAttribute)
+@receiver(post_delete, sender=ItemAttribute)
+def master_data_changed(sender, instance, **kwargs):
+    """
+    Invalidate the cached rows of the model for the instance's tenant.
+    """
+    invalidate_master_data(sender, instance.tenant_id)
+
+
+@receiver(post_save, sender=ItemAttributeValue)
+@receiver(post_delete, sender=ItemAttributeValue)
+def item_attribute_value_changed(sender, instance, **kwargs):
+    """
+    Invalidate the cached item attributes, which carry their values.
+    """
+    invalidate_master_data(ItemAttribute, instance.tenant_id)
@@ -0,0 +1,51 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+
+from apps.share.test.base import BaseTestCase
+
+
+class BrandTenantCheckTestCase(BaseTestCase):
+    """
+    Every CRUD request resolves the tenant user at most once.
+    """
+
+    def tenant_user_queries(self, context):
+        return [
+            query["sql"]
+            for query in context.captured_queries
+            if 'FROM "TenantUser"' in query["sql"]
+        ]
+
+    def assertTenantCheckedOnce(self, method, url, data=None):
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(url, data, format="json")
+
+        self.assertLess(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertLessEqual(len(self.tenant_user_queries(context)), 1)
+
+    def test_list_brand(self):
+        for i in range(1, 6):
+            self.get_or_create_brand(i)
+
+        self.assertTenantCheckedOnce("get", "/inventory/brand/")
+
+    def test_create_brand(self):
+        self.assertTenantCheckedOnce(
+            "post", "/inventory/brand/", {"brand_name": "brand", "brand_code": "BR"}
+        )
+
+    def test_update_brand(self):
+        brand = self.get_or_create_brand(1)
+
+        self.assertTenantCheckedOnce(
+            "put",
+            f"/inventory/brand/{brand.id}/",
+            {"brand_name": "updated", "brand_code": "UP"},
+        )
+
+    def test_delete_brand(self):
+        brand = self.get_or_create_brand(1)
+
+        self.assertTenantCheckedOnce("delete", f"/inventory/brand/{brand.id}/")
@@ -1,7 +1,13 @@
+import json
+
+from django.core.cache import cache
 from django.urls import reverse
 
 from rest_framework import status
 
+from apps.inventories.models.category import Category
+from apps.inventories.serializers.category import CategorySerializer
+from apps.share.services.category_tree import category_tree
 from apps.share.test.base import BaseTestCase
 
 
@@ -54,3 +60,60 @@ class CategoryTestCase(BaseTestCase):
         response = self.client.delete(url)
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+
+class CategoryTreeTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def create_category(self, name, parent=None):
+        return Category.objects.create(
+            tenant=self.tenant, category_name=name, category_code=name, cat_parent=parent
+        )
+
+    def test_tree_matches_nested_serializer(self):
+        root = self.create_category("root")
+        busy = self.create_category("busy", root)
+        self.create_category("leaf", root)
+        self.create_category("deep", busy)
+        self.create_category("root_2")
+
+        expected = CategorySerializer(
+            Category.objects.filter(cat_parent=None).order_by("created_at"), many=True
+        ).data
+
+        self.assertEqual(
+            json.loads(json.dumps(category_tree.tree(self.tenant))),
+            json.loads(json.dumps(expected)),
+        )
+
+    def test_tree_is_cached_and_invalidated_on_write(self):
+        root = self.create_category("root")
+        parent = root
+        for depth in range(50):
+            parent = self.create_category(f"node_{depth}", parent)
+        category_tree.tree(self.tenant)
+
+        with self.assertNumQueries(0):
+            category_tree.tree(self.tenant)
+
+        self.create_category("late", root)
+        with self.assertNumQueries(1):
+            tree = category_tree.tree(self.tenant)
+        self.assertEqual(len(tree[0]["inv_categories"]), 2)
+
+    def test_tree_cached_before_commit_is_dropped_on_commit(self):
+        root = self.create_category("root")
+        category_tree.tree(self.tenant)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_category("late", root)
+            # A reader outside the transaction would cache the old tree here
+            cache.set(
+                f"category_tree:{self.tenant.id}:"
+                f"{cache.get(f'category_tree:{self.tenant.id}:version')}",
+                [],
+            )
+
+        self.assertEqual(len(category_tree.tree(self.tenant)[0]["inv_categories"]), 1)
@@ -1,7 +1,19 @@
+import json
+import tempfile
+from unittest import mock
+
+from django.core.files.storage import default_storage
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.test import override_settings
 from django.urls import reverse
 
 from rest_framework import status
 
+from apps.inventories.models.item import Item, ItemLineAtribute
+from apps.inventories.models.stock_price import StockPrice
+from apps.share.services.generate_sku import GenerateSku
+from apps.share.services.image_worker import ImageProcessingPool
 from apps.share.test.base import BaseTestCase
 
 
@@ -63,3 +75,164 @@ class ItemTestCase(BaseTestCase):
         response = self.client.delete(url)
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+
+class ItemListQueryCountTestCase(BaseTestCase):
+    def create_items(self, count):
+        items = Item.objects.bulk_create(
+            Item(
+                tenant=self.tenant,
+                item_title=f"item_{n}",
+                category=self.get_or_create_category(1),
+                uom=self.get_or_create_uom(1),
+                brand=self.get_or_create_brand(1),
+            )
+            for n in range(count)
+        )
+        ItemLineAtribute.objects.bulk_create(
+            ItemLineAtribute(tenant=self.tenant, item=item, attributes={"size": "L"})
+            for item in items
+        )
+
+    def list_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("item"), {"page_size": 100})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(queries)
+
+    def test_list_query_count_does_not_grow_with_items(self):
+        self.create_items(1)
+        _, single = self.list_queries()
+
+        self.create_items(60)
+        response, many = self.list_queries()
+
+        self.assertEqual(len(response.data["results"]), 61)
+        self.assertEqual(many, single)
+        self.assertEqual(response.data["results"][0]["attributes"], {"size": "L"})
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class ItemImageProcessingTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        # Inline pool over the local file system stand-in for S3
+        patcher = mock.patch(
+            "apps.inventories.models.item.image_processing_pool",
+            ImageProcessingPool(max_workers=0, storage=default_storage),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_image_is_processed_after_commit(self):
+        self.get_or_create_category(1)
+        self.get_or_create_uom(1)
+        self.get_or_create_brand(1)
+        # Only the item itself is saved here, not the rows it refers to
+        with self.captureOnCommitCallbacks() as callbacks:
+            item = self.get_or_create_item(1)
+
+        self.assertEqual(item.image_status, "pending")
+        self.assertEqual(len(callbacks), 1)
+
+        callbacks[0]()
+        item.refresh_from_db()
+
+        self.assertEqual(item.image_status, "done")
+
+    def test_saving_without_new_image_does_not_reprocess(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            item = self.get_or_create_item(1)
+
+        # Loaded again as a request would, after the image was processed
+        item.refresh_from_db()
+        with self.captureOnCommitCallbacks() as callbacks:
+            item.item_title = "renamed"
+            item.save()
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(Item.objects.get(id=item.id).image_status, "done")
+
+
+@override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+class ItemVariantCreateTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.category = self.get_or_create_category(1)
+        self.category.category_code = "CAT"
+        self.category.save()
+        self.brand = self.get_or_create_brand(1)
+        self.brand.brand_code = "BR"
+        self.brand.save()
+        self.get_or_create_uom(1)
+
+    def attribute_list(self, count):
+        return [
+            {"option_name": "size", "attribute_list": [{"value": f"size {n}"}]}
+            for n in range(count)
+        ]
+
+    def post_variants(self, count, images=()):
+        values = {
+            "item_title": "Shirt",
+            "category": 1,
+            "uom": 1,
+            "brand": 1,
+            "threshold_qty": 1,
+            "price": 12,
+        }
+        data = {
+            "values": json.dumps(values),
+            "attributeList": json.dumps(self.attribute_list(count)),
+            "images[]": list(images),
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse("item"), data, format="multipart")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return response, len(queries)
+
+    def test_variants_are_created_with_attributes_and_prices(self):
+        response, _ = self.post_variants(3)
+
+        self.assertEqual(len(response.data), 3)
+        items = Item.objects.filter(item_title="Shirt").order_by("id")
+        self.assertEqual(
+            [item.sku for item in items],
+            [
+                GenerateSku("Shirt", self.tenant, 1, 1, attributes).generate_sku()
+                for attributes in self.attribute_list(3)
+            ],
+        )
+        self.assertIn("CAT-BR", items[0].sku)
+        self.assertEqual(ItemLineAtribute.objects.filter(item__in=items).count(), 3)
+        self.assertEqual(
+            set(
+                StockPrice.objects.filter(item__in=items).values_list(
+                    "sales_price", flat=True
+                )
+            ),
+            {12},
+        )
+        self.assertEqual(
+            response.data[0]["attributes"]["attribute_list"], [{"value": "size 0"}]
+        )
+
+    def test_images_are_processed_after_commit(self):
+        with mock.patch(
+            "apps.share.services.item_variants.image_processing_pool"
+        ) as pool:
+            response, _ = self.post_variants(2, images=[self.generate_photo()])
+
+        self.assertEqual(pool.submit.call_count, 1)
+        self.assertEqual(response.data[0]["image_status"], "pending")
+        self.assertIsNone(response.data[1]["image_status"])
+
+    def test_query_count_does_not_grow_with_variants(self):
+        # Warms the caches the first request fills
+        self.post_variants(1)
+        _, single = self.post_variants(1)
+
+        _, many = self.post_variants(200)
+
+        self.assertEqual(Item.objects.filter(item_title="Shirt").count(), 202)
+        self.assertEqual(many, single)
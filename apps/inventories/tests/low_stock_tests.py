@@ -0,0 +1,118 @@
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from rest_framework import status
+
+from apps.inventories.models.item import Item
+from apps.inventories.models.low_stock import LowStockAlert, LowStockCheck
+from apps.inventories.models.stock import Stock
+from apps.inventories.models.stock_summary import StockSummary
+from apps.share.services.low_stock import low_stock
+from apps.share.test.base import BaseTestCase
+
+
+class LowStockTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.warehouse = self.get_or_create_warehouse(1)
+        self.uom = self.get_or_create_uom(1)
+
+    def create_item(self, title, threshold_qty, quantity=None):
+        item = Item.objects.create(
+            tenant=self.tenant,
+            item_title=title,
+            uom=self.uom,
+            threshold_qty=threshold_qty,
+        )
+        if quantity is not None:
+            Stock.objects.create(
+                tenant=self.tenant,
+                source=self.warehouse,
+                item=item,
+                uom=self.uom,
+                stock_identity=f"{title}_lot",
+                quantity=quantity,
+            )
+        return item
+
+    def alerted(self):
+        return set(
+            LowStockAlert.objects.filter(tenant=self.tenant).values_list(
+                "item_id", flat=True
+            )
+        )
+
+    def test_items_at_or_below_threshold_are_low(self):
+        low = self.create_item("low", 10, quantity=4)
+        at = self.create_item("at", 10, quantity=10)
+        self.create_item("stocked", 10, quantity=11)
+        empty = self.create_item("empty", 5)
+        self.create_item("no threshold", 0)
+
+        self.assertEqual(low_stock.check(self.tenant), 3)
+        self.assertEqual(self.alerted(), {low.id, at.id, empty.id})
+        self.assertEqual(LowStockAlert.objects.get(item=low).on_hand_qty, 4)
+
+    def test_restocked_items_lose_their_alert(self):
+        item = self.create_item("item", 10, quantity=4)
+        low_stock.check(self.tenant)
+
+        stock = Stock.objects.get(item=item)
+        stock.quantity = 40
+        stock.save()
+        low_stock.check(self.tenant)
+
+        self.assertEqual(self.alerted(), set())
+
+    @override_settings(LOW_STOCK_RECHECK_OVERLAP=0)
+    def test_only_changed_items_are_rechecked(self):
+        changed = self.create_item("changed", 10, quantity=40)
+        unchanged = self.create_item("unchanged", 10, quantity=40)
+        low_stock.check(self.tenant)
+
+        # Everything so far was written before the last check
+        before = timezone.now() - timedelta(hours=1)
+        Item.objects.update(edited_at=before)
+        StockSummary.objects.update(edited_at=before)
+        LowStockCheck.objects.update(checked_at=timezone.now())
+
+        # Not saved through the model, so not seen as changed
+        Item.objects.filter(id=unchanged.id).update(threshold_qty=100)
+        changed.threshold_qty = 100
+        changed.save()
+
+        low_stock.check(self.tenant)
+        self.assertEqual(self.alerted(), {changed.id})
+
+        low_stock.check(self.tenant, full=True)
+        self.assertEqual(self.alerted(), {changed.id, unchanged.id})
+
+    def test_batch_checks_every_tenant(self):
+        item = self.create_item("item", 10, quantity=4)
+
+        call_command("check_low_stock")
+
+        self.assertEqual(self.alerted(), {item.id})
+
+    def test_batch_checks_one_tenant(self):
+        item = self.create_item("item", 10, quantity=4)
+
+        # Through the parser, as from the command line
+        call_command("check_low_stock", "--tenant", str(self.tenant.id), "--full")
+
+        self.assertEqual(self.alerted(), {item.id})
+
+    def test_list_low_stock(self):
+        item = self.create_item("item", 10, quantity=4)
+
+        response = self.client.get(reverse("stock-low"), {"page_size": 100})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [row["item"] for row in response.data["results"]], [item.id]
+        )
+        self.assertEqual(response.data["results"][0]["on_hand_qty"], 4)
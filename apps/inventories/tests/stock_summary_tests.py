@@ -0,0 +1,129 @@
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+
+from apps.inventories.models.stock import Stock
+from apps.inventories.models.stock_summary import StockSummary
+from apps.share.test.base import BaseTestCase
+
+
+class StockSummaryTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.warehouse = self.get_or_create_warehouse(1)
+        self.item = self.get_or_create_item(1)
+        self.uom = self.get_or_create_uom(1)
+        self.item.uom = self.uom
+        self.item.save()
+        # The base helpers insert explicit ids, so units are made through them
+        self.pack = self.get_or_create_uom(2)
+        self.pack.is_pack_unit = True
+        self.pack.save()
+
+    def create_stock(self, lot_number, quantity, uom=None, per_pack_qty=0, non_pack_qty=0):
+        # Stock.save derives the stock identity from the lot number
+        return Stock.objects.create(
+            tenant=self.tenant,
+            source=self.warehouse,
+            item=self.item,
+            uom=uom or self.uom,
+            lot_number=lot_number,
+            quantity=quantity,
+            per_pack_qty=per_pack_qty,
+            non_pack_qty=non_pack_qty,
+        )
+
+    def summary(self):
+        return StockSummary.objects.get(
+            tenant=self.tenant, warehouse=self.warehouse, item=self.item
+        )
+
+    def test_stock_changes_maintain_the_summary(self):
+        first = self.create_stock("lot_1", 10)
+        self.create_stock("lot_2", 5)
+        self.assertEqual(self.summary().on_hand_qty, 15)
+
+        first.quantity = 4
+        first.save()
+        self.assertEqual(self.summary().on_hand_qty, 9)
+
+        Stock.objects.filter(id=first.id).update(quantity=1)
+        self.assertEqual(self.summary().on_hand_qty, 6)
+
+        first.delete()
+        self.assertEqual(self.summary().on_hand_qty, 5)
+
+    def test_pack_lots_count_in_base_units(self):
+        self.create_stock("lot_1", 3, uom=self.pack, per_pack_qty=12, non_pack_qty=4)
+        self.create_stock("lot_2", 5)
+
+        summary = self.summary()
+        self.assertEqual(summary.base_uom, self.uom)
+        self.assertEqual(summary.on_hand_qty, 3 * 12 + 4 + 5)
+        self.assertEqual(summary.pack_qty, 3)
+        self.assertEqual(summary.non_pack_qty, 4 + 5)
+
+    def test_rebuild_matches_incremental_maintenance(self):
+        lot = self.create_stock("lot_1", 3, uom=self.pack, per_pack_qty=12)
+        self.create_stock("lot_2", 5)
+        lot.quantity = 2
+        lot.save()
+        maintained = self.summary()
+
+        StockSummary.objects.all().delete()
+        # Through the parser, as from the command line
+        call_command("rebuild_stock_summary", "--tenant", str(self.tenant.id))
+
+        rebuilt = self.summary()
+        self.assertEqual(
+            (rebuilt.on_hand_qty, rebuilt.pack_qty, rebuilt.non_pack_qty),
+            (maintained.on_hand_qty, maintained.pack_qty, maintained.non_pack_qty),
+        )
+
+    def test_changing_the_item_base_uom_moves_its_summary(self):
+        self.create_stock("lot_1", 3, uom=self.pack, per_pack_qty=12)
+        base = self.get_or_create_uom(3)
+
+        self.item.uom = base
+        self.item.save()
+
+        summary = self.summary()
+        self.assertEqual(summary.base_uom, base)
+        self.assertEqual(summary.on_hand_qty, 36)
+        self.assertEqual(StockSummary.objects.filter(item=self.item).count(), 1)
+
+    def list_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"page_size": 100})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(queries)
+
+    def test_query_count_does_not_grow_with_lots(self):
+        for url in (reverse("stock-summary"), reverse("stock-summary-pivot")):
+            with self.subTest(url=url):
+                Stock.objects.all().delete()
+                self.create_stock("lot_0", 1)
+                _, single = self.list_queries(url)
+
+                for n in range(1, 61):
+                    self.create_stock(f"lot_{n}", 1)
+                response, many = self.list_queries(url)
+
+                self.assertEqual(many, single)
+                self.assertEqual(len(response.data["results"]), 1)
+
+    def test_pivot_lists_warehouses_of_an_item(self):
+        self.create_stock("lot_1", 10)
+
+        response, _ = self.list_queries(reverse("stock-summary-pivot"))
+
+        row = response.data["results"][0]
+        self.assertEqual(row["id"], self.item.id)
+        self.assertEqual(row["total_qty"], 10)
+        self.assertEqual(
+            [warehouse["warehouse"] for warehouse in row["warehouses"]],
+            [self.warehouse.id],
+        )
@@ -0,0 +1,74 @@
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from rest_framework import status
+
+from apps.inventories.models.stock import Stock
+from apps.inventories.models.stock_price import StockPrice
+from apps.inventories.serializers.stock import StockSerializer
+from apps.share.test.base import BaseTestCase
+
+
+class StockListTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.warehouse = self.get_or_create_warehouse(1)
+        self.item = self.get_or_create_item(1)
+        self.uom = self.get_or_create_uom(1)
+        self.item.uom = self.uom
+        self.item.save()
+        self.price = StockPrice.objects.create(
+            tenant=self.tenant, item=self.item, sales_price=200
+        )
+
+    def create_stocks(self, count, offset=0):
+        Stock.objects.bulk_create(
+            Stock(
+                tenant=self.tenant,
+                source=self.warehouse,
+                item=self.item,
+                uom=self.uom,
+                item_price=self.price,
+                stock_identity=f"lot_{offset + n}",
+                quantity=10,
+                exp_date="2023-07-25",
+            )
+            for n in range(count)
+        )
+
+    def list_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"page_size": 100})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(queries)
+
+    def test_rows_match_the_model_serializer(self):
+        self.create_stocks(2)
+
+        response, _ = self.list_queries(reverse("stock"))
+
+        request = RequestFactory().get("/")
+        expected = StockSerializer(
+            Stock.objects.order_by("-created_at", "-id"),
+            many=True,
+            context={"request": request},
+        ).data
+        self.assertEqual(
+            [dict(row) for row in response.data["results"]],
+            [dict(row) for row in expected],
+        )
+
+    def test_query_count_does_not_grow_with_stocks(self):
+        for url in (reverse("stock"), f"/inventory/warehouse/stock/{self.warehouse.id}/"):
+            with self.subTest(url=url):
+                Stock.objects.all().delete()
+                self.create_stocks(1)
+                _, single = self.list_queries(url)
+
+                self.create_stocks(60, offset=1)
+                response, many = self.list_queries(url)
+
+                self.assertEqual(len(response.data["results"]), 61)
+                self.assertEqual(many, single)
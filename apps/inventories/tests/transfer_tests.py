@@ -1,7 +1,13 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from rest_framework import status
 
+from apps.inventories.models.item import ItemLineAtribute
+from apps.inventories.models.stock import Stock
+from apps.inventories.models.stock_price import StockPrice
+from apps.inventories.models.transfer import Transfer, TransferItem
 from apps.share.test.base import BaseTestCase
 
 
@@ -95,3 +101,123 @@ class TransferTestCase(BaseTestCase):
     #     response = self.client.delete(url)
 
     #     self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+
+class TransferQueryCountTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.source = self.get_or_create_warehouse(1)
+        self.destination = self.get_or_create_warehouse(2)
+        self.uom = self.get_or_create_uom(1)
+        self.item = self.get_or_create_item(1)
+        ItemLineAtribute.objects.create(
+            tenant=self.tenant, item=self.item, attributes={"size": "L"}
+        )
+
+    def create_transfers(self, count, lines):
+        transfers = Transfer.objects.bulk_create(
+            Transfer(tenant=self.tenant, from_stk=self.source, to_stk=self.destination)
+            for _ in range(count)
+        )
+        transfer_items = []
+        for transfer in transfers:
+            for line in range(lines):
+                lot_number = f"T{transfer.id}-{line}"
+                stock = Stock.objects.create(
+                    tenant=self.tenant,
+                    source=self.source,
+                    item=self.item,
+                    uom=self.uom,
+                    lot_number=lot_number,
+                )
+                Stock.objects.create(
+                    tenant=self.tenant,
+                    source=self.destination,
+                    item=self.item,
+                    uom=self.uom,
+                    lot_number=lot_number,
+                )
+                transfer_items.append(
+                    TransferItem(
+                        tenant=self.tenant,
+                        transfer=transfer,
+                        stock=stock,
+                        trans_unit=self.uom,
+                        des_stock_identity=stock.stock_identity,
+                    )
+                )
+        TransferItem.objects.bulk_create(transfer_items)
+
+    def list_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("transfer-list"), {"page_size": 100})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(queries)
+
+    def test_list_query_count_does_not_grow_with_transfers_or_lines(self):
+        self.create_transfers(1, 1)
+        _, single = self.list_queries()
+
+        self.create_transfers(20, 5)
+        response, many = self.list_queries()
+
+        self.assertEqual(len(response.data["results"]), 21)
+        self.assertEqual(many, single)
+
+    def test_lines_carry_their_destination_stock(self):
+        self.create_transfers(1, 2)
+
+        response, _ = self.list_queries()
+
+        for line in response.data["results"][0]["transfers"]:
+            destination = Stock.objects.get(
+                source=self.destination, stock_identity=line["stock_identity"]
+            )
+            self.assertEqual(line["des_stock_id"], destination.id)
+            self.assertEqual(line["attributes"], {"size": "L"})
+
+    def test_update_moves_the_stock_once(self):
+        self.create_transfers(1, 2)
+        transfer = Transfer.objects.get()
+        price = StockPrice.objects.create(
+            tenant=self.tenant, item=self.item, sales_price=100
+        )
+        Stock.objects.update(quantity=10, item_price=price)
+        lines = list(transfer.transfers.order_by("id"))
+
+        response = self.client.put(
+            reverse("transfer-details", kwargs={"pk": transfer.id}),
+            {
+                "from_stk": self.source.id,
+                "to_stk": self.destination.id,
+                "transfers": [
+                    {
+                        "id": line.id,
+                        "stock": line.stock_id,
+                        "trans_qty": 4,
+                        "trans_unit": self.uom.id,
+                    }
+                    for line in lines
+                ],
+                "primary_stock": [],
+                "des_stock": [
+                    {
+                        "id": line.stock_id,
+                        "trans_qty": 4,
+                        "quantity": 4,
+                        "uom": self.uom.id,
+                        "non_pack_qty": 0,
+                    }
+                    for line in lines
+                ],
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        for line in lines:
+            self.assertEqual(Stock.objects.get(id=line.stock_id).quantity, 6)
+            destination = Stock.objects.get(
+                source=self.destination, stock_identity=line.des_stock_identity
+            )
+            self.assertEqual(destination.quantity, 14)
@@ -15,6 +15,8 @@ from apps.inventories.views.warehouse import WarehouseView, WarehouseDetailsView
 from apps.inventories.views.transfer import TransferView, TransferDetailsView
 # Stock Import
 from apps.inventories.views.stock import StockView, WarehouseStockView
+from apps.inventories.views.stock_summary import StockSummaryView, StockSummaryPivotView
+from apps.inventories.views.low_stock import LowStockView
 from apps.inventories.views.production import ProductionView, ProductionDetailsView
 # Adjust Import
 from apps.inventories.views.adjust import AdjustView
@@ -57,6 +59,10 @@ urlpatterns = [
     # Stock Urls
     # path("stock/<int:pk>/", UomDetailsView.as_view()),
     path("stock/", StockView.as_view(), name='stock'),  # StockView 1
+    path("stock/summary/", StockSummaryView.as_view(), name="stock-summary"),
+    path("stock/summary/pivot/", StockSummaryPivotView.as_view(),
+         name="stock-summary-pivot"),
+    path("stock/low/", LowStockView.as_view(), name="stock-low"),
 
     path("production/", ProductionView.as_view(), name='productions'),
     path("production/<int:pk>/", ProductionDetailsView.as_view(),
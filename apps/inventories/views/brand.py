@@ -5,6 +5,7 @@ from apps.accounts.permissions import GroupPermission
 
 from apps.inventories.models.brand import Brand
 from apps.inventories.serializers.brand import BrandSerializer
+from apps.share.services.master_data import master_data
 from apps.share.views import get_tenant_user
 
 
@@ -20,7 +21,7 @@ class BrandView(generics.ListCreateAPIView):
         user_tenant = get_tenant_user(self)
         if user_tenant is not None:
             tenant = user_tenant.tenant
-            brand = tenant.brand_base_models.all().order_by("-created_at")
+            brand = master_data.all(Brand, tenant)
             return brand
 
         else:
@@ -12,6 +12,7 @@ from apps.share.views import get_tenant_user
 from apps.share.services.generate_short_name import generate_short_name
 from django.db import transaction
 from apps.share.services.tenant_error_logger import TenantLogger
+from apps.share.services.category_tree import category_tree
 
 
 class CategoryView(generics.ListCreateAPIView):
@@ -42,6 +43,16 @@ class CategoryView(generics.ListCreateAPIView):
                 categories = []
             return categories
 
+    def list(self, request, *args, **kwargs):
+        """
+        Return the tenant's whole category tree, built from the cached
+        adjacency list. The tree is one document, so it is not paginated.
+        """
+        user_tenant = get_tenant_user(self)
+        if user_tenant is None:
+            return Response([])
+        return Response(category_tree.tree(user_tenant.tenant))
+
     @transaction.atomic
     def post(self, request):
         """
@@ -12,75 +12,14 @@ from apps.inventories.serializers.item import (
     ItemLineAtributeSerializer,
 )
 
-from apps.inventories.models.stock_price import StockPrice
-from apps.inventories.models.category import Category
-
-from apps.share.services.generate_short_name import generate_short_name
+from apps.share.services.generate_sku import GenerateSku
+from apps.share.services.item_variants import ItemVariantCreator
 from apps.share.services.tenant_error_logger import TenantLogger
 from apps.share.views import validate_tenant_user
 
 import json
 
 
-class GenerateSku:
-    """Helper class to generate SKU based on item attributes."""
-
-    def __init__(self, item_title, tenant, category_id, brand_id, attributes):
-        self.tenant = tenant
-        self.item_title = item_title
-        self.category_id = category_id
-        self.brand_id = brand_id
-        self.attributes = attributes
-
-    # Methods to generate parts of the SKU
-    def get_item_title_short_name(self):
-        short_name = generate_short_name(self.item_title)
-        return short_name
-
-    def get_category_short_name(self):
-        category = Category.objects.filter(id=self.category_id).first()
-        if category:
-            category_code = category.category_code
-            return category_code
-        else:
-            return "NA"
-
-    def get_brand_code(self):
-        try:
-            brand_code = self.tenant.brand_base_models.get(id=self.brand_id).brand_code
-        except:
-            brand_code = "NA"
-        return brand_code
-
-    def get_attribute(self):
-        joined_short_name = ""
-        for attribute in self.attributes.get("attribute_list", []):
-            short_name = generate_short_name(attribute.get("value", ""))
-            joined_short_name += "-" + short_name
-        return joined_short_name
-
-    # Generate the final SKU
-    def generate_sku(self):
-        item_title_short_name = self.get_item_title_short_name()
-        category_short_name = self.get_category_short_name()
-        brand_short_name = self.get_brand_code()
-        attribute = self.get_attribute()
-
-        # Check if any component is "None" and exclude it from the SKU
-        components = [
-            item_title_short_name,
-            category_short_name,
-            brand_short_name,
-            attribute,
-        ]
-        filtered_components = [comp for comp in components if comp and comp != "NA"]
-
-        # Join the non-"None" components with "-"
-        sku = "-".join(filtered_components)
-
-        return sku
-
-
 class ItemView(generics.ListCreateAPIView):
     """API view for listing and creating items."""
 
@@ -99,13 +38,9 @@ class ItemView(generics.ListCreateAPIView):
         # Retrieve the tenant-specific item list for the user
         valid = validate_tenant_user(tenant=self.tenant, user=self.request.user)
         if valid:
-            item = (
+            item = ItemSerializer.setup_eager_loading(
                 self.tenant.item_base_models.all()
-                .select_related("category")
-                .select_related("uom")
-                .select_related("brand")
-                .order_by("-created_at")
-            )
+            ).order_by("-created_at")
             return item
         else:
             # Handle the case where tenant id is not found
@@ -129,57 +64,21 @@ class ItemView(generics.ListCreateAPIView):
             tenant_logger.error("Tenant not found.")
             return Response("Tenant not found.", status=status.HTTP_400_BAD_REQUEST)
 
-        category_id = item_data.get("category", None)
-        brand_id = item_data.get("brand", None)
-        item_data_list = []
-        item_line_attribute_data_list = []
+        # Every variant shares the item data, so it is validated once
+        item_serializer = self.get_serializer(data=item_data)
+        if not item_serializer.is_valid():
+            tenant_logger.error(f"Item serializer error: {item_serializer.errors}")
+            return Response([], status=status.HTTP_201_CREATED)
 
-        # Loop through attribute list and create items and attributes
-        for attribute_number in range(0, len(attribute_list)):
-            generate_sku = GenerateSku(
-                item_data.get("item_title", ""),
-                self.tenant,
-                category_id,
-                brand_id,
-                attribute_list[attribute_number],
-            )
-            sku = generate_sku.generate_sku()
-            item_serializer = self.get_serializer(data=item_data)
-            if item_serializer.is_valid():
-                try:
-                    item_image = images[attribute_number]
-                except:
-                    item_image = None
-                item = item_serializer.save(
-                    tenant=self.tenant, sku=sku, item_image=item_image
-                )
-                item_line_attribute_serializer = ItemLineAtributeSerializer(
-                    data=attribute_list[attribute_number]
-                )
-                if item_line_attribute_serializer.is_valid():
-                    item_line_attribute_serializer.save(
-                        tenant=self.tenant,
-                        item=item,
-                        option_name=attribute_list[attribute_number].get(
-                            "option_name", ""
-                        ),
-                        attributes=attribute_list[attribute_number],
-                    )
-                item_data_list.append(item_serializer.data)
-                item_line_attribute_data_list.append(
-                    item_line_attribute_serializer.data
-                )
-                if item_data.get("price", "") == "":
-                    StockPrice.objects.create(
-                        tenant=self.tenant, item=item, sales_price=0
-                    )
-                else:
-                    StockPrice.objects.create(
-                        tenant=self.tenant, item=item, sales_price=item_data["price"]
-                    )
-            else:
-                tenant_logger.error(f"Item serializer error: {item_serializer.errors}")
+        price = item_data.get("price", "")
+        items = ItemVariantCreator(self.tenant).create(
+            item_serializer.validated_data,
+            attribute_list,
+            images or [],
+            0 if price == "" else price,
+        )
 
+        item_data_list = self.get_serializer(items, many=True).data
         return Response(item_data_list, status=status.HTTP_201_CREATED)
 
 
@@ -6,6 +6,7 @@ from apps.accounts.permissions import GroupPermission
 from apps.inventories.models.item_attribute import ItemAttribute, ItemAttributeValue
 from apps.inventories.serializers.item_attribute import ItemAttributeSerializer, ItemAttributeValueSerializer
 
+from apps.share.services.master_data import master_data
 from apps.share.views import get_tenant_user
 
 ######################
@@ -24,7 +25,7 @@ class ItemAttributeView(generics.ListCreateAPIView):
         user_tenant = get_tenant_user(self)
         if user_tenant is not None:
             tenant = user_tenant.tenant
-            item_attribute = tenant.itemattribute_base_models.all().order_by("-created_at")
+            item_attribute = master_data.all(ItemAttribute, tenant)
             return item_attribute
             
         else:
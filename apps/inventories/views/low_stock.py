@@ -0,0 +1,43 @@
+from rest_framework import generics
+from rest_framework.permissions import IsAuthenticated
+
+from apps.accounts.permissions import GroupPermission
+
+from apps.inventories.models.low_stock import LowStockAlert
+from apps.inventories.serializers.low_stock import LowStockAlertSerializer
+
+from apps.share.views import get_tenant_user
+from apps.share.services.low_stock import low_stock
+
+
+class LowStockView(generics.ListAPIView):
+    """
+    Items at or below their threshold quantity.
+
+    The tenant's alerts are brought up to date before they are listed,
+    which only rechecks items changed since the last check; ``?full=1``
+    rechecks every item.
+    """
+
+    queryset = LowStockAlert
+    serializer_class = LowStockAlertSerializer
+    permission_classes = (
+        IsAuthenticated,
+        GroupPermission,
+    )
+
+    def get_queryset(self):
+        """
+        Get the low stock alerts of the current tenant.
+
+        Returns:
+            QuerySet: The queryset of LowStockAlert objects.
+        """
+        return LowStockAlertSerializer.setup_eager_loading(
+            get_tenant_user(self).tenant.lowstockalert_base_models.all()
+        )
+
+    def list(self, request, *args, **kwargs):
+        full = request.query_params.get("full") in ("1", "true")
+        low_stock.check(get_tenant_user(self).tenant, full=full)
+        return super().list(request, *args, **kwargs)
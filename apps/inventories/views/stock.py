@@ -7,7 +7,7 @@ from apps.accounts.permissions import GroupPermission
 
 from apps.inventories.models.stock import Stock
 from apps.inventories.models.warehouse import Warehouse
-from apps.inventories.serializers.stock import StockSerializer
+from apps.inventories.serializers.stock import StockRowSerializer, StockSerializer
 
 from apps.share.views import get_tenant_user
 
@@ -28,6 +28,12 @@ class StockView(generics.ListCreateAPIView):
         GroupPermission,
     )
 
+    def get_serializer_class(self):
+        # Listings are served from projected rows, see StockRowSerializer
+        if self.request.method == "GET":
+            return StockRowSerializer
+        return StockSerializer
+
     def get_queryset(self):
         """
         Get a queryset of Stock objects for the current tenant.
@@ -38,7 +44,9 @@ class StockView(generics.ListCreateAPIView):
         user_tenant = get_tenant_user(self)
         if user_tenant is not None:
             tenant = user_tenant.tenant
-            stocks = tenant.stock_base_models.all()
+            stocks = StockRowSerializer.setup_eager_loading(
+                tenant.stock_base_models.all()
+            )
             return stocks
         else:
             raise Exception("Permission denied!")
@@ -78,6 +86,12 @@ class WarehouseStockView(generics.ListCreateAPIView):
 
         return warehouse
 
+    def get_serializer_class(self):
+        # Listings are served from projected rows, see StockRowSerializer
+        if self.request.method == "GET":
+            return StockRowSerializer
+        return StockSerializer
+
     def get_queryset(self):
         """
         Get a queryset of Stock objects for the current tenant and a specific Warehouse.
@@ -92,26 +106,20 @@ class WarehouseStockView(generics.ListCreateAPIView):
         warehouse = self.get_warehouse_object(warehouse_id, tenant)
 
         if warehouse_id == 0:
-            stocks = (
+            stocks = StockRowSerializer.setup_eager_loading(
                 tenant.stock_base_models.filter(
                     Q(quantity__gt=0) | Q(non_pack_qty__gt=0)
                 )
-                .select_related("item")
-                .select_related("uom")
-                .order_by("-created_at")
-            )
+            ).order_by("-created_at")
             return stocks
         else:
             if user_tenant is not None:
-                stocks = (
+                stocks = StockRowSerializer.setup_eager_loading(
                     tenant.stock_base_models.filter(
                         Q(source=warehouse, quantity__gt=0)
                         | Q(source=warehouse, non_pack_qty__gt=0)
                     )
-                    .select_related("item")
-                    .select_related("uom")
-                    .order_by("-created_at")
-                )
+                ).order_by("-created_at")
                 return stocks
             else:
                 print("Tenant id not found")
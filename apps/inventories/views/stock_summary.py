@@ -0,0 +1,91 @@
+from django.db.models import Exists, OuterRef
+
+from rest_framework import generics
+from rest_framework.permissions import IsAuthenticated
+
+from apps.accounts.permissions import GroupPermission
+
+from apps.inventories.models.stock_summary import StockSummary
+from apps.inventories.serializers.stock_summary import (
+    StockSummarySerializer,
+    StockSummaryPivotSerializer,
+)
+
+from apps.share.views import get_tenant_user
+from apps.share.services.stock_summary import stock_summary
+
+
+class StockSummaryView(generics.ListAPIView):
+    """
+    Stock on hand per item and warehouse, read from the stock summary.
+
+    ``?warehouse=`` and ``?item=`` narrow the rows to one warehouse or item.
+    """
+
+    queryset = StockSummary
+    serializer_class = StockSummarySerializer
+    permission_classes = (
+        IsAuthenticated,
+        GroupPermission,
+    )
+
+    def get_queryset(self):
+        """
+        Get the summary rows of the current tenant.
+
+        Returns:
+            QuerySet: The queryset of StockSummary objects.
+        """
+        tenant = get_tenant_user(self).tenant
+        summaries = StockSummarySerializer.setup_eager_loading(
+            tenant.stocksummary_base_models.all()
+        )
+
+        warehouse = self.request.query_params.get("warehouse")
+        if warehouse:
+            summaries = summaries.filter(warehouse_id=warehouse)
+        item = self.request.query_params.get("item")
+        if item:
+            summaries = summaries.filter(item_id=item)
+        return summaries
+
+
+class StockSummaryPivotView(generics.ListAPIView):
+    """
+    Items with their stock on hand in every warehouse.
+
+    A page costs one query for the items and one for their summary rows,
+    however many warehouses and lots they have.
+    """
+
+    queryset = StockSummary
+    serializer_class = StockSummaryPivotSerializer
+    permission_classes = (
+        IsAuthenticated,
+        GroupPermission,
+    )
+
+    def get_queryset(self):
+        """
+        Get the current tenant's items that have stock summary rows.
+
+        Returns:
+            QuerySet: The queryset of Item objects.
+        """
+        tenant = get_tenant_user(self).tenant
+        return (
+            tenant.item_base_models.filter(
+                Exists(StockSummary.objects.filter(item=OuterRef("pk")))
+            )
+            .select_related("uom")
+        )
+
+    def list(self, request, *args, **kwargs):
+        items = self.paginate_queryset(self.get_queryset())
+        summaries = stock_summary.by_item(
+            get_tenant_user(self).tenant, [item.id for item in items]
+        )
+        context = self.get_serializer_context()
+        context["summaries"] = summaries
+        serializer = self.get_serializer(items, many=True, context=context)
+        return self.get_paginated_response(serializer.data)
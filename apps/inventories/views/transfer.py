@@ -1,4 +1,5 @@
 from django.db import transaction
+from django.db.models import Max
 
 from rest_framework import generics, status
 from rest_framework.response import Response
@@ -13,7 +14,9 @@ from apps.inventories.serializers.transfer import (
 )
 
 from apps.share.views import get_tenant_user
-from apps.share.services.stock_common import stock_exists_obj
+from apps.share.services.document_sequence import document_sequence
+from apps.share.services.stock_common import stock_exists_objs
+from apps.share.services.stock_ledger import StockEntry, StockLedger
 from apps.share.services.stock_manager import StockManager
 from apps.share.services.tenant_error_logger import TenantLogger
 
@@ -63,6 +66,17 @@ class TransferView(generics.ListCreateAPIView):
         }
         return obj
 
+    def last_transfer_no(self, tenant):
+        """
+        Seed for the transfer number sequence: the highest existing transfer_no.
+        """
+
+        def seed(year):
+            transfers = tenant.transfer_base_models.aggregate(last=Max("transfer_no"))
+            return transfers["last"] or 0
+
+        return seed
+
     def get_queryset(self):
         """
         Get the queryset of Transfer objects for the current tenant.
@@ -70,11 +84,9 @@ class TransferView(generics.ListCreateAPIView):
         Returns:
             QuerySet: The queryset of Transfer objects ordered by creation date.
         """
-        return (
-            get_tenant_user(self)
-            .tenant.transfer_base_models.all()
-            .order_by("-created_at")
-        )
+        return TransferSerializer.setup_eager_loading(
+            get_tenant_user(self).tenant.transfer_base_models.all()
+        ).order_by("-created_at")
 
     def create(self, request):
         """
@@ -91,52 +103,56 @@ class TransferView(generics.ListCreateAPIView):
         """
         tenant_logger = TenantLogger(request)
         tenant = get_tenant_user(self).tenant
-        last_transfer = (
-            tenant.transfer_base_models.last().transfer_no
-            if tenant.transfer_base_models.exists()
-            else 0
-        )
-        transfer_no = last_transfer + 1
         serializer = self.get_serializer(data=request.data)
 
         if serializer.is_valid():
             try:
-                # Create the Transfer record
-                transfer = serializer.save(
-                    tenant=tenant,
-                    transfer_no=transfer_no,
-                    from_stk_id=request.data["from_stk"],
-                    to_stk_id=request.data["to_stk"],
-                )
-
-                # Create or update TransferItem records
-                for transfer_item in request.data["transfers"]:
-                    item_serializer = TransferItemSerializer(data=transfer_item)
-                    if item_serializer.is_valid():
-                        item_serializer.save(
-                            tenant=tenant,
-                            transfer=transfer,
-                            des_stock_identity=transfer_item["des_stock_identity"],
-                        )
-                    else:
-                        tenant_logger.error(item_serializer.errors)
-                        return Response(
-                            item_serializer.errors,
-                            status=status.HTTP_400_BAD_REQUEST,
-                        )
+                with transaction.atomic():
+                    # Allocated in this transaction, so a failed create hands the
+                    # number back
+                    _, transfer_no = document_sequence.next_value(
+                        tenant, "TRF", self.last_transfer_no(tenant), yearly=False
+                    )
 
-                # Create or update primary_stock objects
-                primary_stock = request.data["primary_stock"]
-                for stock in primary_stock:
-                    stock_manager = self.manage_stock(stock["id"])
-                    stock_manager.stock_create_or_update(stock)
+                    # Create the Transfer record
+                    transfer = serializer.save(
+                        tenant=tenant,
+                        transfer_no=transfer_no,
+                        from_stk_id=request.data["from_stk"],
+                        to_stk_id=request.data["to_stk"],
+                    )
 
-                # Create or update des_stock objects
-                des_stock = request.data["des_stock"]
-                for stock in des_stock:
-                    stock_obj = self.stock_obj(stock=stock)
-                    stock_manager = stock_exists_obj(
-                        tenant, stock_obj, stock["stock_identity"]
+                    # Create or update TransferItem records
+                    for transfer_item in request.data["transfers"]:
+                        item_serializer = TransferItemSerializer(data=transfer_item)
+                        if item_serializer.is_valid():
+                            item_serializer.save(
+                                tenant=tenant,
+                                transfer=transfer,
+                                des_stock_identity=transfer_item["des_stock_identity"],
+                            )
+                        else:
+                            tenant_logger.error(item_serializer.errors)
+                            transaction.set_rollback(True)
+                            return Response(
+                                item_serializer.errors,
+                                status=status.HTTP_400_BAD_REQUEST,
+                            )
+
+                    # Create or update primary_stock objects
+                    primary_stock = request.data["primary_stock"]
+                    for stock in primary_stock:
+                        stock_manager = self.manage_stock(stock["id"])
+                        stock_manager.stock_create_or_update(stock)
+
+                    # Create or update des_stock objects
+                    des_stock = request.data["des_stock"]
+                    stock_exists_objs(
+                        tenant,
+                        [
+                            (self.stock_obj(stock=stock), stock["stock_identity"])
+                            for stock in des_stock
+                        ],
                     )
 
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -157,6 +173,15 @@ class TransferDetailsView(generics.RetrieveUpdateDestroyAPIView):
         GroupPermission,
     )
 
+    def get_queryset(self):
+        """
+        Get the queryset of Transfer objects for the current tenant, with
+        everything the representation reads loaded up front.
+        """
+        return TransferSerializer.setup_eager_loading(
+            get_tenant_user(self).tenant.transfer_base_models.all()
+        )
+
     def stock_obj(self, stock, stock_manager, data):
         """
         Create a dictionary representing a stock object based on the provided data.
@@ -224,27 +249,6 @@ class TransferDetailsView(generics.RetrieveUpdateDestroyAPIView):
                     if item_serializer.is_valid():
                         item_serializer.save()
 
-                        # Create or update the primary_stock objects
-                        primary_stock = request.data["primary_stock"]
-
-                        for stock in primary_stock:
-                            stock_manager = self.manage_stock(stock["id"])
-                            stock_manager.stock_create_or_update(stock)
-
-                        # Create or update the des_stock objects
-                        des_stock = request.data["des_stock"]
-
-                        for stock in des_stock:
-                            stock_manager = tenant.stock_base_models.get(id=stock["id"])
-                            stock_manager.quantity -= int(stock["trans_qty"])
-                            stock_manager.save()
-                            stock_obj = self.stock_obj(
-                                stock, stock_manager, request.data
-                            )
-                            stock_exists_obj(
-                                tenant, stock_obj, stock_manager.stock_identity
-                            )
-
                         if transfer_item["trans_qty"] == 0:
                             t_item.delete()
                     else:
@@ -254,6 +258,37 @@ class TransferDetailsView(generics.RetrieveUpdateDestroyAPIView):
                             item_serializer.errors, status=status.HTTP_400_BAD_REQUEST
                         )
 
+                # Create or update the primary_stock objects
+                primary_stock = request.data["primary_stock"]
+
+                for stock in primary_stock:
+                    stock_manager = self.manage_stock(stock["id"])
+                    stock_manager.stock_create_or_update(stock)
+
+                # Move the des_stock quantities out of their rows and into the
+                # destination warehouse, as one ledger batch
+                des_stock = request.data["des_stock"]
+                stocks = tenant.stock_base_models.select_related(
+                    "item", "item_price"
+                ).in_bulk([stock["id"] for stock in des_stock])
+                entries = []
+                for stock in des_stock:
+                    stock_manager = stocks[stock["id"]]
+                    entries.append(
+                        StockEntry(
+                            warehouse_id=stock_manager.source_id,
+                            item_id=stock_manager.item_id,
+                            stock_identity=stock_manager.stock_identity,
+                            qty=-int(stock["trans_qty"]),
+                            price=stock_manager.item_price.sales_price,
+                        )
+                    )
+                    stock_obj = self.stock_obj(stock, stock_manager, request.data)
+                    entries.append(
+                        StockEntry.from_obj(stock_obj, stock_manager.stock_identity)
+                    )
+                StockLedger(tenant).apply(entries)
+
                 return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
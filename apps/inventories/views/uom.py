@@ -6,6 +6,7 @@ from apps.accounts.permissions import GroupPermission
 from apps.inventories.models.uom import UOM
 from apps.inventories.serializers.uom import UOMSerializer
 
+from apps.share.services.master_data import master_data
 from apps.share.views import get_tenant_user
 
 
@@ -27,7 +28,7 @@ class UomView(generics.ListCreateAPIView):
         user_tenant = get_tenant_user(self)
         if user_tenant is not None:
             tenant = user_tenant.tenant
-            uom = tenant.uom_base_models.all().order_by("-created_at")
+            uom = master_data.all(UOM, tenant)
             return uom
         else:
             print("Tenant id not found")
@@ -6,6 +6,7 @@ from apps.accounts.permissions import GroupPermission
 from apps.inventories.models.warehouse import Warehouse
 from apps.inventories.serializers.warehouse import WarehouseSerializer
 
+from apps.share.services.master_data import invalidate_master_data, master_data
 from apps.share.views import get_tenant_user
 
 
@@ -21,7 +22,7 @@ class WarehouseView(generics.ListCreateAPIView):
         user_tenant = get_tenant_user(self)
         if user_tenant is not None:
             tenant = user_tenant.tenant
-            item = tenant.warehouse_base_models.all()
+            item = master_data.all(Warehouse, tenant)
             return item
         else:
             # print("Tenant id not found")
@@ -40,6 +41,7 @@ class WarehouseView(generics.ListCreateAPIView):
             if is_primary:
                 # serializer.validated_data["is_primary"] = True
                 tenant_primary_warehouses.update(is_primary=False)
+                invalidate_master_data(Warehouse, tenant.id)
                 # Warehouse.objects.bulk_update(tenant_primary_warehouses, ['is_primary'])
 
         return super().perform_create(serializer)
@@ -73,6 +75,7 @@ class WarehouseDetailsView(generics.RetrieveUpdateDestroyAPIView):
                 if is_primary:
                     serializer.validated_data["is_primary"] = True
                     tenant_primary_warehouses.update(is_primary=False)
+                    invalidate_master_data(Warehouse, tenant.id)
                     # Warehouse.objects.bulk_update(tenant_primary_warehouses, ['is_primary'])
 
                 return super().perform_update(serializer)
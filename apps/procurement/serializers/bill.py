@@ -94,6 +94,8 @@ class BillPaySerializer(serializers.ModelSerializer):
             "recpt",
             "cash_amt",
         )
+        # Allocated by the document sequence on create
+        extra_kwargs = {"bill_num": {"required": False}}
 
     def to_representation(self, instance):
         """
@@ -90,6 +90,8 @@ class PurReturnSerializer(serializers.ModelSerializer):
     class Meta:
         model = PurReturn
         fields = "__all__"
+        # Allocated by the document sequence on create
+        extra_kwargs = {"return_num": {"required": False}}
 
     def to_representation(self, instance):
         """
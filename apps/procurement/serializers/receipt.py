@@ -1,4 +1,6 @@
+from django.db.models import OuterRef, Prefetch, Subquery
 from rest_framework import serializers
+from apps.procurement.models.bill import BillPay
 from apps.procurement.models.receipt import Receipt, ReceiptLineItem
 
 
@@ -51,13 +53,40 @@ class ReceiptSerializer(serializers.ModelSerializer):
         model = Receipt
         fields = "__all__"
 
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Load everything the representation reads, so serializing any number
+        of receipts takes a constant number of queries. The advance of each
+        receipt's latest bill is annotated as ``latest_adv_amt``.
+        """
+        latest_bill = BillPay.objects.filter(
+            tenant=OuterRef("tenant"), recpt=OuterRef("pk")
+        ).order_by("-pk")
+        return (
+            queryset.select_related("vendor", "source", "recvd_by")
+            .annotate(latest_adv_amt=Subquery(latest_bill.values("adv_amt")[:1]))
+            .prefetch_related(
+                Prefetch(
+                    "receipt_line_items",
+                    queryset=ReceiptLineItem.objects.select_related(
+                        "item__brand", "unit"
+                    ),
+                )
+            )
+        )
+
+    def get_adv_amt(self, instance):
+        if hasattr(instance, "latest_adv_amt"):
+            return instance.latest_adv_amt
+        bill = instance.tenant.billpay_base_models.filter(recpt=instance).last()
+        return bill.adv_amt if bill else None
+
     def to_representation(self, instance):
         """
         Customize the representation of Receipt instances.
         """
         representation = super().to_representation(instance)
-        tenant = instance.tenant
-        bill = tenant.billpay_base_models.filter(recpt=instance).last()
         representation["recpt_dt"] = instance.recpt_dt.strftime("%b %d, %Y")
 
         representation["vendor_name"] = (
@@ -79,7 +108,7 @@ class ReceiptSerializer(serializers.ModelSerializer):
             receipt_line_items if receipt_line_items else None
         )
         representation["total_amt"] = instance.grand_total if instance else None
-        representation["adv_amt"] = bill.adv_amt if bill else None
+        representation["adv_amt"] = self.get_adv_amt(instance)
         representation["grand_total_price"] = (
             ["success", instance.grand_total] if instance else 0
         )
@@ -1,7 +1,11 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from rest_framework import status
 
+from apps.procurement.models.bill import BillPay
+from apps.procurement.models.receipt import Receipt, ReceiptLineItem
 from apps.share.test.base import BaseTestCase
 
 
@@ -99,3 +103,75 @@ class ReceiptTestCase(BaseTestCase):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         
         
+
+
+class ReceiptQueryCountTestCase(BaseTestCase):
+    def create_receipts(self, count):
+        vendor = self.get_or_create_vendor(1)
+        warehouse = self.get_or_create_warehouse(1)
+        item = self.get_or_create_item(1)
+        item.brand = self.get_or_create_brand(1)
+        item.save()
+        unit = self.get_or_create_uom(1)
+        receipts = Receipt.objects.bulk_create(
+            Receipt(
+                tenant=self.tenant,
+                vendor=vendor,
+                source=warehouse,
+                recvd_by=self.user,
+                grand_total=100,
+            )
+            for _ in range(count)
+        )
+        ReceiptLineItem.objects.bulk_create(
+            ReceiptLineItem(
+                tenant=self.tenant,
+                recpt=receipt,
+                item=item,
+                unit=unit,
+                lot_number="lot",
+                reciept_identity="lot",
+            )
+            for receipt in receipts
+            for _ in range(2)
+        )
+        # Only the latest bill's advance is shown
+        BillPay.objects.bulk_create(
+            BillPay(tenant=self.tenant, recpt=receipt, bill_num="B", adv_amt=adv_amt)
+            for receipt in receipts
+            for adv_amt in (10, 40)
+        )
+        return receipts
+
+    def list_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("receipts"), {"page_size": 100})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(queries)
+
+    def test_list_query_count_does_not_grow_with_receipts(self):
+        self.create_receipts(1)
+        _, single = self.list_queries()
+
+        self.create_receipts(60)
+        response, many = self.list_queries()
+
+        self.assertEqual(len(response.data["results"]), 61)
+        self.assertEqual(many, single)
+
+    def test_adv_amt_is_the_latest_bill_advance(self):
+        receipt, other = self.create_receipts(2)
+        # A later bill of another receipt
+        BillPay.objects.create(
+            tenant=self.tenant,
+            recpt=other,
+            bill_num="X",
+            adv_amt=99,
+        )
+
+        response, _ = self.list_queries()
+
+        row = next(row for row in response.data["results"] if row["id"] == receipt.id)
+        self.assertEqual(row["adv_amt"], 40)
+        self.assertEqual(len(row["receipt_line_items"]), 2)
+        self.assertEqual(row["receipt_line_items"][0]["item_brand"], "brand_name_1")
@@ -0,0 +1,84 @@
+from apps.inventories.models.stock import Stock
+from apps.inventories.models.stock_price import StockPrice
+from apps.share.services.stock_ledger import StockEntry, StockLedger
+from apps.share.test.base import BaseTestCase
+from apps.share.views import generate_stock_identity
+
+
+class StockLedgerTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.warehouse = self.get_or_create_warehouse(1)
+        self.uom = self.get_or_create_uom(1)
+
+    def entry(self, item, qty, lot_number="L1", price=10):
+        identity = generate_stock_identity(self.uom.id, lot_number, 0, "2030-01-01")
+        return StockEntry(
+            warehouse_id=self.warehouse.id,
+            item_id=item.id,
+            stock_identity=identity,
+            qty=qty,
+            price=price,
+            uom_id=self.uom.id,
+            lot_number=lot_number,
+            exp_date="2030-01-01",
+            recvd_date="2030-01-01T00:00:00Z",
+        )
+
+    def test_existing_rows_are_incremented_and_new_rows_created(self):
+        item = self.get_or_create_item(1)
+        existing = StockLedger(self.tenant).apply([self.entry(item, 5)])[0]
+
+        stocks = StockLedger(self.tenant).apply(
+            [self.entry(item, 3), self.entry(item, 2), self.entry(item, 4, "L2", 12)]
+        )
+
+        existing.refresh_from_db()
+        self.assertEqual(existing.quantity, 10)
+        self.assertEqual(stocks[0].pk, existing.pk)
+        self.assertEqual(stocks[1].pk, existing.pk)
+        self.assertEqual(Stock.objects.get(pk=stocks[2].pk).quantity, 4)
+        self.assertEqual(StockPrice.objects.get(item=item).sales_price, 12)
+        self.assertEqual(stocks[2].item_price.item_id, item.id)
+
+    def test_query_count_does_not_grow_with_lines(self):
+        items = [self.get_or_create_item(number) for number in range(2, 42)]
+        StockLedger(self.tenant).apply([self.entry(item, 1) for item in items[:20]])
+
+        entries = [self.entry(item, 1) for item in items]
+        entries += [self.entry(item, 1, "L2") for item in items]
+
+        # Stock SELECT, StockPrice SELECT, StockPrice bulk_update and
+        # bulk_create, Stock upsert, Stock SELECT of the new rows, quantity
+        # UPDATE
+        with self.assertNumQueries(7):
+            stocks = StockLedger(self.tenant).apply(entries)
+
+        self.assertEqual(len(stocks), len(entries))
+        self.assertEqual(Stock.objects.get(pk=stocks[0].pk).quantity, 2)
+
+    def test_rows_are_found_by_the_identity_they_were_created_with(self):
+        item = self.get_or_create_item(1)
+        # Transfers send the source lot's identity, not the computed one
+        entry = self.entry(item, 5)._replace(stock_identity="source-lot")
+
+        created = StockLedger(self.tenant).apply([entry])[0]
+        again = StockLedger(self.tenant).apply([entry, self.entry(item, 1)])
+
+        self.assertEqual(created.stock_identity, self.entry(item, 0).stock_identity)
+        self.assertEqual([stock.pk for stock in again], [created.pk, created.pk])
+        self.assertEqual(Stock.objects.filter(item=item).count(), 1)
+        self.assertEqual(Stock.objects.get(pk=created.pk).quantity, 11)
+
+    def test_rows_inserted_concurrently_are_incremented(self):
+        item = self.get_or_create_item(1)
+        ledger = StockLedger(self.tenant)
+        entry = self.entry(item, 3)
+        # Inserted by another transaction after this one looked for it
+        other = ledger.apply([self.entry(item, 4)])[0]
+
+        stocks = ledger.create_rows({ledger.key(entry): entry})
+        ledger.update_rows(stocks, {ledger.key(entry): entry})
+
+        self.assertEqual(stocks[ledger.key(entry)].pk, other.pk)
+        self.assertEqual(Stock.objects.get(pk=other.pk).quantity, 7)
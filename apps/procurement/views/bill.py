@@ -9,11 +9,10 @@ from apps.accounts.permissions import GroupPermission
 from apps.procurement.models.bill import BillPay
 from apps.procurement.serializers.bill import BillPaySerializer, BillLineItemSerializer
 
-from apps.share.views import get_tenant_user, number_generate
+from apps.share.views import get_tenant_user
+from apps.share.services.document_sequence import document_sequence
 from apps.share.services.transaction_manager import TransactionManager
 
-from datetime import datetime
-
 
 class BillPayView(generics.ListCreateAPIView):
     """
@@ -46,13 +45,6 @@ class BillPayView(generics.ListCreateAPIView):
         """
         tenant = get_tenant_user(self).tenant
         data = request.data
-        try:
-            last_bill = tenant.billpay_base_models.last()
-            previous_number = last_bill.bill_num
-        except:
-            previous_number = f"PUR_BILL-{datetime.now().year}-{0}"
-
-        data["bill_num"] = number_generate(previous_number=previous_number)
         recpt = tenant.receipt_base_models.get(id=data["recpt"])
         bill = tenant.billpay_base_models.filter(recpt=recpt).last()
         new_paid = int(data["adv_amt"]) - bill.adv_amt
@@ -60,14 +52,21 @@ class BillPayView(generics.ListCreateAPIView):
         if serializer.is_valid():
             with transaction.atomic():
                 try:
+                    # Allocated in this transaction, so a failed create hands
+                    # the number back
+                    bill_num = document_sequence.next_number(
+                        tenant, "PUR_BILL", tenant.billpay_base_models, "bill_num"
+                    )
                     transaction_manage = TransactionManager(
-                        tenant=tenant, tran_number=data["bill_num"]
+                        tenant=tenant, tran_number=bill_num
                     )
 
                     transaction_manage.transaction_create_or_update(
                         tran_group=103, amount=new_paid, tran_type=1004, tran_head=2
                     )
-                    bill_pay = serializer.save(tenant=tenant, status=data["status"])
+                    bill_pay = serializer.save(
+                        tenant=tenant, status=data["status"], bill_num=bill_num
+                    )
                     pay_line_items = request.data["pays_line_items"]
                     for item in pay_line_items:
                         item["bill"] = bill_pay.id
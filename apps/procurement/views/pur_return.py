@@ -12,12 +12,11 @@ from apps.procurement.serializers.pur_return import (
 )
 from apps.procurement.models.pur_return import PurReturn
 
-from apps.share.views import get_tenant_user, number_generate
+from apps.share.views import get_tenant_user
+from apps.share.services.document_sequence import document_sequence
 from apps.share.services.stock_common import stock_exists
 from apps.share.services.transaction_manager import TransactionManager
 
-from datetime import datetime
-
 
 class PurReturnView(generics.ListCreateAPIView):
     """
@@ -50,19 +49,22 @@ class PurReturnView(generics.ListCreateAPIView):
         """
         tenant = get_tenant_user(self).tenant
         data = request.data
-        try:
-            last_pur_return = tenant.purreturn_base_models.last()
-            previous_number = last_pur_return.return_num
-        except:
-            previous_number = f"PUR_RET-{datetime.now().year}-{0}"
-
-        data["return_num"] = number_generate(previous_number=previous_number)
         serializer = self.get_serializer(data=data)
 
         if serializer.is_valid():
             with transaction.atomic():
                 try:
-                    pur_return = serializer.save(tenant=tenant)
+                    # Allocated in this transaction, so a failed create hands
+                    # the number back
+                    pur_return = serializer.save(
+                        tenant=tenant,
+                        return_num=document_sequence.next_number(
+                            tenant,
+                            "PUR_RET",
+                            tenant.purreturn_base_models,
+                            "return_num",
+                        ),
+                    )
                     for item in data["pur_return_line_items"]:
                         stock_exists(
                             tenant,
@@ -79,7 +81,7 @@ class PurReturnView(generics.ListCreateAPIView):
                             0,
                         )
                     transaction_manage = TransactionManager(
-                        tenant=tenant, tran_number=data["return_num"]
+                        tenant=tenant, tran_number=pur_return.return_num
                     )
 
                     transaction_manage.transaction_create_or_update(
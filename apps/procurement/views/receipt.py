@@ -6,8 +6,9 @@ from rest_framework.permissions import IsAuthenticated
 
 from apps.accounts.permissions import GroupPermission
 
-from apps.share.views import get_tenant_user, generate_stock_identity, number_generate
-from apps.share.services.stock_common import stock_exists_obj
+from apps.share.views import get_tenant_user, generate_stock_identity
+from apps.share.services.document_sequence import document_sequence
+from apps.share.services.stock_common import stock_exists_obj, stock_exists_objs
 
 from apps.procurement.models.receipt import Receipt, ReceiptLineItem
 from apps.procurement.serializers.receipt import (
@@ -16,8 +17,6 @@ from apps.procurement.serializers.receipt import (
 )
 from apps.procurement.serializers.bill import BillPaySerializer, BillLineItemSerializer
 
-from datetime import datetime
-
 
 class ReceiptView(generics.ListCreateAPIView):
     """
@@ -37,7 +36,9 @@ class ReceiptView(generics.ListCreateAPIView):
         """
         user_tenant = get_tenant_user(self)
         if user_tenant is not None:
-            receipt = user_tenant.tenant.receipt_base_models.all().exclude(status=2)
+            receipt = ReceiptSerializer.setup_eager_loading(
+                user_tenant.tenant.receipt_base_models.all().exclude(status=2)
+            )
             return receipt
         else:
             raise Exception("Permission Denied!")
@@ -65,39 +66,40 @@ class ReceiptView(generics.ListCreateAPIView):
         """
         tenant = get_tenant_user(self).tenant
         data = request.data
-        with transaction.atomic():
-            try:
-                last_recpt = tenant.receipt_base_models.last()
-                previous_number = last_recpt.recpt_num
-            except:
-                previous_number = f"PUR_REC-{datetime.now().year}-{0}"
-
-        recpt_num = number_generate(previous_number=previous_number)
         recvd_by = request.user
         serializer = self.get_serializer(data=data)
         if serializer.is_valid():
             with transaction.atomic():
                 try:
+                    # Numbers are allocated in this transaction, so a failed
+                    # create hands them back
                     recpt = serializer.save(
-                        tenant=tenant, recpt_num=recpt_num, recvd_by=recvd_by
+                        tenant=tenant,
+                        recpt_num=document_sequence.next_number(
+                            tenant, "PUR_REC", tenant.receipt_base_models, "recpt_num"
+                        ),
+                        recvd_by=recvd_by,
                     )
-                    try:
-                        last_bill = tenant.billpay_base_models.last()
-                        previous_number = last_bill.bill_num
-                    except:
-                        previous_number = f"PUR_RECPT-{datetime.now().year}-{0}"
                     bill_data = {
-                        "bill_num": number_generate(previous_number=previous_number),
                         "pay_method": 1,
                         "bill_amt": data["grand_total"],
                         "recpt": recpt.id,
                     }
                     bill_Pay_serializer = BillPaySerializer(data=bill_data)  # type: ignore
                     if bill_Pay_serializer.is_valid():
-                        bill_pay = bill_Pay_serializer.save(tenant=tenant)
+                        bill_pay = bill_Pay_serializer.save(
+                            tenant=tenant,
+                            bill_num=document_sequence.next_number(
+                                tenant,
+                                "PUR_RECPT",
+                                tenant.billpay_base_models,
+                                "bill_num",
+                            ),
+                        )
 
                     bill_pay_line_item_data = []
 
+                    stock_objs = []
                     for item in data["receipt_line_items"]:
                         item["reciept_identity"] = generate_stock_identity(
                             item["unit"],
@@ -105,8 +107,10 @@ class ReceiptView(generics.ListCreateAPIView):
                             item["per_pack_qty"],
                             item["exp_date"],
                         )
-                        stock_obj = self.stock_obj(data, item, recpt)
-                        stock_exists_obj(tenant, stock_obj, item["reciept_identity"])
+                        stock_objs.append(
+                            (self.stock_obj(data, item, recpt), item["reciept_identity"])
+                        )
+                    stock_exists_objs(tenant, stock_objs)
                     recpt_line_item_serializer = ReceiptLineItemSerializer(
                         data=data["receipt_line_items"], many=True
                     )
@@ -152,7 +156,7 @@ class ReceiptDetailsView(generics.RetrieveUpdateDestroyAPIView):
 
     def stock_obj(self, data, item, recpt):
         """
-        Create a stock object for stock_exists_obj function during update.
+        Create a stock object for stock_exists_objs during update.
         """
         obj = {
             "recvd_stock": data["source"],
@@ -183,18 +187,16 @@ class ReceiptDetailsView(generics.RetrieveUpdateDestroyAPIView):
                     for bill in bill_pays:
                         bill.bill_amt = request.data["grand_total"]
                         bill.save()
+                    stock_objs = []
                     for item in request.data["receipt_line_items"]:
-                        with transaction.atomic():
-                            try:
-                                if item["qtyCng"]:
-                                    stock_obj = self.stock_obj(
-                                        request.data, item, recpt
-                                    )
-                                    stock_exists_obj(
-                                        tenant, stock_obj, item["reciept_identity"]
-                                    )
-                            except KeyError:
-                                pass
+                        try:
+                            if item["qtyCng"]:
+                                stock_obj = self.stock_obj(request.data, item, recpt)
+                                stock_objs.append(
+                                    (stock_obj, item["reciept_identity"])
+                                )
+                        except KeyError:
+                            pass
 
                         r_item = receipt_item_objects.get(id=item["id"])
                         recpt_line_item_serializer = ReceiptLineItemSerializer(
@@ -203,6 +205,8 @@ class ReceiptDetailsView(generics.RetrieveUpdateDestroyAPIView):
 
                         if recpt_line_item_serializer.is_valid():
                             recpt_line_item_serializer.save()
+                    # Quantity changes of every line in one batch
+                    stock_exists_objs(tenant, stock_objs)
                 except Exception as e:
                     transaction.set_rollback(True)  # Rollback the transaction
                     return Response(
@@ -224,6 +228,7 @@ class ReceiptDetailsView(generics.RetrieveUpdateDestroyAPIView):
         bill_pays = receipt.bill_pays.all()
         with transaction.atomic():
             try:
+                stock_objs = []
                 for item in receipt_item_objects:
                     pays_line_item = item.pays_line_items.all()
                     obj = {
@@ -237,9 +242,10 @@ class ReceiptDetailsView(generics.RetrieveUpdateDestroyAPIView):
                         "per_pack_qty": item.per_pack_qty,
                         "uom": item.unit.id,
                     }
-                    stock_exists_obj(tenant, obj, item.reciept_identity)
+                    stock_objs.append((obj, item.reciept_identity))
                     pays_line_item.delete()
                     item.delete()
+                stock_exists_objs(tenant, stock_objs)
                 for bill in bill_pays:
                     bill.delete()
                 receipt.delete()
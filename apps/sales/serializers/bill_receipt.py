@@ -90,6 +90,8 @@ class BillReceiptSerializer(serializers.ModelSerializer):
             "pay_method",
             "bill_recpt_num",
         )
+        # Allocated by the document sequence on create
+        extra_kwargs = {"bill_recpt_num": {"required": False}}
 
     def to_representation(self, instance):
         """
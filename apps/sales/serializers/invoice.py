@@ -1,3 +1,5 @@
+from django.db.models import Prefetch
+
 from rest_framework import serializers
 
 from apps.sales.models.invoice import Invoice, InvoiceLineItem
@@ -63,12 +65,28 @@ class InvoiceSerializer(serializers.ModelSerializer):
             "due_amount",
             "invoice_line_items",
         )
+        # Allocated by the document sequence on create
+        extra_kwargs = {"inv_num": {"required": False}}
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Load everything the representation reads, so serializing any number
+        of invoices takes a constant number of queries.
+        """
+        return queryset.select_related("cust", "warehouse").prefetch_related(
+            Prefetch(
+                "invoice_line_items",
+                queryset=InvoiceLineItem.objects.select_related(
+                    "item__item", "unit"
+                ),
+            )
+        )
 
     def to_representation(self, instance):
         representation = super().to_representation(instance)
-        line_items = InvoiceLineItem.objects.filter(inv_id=instance.id)
-        serializer = InvoiceLineItemSerializer(line_items, many=True)
-        representation["line_items"] = serializer.data
+        # Kept for clients still reading the old key
+        representation["line_items"] = representation["invoice_line_items"]
 
         representation["customer_name"] = (
             instance.cust.customer_name if instance.cust else None
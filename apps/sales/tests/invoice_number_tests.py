@@ -0,0 +1,84 @@
+import threading
+import time
+from datetime import date, datetime
+
+from django.db import connection, transaction
+from django.test import TransactionTestCase
+
+from apps.clients.models import ClientModel
+from apps.inventories.models.warehouse import Warehouse
+from apps.sales.models.invoice import Invoice
+from apps.share.services.document_sequence import DocumentSequenceService
+
+
+class InvoiceNumberConcurrencyTestCase(TransactionTestCase):
+    threads = 16
+    invoices_per_thread = 10
+
+    def setUp(self):
+        # A request of a previous test left the tenant schema active
+        connection.set_schema_to_public()
+        self.tenant = ClientModel.objects.create(
+            tenant_name="Tenant 1", paid_until=date(2099, 1, 1)
+        )
+        self.warehouse = Warehouse.objects.create(
+            warehouse_name="Main", tenant=self.tenant
+        )
+        self.sequence = DocumentSequenceService()
+
+    def create_invoices(self, errors):
+        try:
+            for _ in range(self.invoices_per_thread):
+                with transaction.atomic():
+                    Invoice.objects.create(
+                        tenant=self.tenant,
+                        warehouse=self.warehouse,
+                        payment_method="Cash",
+                        inv_num=self.sequence.next_number(
+                            self.tenant,
+                            "INV",
+                            self.tenant.invoice_base_models,
+                            "inv_num",
+                        ),
+                    )
+        except Exception as e:
+            errors.append(e)
+        finally:
+            connection.close()
+
+    def test_concurrent_invoices_get_unique_gap_free_numbers(self):
+        errors = []
+        workers = [
+            threading.Thread(target=self.create_invoices, args=(errors,))
+            for _ in range(self.threads)
+        ]
+
+        started = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+
+        self.assertEqual(errors, [])
+        total = self.threads * self.invoices_per_thread
+        numbers = list(Invoice.objects.values_list("inv_num", flat=True))
+        year = datetime.now().year
+        self.assertEqual(len(set(numbers)), total)
+        expected = [f"INV-{year}-{count}" for count in range(1, total + 1)]
+        self.assertEqual(sorted(numbers), sorted(expected))
+        # Row locking serializes allocation, but must stay well above 10/s
+        self.assertGreater(total / elapsed, 10)
+
+    def test_rolled_back_create_hands_its_number_back(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                self.sequence.next_number(
+                    self.tenant, "INV", self.tenant.invoice_base_models, "inv_num"
+                )
+                raise RuntimeError
+
+        number = self.sequence.next_number(
+            self.tenant, "INV", self.tenant.invoice_base_models, "inv_num"
+        )
+        self.assertEqual(number, f"INV-{datetime.now().year}-1")
@@ -1,5 +1,8 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
+from apps.sales.models.invoice import Invoice, InvoiceLineItem
 from apps.share.test.base import BaseTestCase
 
 class InvoiceTestCase(BaseTestCase):
@@ -113,3 +116,53 @@ class InvoiceTestCase(BaseTestCase):
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         # Assert the invoice is deleted from the database
 
+
+
+class InvoiceQueryCountTestCase(BaseTestCase):
+    def create_invoices(self, count):
+        customer = self.get_or_create_customer(1)
+        warehouse = self.get_or_create_warehouse(1)
+        stock = self.get_or_create_stock(1)
+        invoice_count = Invoice.objects.count()
+        invoices = Invoice.objects.bulk_create(
+            Invoice(
+                tenant=self.tenant,
+                inv_num=f"INV-{invoice_count}-{number}",
+                cust=customer,
+                warehouse=warehouse,
+                total_amount=100,
+            )
+            for number in range(count)
+        )
+        InvoiceLineItem.objects.bulk_create(
+            InvoiceLineItem(
+                tenant=self.tenant, inv=invoice, item=stock, unit=stock.uom, qty=1
+            )
+            for invoice in invoices
+            for _ in range(2)
+        )
+
+    def list_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("invoice"), {"page_size": 100})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(queries)
+
+    def test_list_query_count_does_not_grow_with_invoices(self):
+        self.create_invoices(1)
+        _, single = self.list_queries()
+
+        self.create_invoices(499)
+        response, many = self.list_queries()
+
+        self.assertEqual(len(response.data["results"]), 100)
+        self.assertEqual(many, single)
+
+    def test_line_items_are_shared_between_keys(self):
+        self.create_invoices(1)
+
+        response, _ = self.list_queries()
+
+        invoice = response.data["results"][0]
+        self.assertEqual(len(invoice["invoice_line_items"]), 2)
+        self.assertEqual(invoice["line_items"], invoice["invoice_line_items"])
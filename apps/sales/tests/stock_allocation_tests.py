@@ -0,0 +1,63 @@
+from datetime import date, timedelta
+
+from apps.inventories.models.stock import Stock
+from apps.share.services.stock_allocation import InsufficientStock, StockAllocator
+from apps.share.test.base import BaseTestCase
+
+
+class StockAllocatorTestCase(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.warehouse = self.get_or_create_warehouse(1)
+        self.item = self.get_or_create_item(1)
+        self.uom = self.get_or_create_uom(1)
+
+    def create_lot(self, lot_number, quantity, days_to_expiry, item=None):
+        return Stock.objects.create(
+            tenant=self.tenant,
+            source=self.warehouse,
+            item=item or self.item,
+            uom=self.uom,
+            lot_number=lot_number,
+            quantity=quantity,
+            exp_date=date.today() + timedelta(days=days_to_expiry),
+        )
+
+    def line(self, qty, item=None):
+        return {"item_id": (item or self.item).id, "unit": self.uom.id, "qty": qty}
+
+    def test_line_is_split_across_lots_first_expiry_first(self):
+        late = self.create_lot("L2", 10, days_to_expiry=60)
+        early = self.create_lot("L1", 4, days_to_expiry=10)
+
+        plan = StockAllocator(self.tenant, self.warehouse.id).allocate([self.line(7)])
+
+        self.assertEqual(
+            [(lot["stock"], lot["qty"]) for lot in plan[0]["lots"]],
+            [(early.id, 4), (late.id, 3)],
+        )
+        early.refresh_from_db()
+        late.refresh_from_db()
+        self.assertEqual((early.quantity, late.quantity), (0, 7))
+
+    def test_short_stock_writes_nothing(self):
+        lot = self.create_lot("L1", 4, days_to_expiry=10)
+
+        with self.assertRaises(InsufficientStock):
+            StockAllocator(self.tenant, self.warehouse.id).allocate([self.line(5)])
+
+        lot.refresh_from_db()
+        self.assertEqual(lot.quantity, 4)
+
+    def test_query_count_does_not_grow_with_lines(self):
+        lines = []
+        for number in range(2, 12):
+            item = self.get_or_create_item(number)
+            self.create_lot(f"L{number}", 10, days_to_expiry=30, item=item)
+            lines.append(self.line(5, item=item))
+
+        # One locking SELECT for every candidate lot and one bulk UPDATE
+        with self.assertNumQueries(2):
+            plan = StockAllocator(self.tenant, self.warehouse.id).allocate(lines)
+
+        self.assertEqual(len(plan), len(lines))
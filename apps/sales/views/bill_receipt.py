@@ -12,12 +12,10 @@ from apps.sales.serializers.bill_receipt import (
     BillReceiptLineItemSerializer,
 )
 
-from apps.share.views import get_tenant_user, number_generate
 from apps.share.views import get_tenant_user
+from apps.share.services.document_sequence import document_sequence
 from apps.share.services.transaction_manager import TransactionManager
 
-from datetime import datetime
-
 
 class BillReceiptView(generics.ListCreateAPIView):
     """
@@ -51,43 +49,46 @@ class BillReceiptView(generics.ListCreateAPIView):
         """
         tenant = get_tenant_user(self).tenant
         data = request.data
-        try:
-            last_bill = tenant.billreceipt_base_models.last()
-            previous_number = last_bill.bill_recpt_num
-        except:
-            previous_number = f"SA_BILL-{datetime.now().year}-{0}"
-
-        data["bill_recpt_num"] = number_generate(previous_number=previous_number)
         inv = tenant.invoice_base_models.get(id=data["inv"])
 
         serializer = self.get_serializer(data=data)
         if serializer.is_valid():
-            # with transaction.atomic():
-            #     try:
-            bill_receipt = serializer.save(tenant=tenant)
-            bill_receipt_line_items = request.data["bill_receipt_line_items"]
-            for item in bill_receipt_line_items:
-                item["bill_receipt"] = bill_receipt.id
-            bill_line_item_serializer = BillReceiptLineItemSerializer(
-                data=bill_receipt_line_items, many=True
-            )
-
-            if bill_line_item_serializer.is_valid():
-                bill_line_item_serializer.save(tenant=tenant, bill_receipt=bill_receipt)
-
-            inv.status = data["status"]
-            inv.paid_amount += int(data["recpt_amt"])
-            inv.save()
-            transaction_manage = TransactionManager(
-                tenant=tenant, tran_number=bill_receipt.bill_recpt_num
-            )
+            # The number is allocated in the same transaction as the receipt
+            with transaction.atomic():
+                bill_receipt = serializer.save(
+                    tenant=tenant,
+                    bill_recpt_num=document_sequence.next_number(
+                        tenant,
+                        "SA_BILL",
+                        tenant.billreceipt_base_models,
+                        "bill_recpt_num",
+                    ),
+                )
+                bill_receipt_line_items = request.data["bill_receipt_line_items"]
+                for item in bill_receipt_line_items:
+                    item["bill_receipt"] = bill_receipt.id
+                bill_line_item_serializer = BillReceiptLineItemSerializer(
+                    data=bill_receipt_line_items, many=True
+                )
+
+                if bill_line_item_serializer.is_valid():
+                    bill_line_item_serializer.save(
+                        tenant=tenant, bill_receipt=bill_receipt
+                    )
 
-            transaction_manage.transaction_create_or_update(
-                tran_group=102,
-                amount=data["adv_amt"],
-                tran_type=1002,
-                tran_head=1,
-            )
+                inv.status = data["status"]
+                inv.paid_amount += int(data["recpt_amt"])
+                inv.save()
+                transaction_manage = TransactionManager(
+                    tenant=tenant, tran_number=bill_receipt.bill_recpt_num
+                )
+
+                transaction_manage.transaction_create_or_update(
+                    tran_group=102,
+                    amount=data["adv_amt"],
+                    tran_type=1002,
+                    tran_head=1,
+                )
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         # except Exception as e:
         #     transaction.set_rollback(True)  # Rollback the transaction
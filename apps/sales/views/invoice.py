@@ -12,12 +12,11 @@ from apps.sales.serializers.invoice import (
     InvoiceLineItemSerializer,
 )
 
-from apps.share.views import number_generate
+from apps.share.services.document_sequence import document_sequence
+from apps.share.services.stock_allocation import InsufficientStock, StockAllocator
 from apps.share.services.transaction_manager import TransactionManager
 from apps.share.views import get_tenant_user
 
-from datetime import date, datetime
-
 
 class InvoiceView(generics.ListCreateAPIView):
     queryset = Invoice
@@ -31,7 +30,9 @@ class InvoiceView(generics.ListCreateAPIView):
         user_tenant = get_tenant_user(self)
         if user_tenant is not None:
             tenant = user_tenant.tenant
-            invoice = tenant.invoice_base_models.all().order_by("-created_at")
+            invoice = InvoiceSerializer.setup_eager_loading(
+                tenant.invoice_base_models.all()
+            ).order_by("-created_at")
             return invoice
 
         else:
@@ -42,15 +43,6 @@ class InvoiceView(generics.ListCreateAPIView):
         data = request.data
 
         if tenant is not None:
-            try:
-                last_rec = tenant.invoice_base_models.last()
-                previous_number = last_rec.inv_num
-            except:
-                previous_number = f"INV-{datetime.now().year}-{0}"
-
-            inv_num = number_generate(previous_number)
-
-            data["inv_num"] = inv_num
             inv_line_items = request.data["inv_line_items"]
 
             serializer = self.get_serializer(data=data)
@@ -59,37 +51,31 @@ class InvoiceView(generics.ListCreateAPIView):
                 with transaction.atomic():
                     try:
                         ## Creating Invoice
-                        inv = serializer.save(tenant=tenant)
+                        # Allocated in this transaction, so a failed create
+                        # hands the number back
+                        inv = serializer.save(
+                            tenant=tenant,
+                            inv_num=document_sequence.next_number(
+                                tenant, "INV", tenant.invoice_base_models, "inv_num"
+                            ),
+                        )
                         warehouse_id = data["warehouse"]
 
                         for items in inv_line_items:
                             items["inv"] = inv.id
-                            item_id = items["item_id"]
-                            uom_id = items["unit"]
-                            qty = items["qty"]
-
-                            current_date = date.today()
-                            item_stocks = (
-                                tenant.stock_base_models.filter(
-                                    item=item_id,
-                                    uom=uom_id,
-                                    source=warehouse_id,
-                                    quantity__gte=qty,
-                                    exp_date__gte=current_date,
-                                )
-                                .order_by("exp_date")
-                                .first()
-                            )
-                            print(item_stocks)
 
-                            if item_stocks:
-                                item_stocks.quantity = item_stocks.quantity - float(qty)
-                                item_stocks.save()
-                            else:
-                                return Response(
-                                    "Item Stock Not Found",
-                                    status=status.HTTP_404_NOT_FOUND,
-                                )
+                        # Allocates every line first-expiry-first-out, locking
+                        # the lots it draws from
+                        try:
+                            allocation_plan = StockAllocator(
+                                tenant, warehouse_id
+                            ).allocate(inv_line_items)
+                        except InsufficientStock:
+                            transaction.set_rollback(True)
+                            return Response(
+                                "Item Stock Not Found",
+                                status=status.HTTP_404_NOT_FOUND,
+                            )
 
                         inv_line_item_serializer = InvoiceLineItemSerializer(
                             data=inv_line_items, many=True
@@ -134,7 +120,9 @@ class InvoiceView(generics.ListCreateAPIView):
 
                         inv.save()
 
-                        return Response(serializer.data, status=status.HTTP_201_CREATED)
+                        response_data = dict(serializer.data)
+                        response_data["allocation_plan"] = allocation_plan
+                        return Response(response_data, status=status.HTTP_201_CREATED)
                     except Exception as e:
                         transaction.set_rollback(True)  # Rollback the transaction
                         return Response(
@@ -156,7 +144,9 @@ class InvoiceDetailsView(generics.RetrieveUpdateDestroyAPIView):
 
     def get_object(self):
         invoice_id = self.kwargs.get("pk")
-        invoice = self.queryset.objects.get(id=invoice_id)
+        invoice = InvoiceSerializer.setup_eager_loading(self.queryset.objects).get(
+            id=invoice_id
+        )
         return invoice
 
     def perform_update(self, serializer):
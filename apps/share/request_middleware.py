@@ -12,6 +12,9 @@ class RequestMiddleware:
     def __call__(self, request):
         # Store the request object in the thread-local storage
         request_local.request = request
-        response = self.get_response(request)
-        return response
+        try:
+            return self.get_response(request)
+        finally:
+            # Saves made later on this thread must not see a finished request
+            request_local.request = None
 
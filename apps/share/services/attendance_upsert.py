@@ -0,0 +1,105 @@
+from datetime import datetime
+
+from rest_framework import serializers
+
+from apps.hr.models.attendance import Attendance
+from apps.share.request_middleware import request_local
+
+
+class AttendanceLineSerializer(serializers.Serializer):
+    """
+    One employee's line of a daily attendance sheet. The employee is checked
+    for the whole sheet at once by AttendanceUpsert.
+    """
+
+    employee = serializers.IntegerField()
+    attend_status = serializers.ChoiceField(
+        choices=Attendance.ATTEND_STATUS, allow_null=True
+    )
+    time = serializers.CharField(max_length=164, allow_blank=True, default="")
+    comment = serializers.CharField(
+        max_length=200, allow_blank=True, allow_null=True, required=False
+    )
+
+
+class AttendanceUpsert:
+    """
+    Save a tenant's attendance sheet for one day in a single statement.
+
+    All lines are validated together, including one query for the employees,
+    and written with ``INSERT ... ON CONFLICT (tenant, employee, date) DO
+    UPDATE``. Lines without an ``attend_status`` are skipped, as before.
+
+    Methods:
+        validate(lines): Return (valid lines, errors).
+        save(lines, day, week): Upsert the lines and return the day's rows.
+    """
+
+    update_fields = [
+        "attend_status",
+        "time",
+        "comment",
+        "week",
+        "edited_at",
+        "updated_by",
+    ]
+
+    def __init__(self, tenant):
+        self.tenant = tenant
+
+    def validate(self, lines):
+        serializer = AttendanceLineSerializer(data=lines, many=True)
+        if not serializer.is_valid():
+            return [], serializer.errors
+
+        lines = [line for line in serializer.validated_data if line["attend_status"]]
+        known = set(
+            self.tenant.employee_base_models.filter(
+                id__in={line["employee"] for line in lines}
+            ).values_list("id", flat=True)
+        )
+        # Errors line up with the submitted lines, like a many=True serializer
+        errors = [
+            {"employee": ["Invalid employee."]}
+            if line["attend_status"] and line["employee"] not in known
+            else {}
+            for line in serializer.validated_data
+        ]
+        if any(errors):
+            return [], errors
+        return lines, None
+
+    def save(self, lines, day, week):
+        # One row per employee and day, stored at midnight
+        day = datetime.combine(day.date(), datetime.min.time())
+        # A row can only be upserted once per statement; the last line wins
+        lines = list({line["employee"]: line for line in lines}.values())
+        request = getattr(request_local, "request", None)
+        user = getattr(request, "user", None)
+        if user is not None and not user.is_authenticated:
+            user = None
+
+        Attendance.objects.bulk_create(
+            [
+                Attendance(
+                    tenant=self.tenant,
+                    employee_id=line["employee"],
+                    date=day,
+                    week=week,
+                    attend_status=line["attend_status"],
+                    time=line["time"],
+                    comment=line.get("comment"),
+                    created_by=user,
+                    updated_by=user,
+                )
+                for line in lines
+            ],
+            update_conflicts=True,
+            unique_fields=["tenant", "employee", "date"],
+            update_fields=self.update_fields,
+        )
+        return Attendance.objects.filter(
+            tenant=self.tenant,
+            date=day,
+            employee_id__in=[line["employee"] for line in lines],
+        ).select_related("employee")
@@ -0,0 +1,35 @@
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def get_cache_version(key):
+    """
+    Return the cache version stored under ``key``.
+
+    The version is seeded from the clock so that an evicted version key never
+    falls back to a value that older cache entries were stored under.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, int(time.time() * 1000), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_cache_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, int(time.time() * 1000), timeout=None)
+
+
+def invalidate_cache_version(key):
+    """
+    Bump the cache version under ``key`` now and again once the current
+    transaction commits: a reader loading rows before the commit caches the
+    old ones under the first bump.
+    """
+    bump_cache_version(key)
+    transaction.on_commit(lambda: bump_cache_version(key))
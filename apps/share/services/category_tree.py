@@ -0,0 +1,103 @@
+from django.core.cache import cache
+
+from apps.inventories.models.category import Category
+from apps.inventories.serializers.category import CategoryByIdSerializer
+from apps.share.services.cache_version import (
+    get_cache_version,
+    invalidate_cache_version,
+)
+
+CATEGORY_TREE_VERSION_KEY = "category_tree:{tenant_id}:version"
+CATEGORY_TREE_CACHE_KEY = "category_tree:{tenant_id}:{version}"
+CATEGORY_TREE_CACHE_TIMEOUT = 60 * 60
+
+# Field order of CategorySerializer, which the tree keeps
+TREE_FIELDS = (
+    "id",
+    "category_name",
+    "descr",
+    "inv_categories",
+    "category_code",
+    "created_at",
+    "edited_at",
+    "cat_parent",
+    "cat_parent_name",
+)
+
+
+def get_category_tree_version(tenant_id):
+    """
+    Return the current category tree cache version of a tenant.
+    """
+    return get_cache_version(CATEGORY_TREE_VERSION_KEY.format(tenant_id=tenant_id))
+
+
+def invalidate_category_tree(tenant_id):
+    """
+    Invalidate a tenant's cached category tree by bumping its version, now
+    and on commit.
+    """
+    invalidate_cache_version(CATEGORY_TREE_VERSION_KEY.format(tenant_id=tenant_id))
+
+
+class CategoryTree:
+    """
+    A tenant's category tree, loaded with one query and assembled in memory.
+
+    The cache holds the flat adjacency list, every category serialized once
+    in creation order with its parent id; the nested tree is linked from it by
+    reference, so any depth costs no queries and no recursion. Category saves
+    and deletes bump the tenant's cache version, see
+    ``apps.inventories.signals``.
+
+    Methods:
+        nodes(tenant): The cached adjacency list.
+        tree(tenant): The nested root categories, as CategorySerializer
+            represents them.
+    """
+
+    def load(self, tenant):
+        categories = (
+            Category.objects.filter(tenant=tenant)
+            .select_related("cat_parent")
+            .order_by("created_at", "id")
+        )
+        return list(CategoryByIdSerializer(categories, many=True).data)
+
+    def nodes(self, tenant):
+        key = CATEGORY_TREE_CACHE_KEY.format(
+            tenant_id=tenant.id, version=get_category_tree_version(tenant.id)
+        )
+        nodes = cache.get(key)
+        if nodes is None:
+            nodes = self.load(tenant)
+            cache.set(key, nodes, CATEGORY_TREE_CACHE_TIMEOUT)
+        return nodes
+
+    def tree(self, tenant):
+        nodes = {}
+        for node in self.nodes(tenant):
+            # The serializer leaves out fields a node has none of, e.g. the
+            # parent name of a root
+            tree_node = {}
+            for field in TREE_FIELDS:
+                if field == "inv_categories":
+                    tree_node[field] = []
+                elif field in node:
+                    tree_node[field] = node[field]
+            nodes[node["id"]] = tree_node
+
+        roots = []
+        for node in nodes.values():
+            if node["cat_parent"] is None:
+                roots.append(node)
+            elif node["cat_parent"] in nodes:
+                nodes[node["cat_parent"]]["inv_categories"].append(node)
+
+        # Children with fewer subcategories first, as CategorySerializer sorts
+        for node in nodes.values():
+            node["inv_categories"].sort(key=lambda child: len(child["inv_categories"]))
+        return roots
+
+
+category_tree = CategoryTree()
@@ -1,6 +1,212 @@
-from rest_framework.pagination import PageNumberPagination
+import base64
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class CustomPageNumberPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
     max_page_size = 100  # Maximum number of items per page
+
+
+class KeysetPagination(BasePagination):
+    """
+    Default list pagination: newest first, keyed on ``(created_at, id)``.
+
+    Each page is fetched with ``WHERE (created_at, id) < cursor ORDER BY
+    created_at DESC, id DESC LIMIT n``, so any page costs the same index range
+    scan with no ``COUNT(*)`` or ``OFFSET``. Responses carry opaque ``next``
+    and ``previous`` cursor links.
+
+    Clients sending ``?page=`` keep the old page number mode and response
+    shape, served by CustomPageNumberPagination. Lists of rows already in
+    memory are paged the same way without a query.
+    """
+
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    page_query_param = 'page'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_number_pagination = None
+        if self.uses_page_numbers(request):
+            self.page_number_pagination = CustomPageNumberPagination()
+            return self.page_number_pagination.paginate_queryset(
+                queryset, request, view
+            )
+
+        self.page_size = self.get_page_size(request)
+        position, reverse = self.decode_cursor(request)
+
+        if isinstance(queryset, list):
+            # Rows already in memory, e.g. read from a cache
+            self.has_created_at = all(
+                self.row_position(row)[0] is not None for row in queryset
+            )
+            results = self.paginate_list(queryset, position, reverse)
+        else:
+            self.has_created_at = self.model_has_field(queryset.model, 'created_at')
+            if position is not None:
+                queryset = queryset.filter(self.after(position, reverse))
+            queryset = queryset.order_by(*self.ordering(reverse))
+            results = list(queryset[:self.page_size + 1])
+
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+
+        # Moving backwards, more rows means a previous page; forwards, a next one
+        has_next = has_more if not reverse else position is not None
+        has_previous = has_more if reverse else position is not None
+        self.next_position = self.position(results[-1]) if has_next and results else None
+        self.previous_position = (
+            self.position(results[0]) if has_previous and results else None
+        )
+        return results
+
+    def uses_page_numbers(self, request):
+        return self.page_query_param in request.query_params
+
+    def get_paginated_response(self, data):
+        if self.page_number_pagination is not None:
+            return self.page_number_pagination.get_paginated_response(data)
+        return Response(OrderedDict([
+            ('next', self.get_link(self.next_position, reverse=False)),
+            ('previous', self.get_link(self.previous_position, reverse=True)),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': name,
+                'required': False,
+                'in': 'query',
+                'description': description,
+                'schema': {'type': type_},
+            }
+            for name, description, type_ in (
+                (self.cursor_query_param, 'The pagination cursor value.', 'string'),
+                (self.page_size_query_param, 'Number of results to return per page.', 'integer'),
+                (self.page_query_param, 'Opt in to page number pagination.', 'integer'),
+            )
+        ]
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(page_size, 1), self.max_page_size)
+
+    @staticmethod
+    def model_has_field(model, name):
+        try:
+            model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return False
+        return True
+
+    def ordering(self, reverse):
+        fields = ['created_at', 'id'] if self.has_created_at else ['id']
+        return fields if reverse else [f'-{field}' for field in fields]
+
+    @staticmethod
+    def row_position(instance):
+        # Rows of a values() queryset are dicts
+        if isinstance(instance, dict):
+            return instance.get('created_at'), instance['id']
+        return getattr(instance, 'created_at', None), instance.pk
+
+    def position(self, instance):
+        created_at, pk = self.row_position(instance)
+        if self.has_created_at:
+            return [created_at.isoformat(), pk]
+        return [None, pk]
+
+    def paginate_list(self, rows, position, reverse):
+        """
+        The same page as ``after`` and ``ordering`` select from a queryset,
+        taken from a list.
+        """
+        def key(row):
+            created_at, pk = self.row_position(row)
+            return (created_at, pk) if self.has_created_at else (pk,)
+
+        rows = sorted(rows, key=key, reverse=not reverse)
+        if position is not None:
+            bound = tuple(position) if self.has_created_at else (position[1],)
+            rows = [
+                row for row in rows
+                if (key(row) > bound if reverse else key(row) < bound)
+            ]
+        return rows[:self.page_size + 1]
+
+    def after(self, position, reverse):
+        created_at, pk = position
+        lookup = 'gt' if reverse else 'lt'
+        if not self.has_created_at:
+            return Q(**{f'id__{lookup}': pk})
+        # The inclusive bound alone lets the (tenant, created_at, id) index
+        # range scan serve the page in order; the OR only trims the tie
+        return Q(**{f'created_at__{lookup}e': created_at}) & (
+            Q(**{f'created_at__{lookup}': created_at}) | Q(**{f'id__{lookup}': pk})
+        )
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            created_at, pk = cursor['p']
+            if created_at is not None:
+                created_at = parse_datetime(created_at)
+                if created_at is None:
+                    raise ValueError
+            return [created_at, int(pk)], bool(cursor.get('r'))
+        except (TypeError, ValueError, KeyError):
+            raise NotFound('Invalid cursor')
+
+    def get_link(self, position, reverse):
+        if position is None:
+            return None
+        cursor = {'p': position}
+        if reverse:
+            cursor['r'] = 1
+        encoded = base64.urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+        url = remove_query_param(self.request.build_absolute_uri(), self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, encoded)
+
+
+class PageNumberKeysetPagination(KeysetPagination):
+    """
+    Page number pagination unless the client asks for a ``?cursor=``.
+
+    For lists whose clients rely on the page number response shape and its
+    count; the first cursor page is requested with an empty ``?cursor=``.
+    """
+
+    def uses_page_numbers(self, request):
+        return self.cursor_query_param not in request.query_params
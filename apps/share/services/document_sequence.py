@@ -0,0 +1,133 @@
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django_tenants.utils import schema_context
+
+from apps.client_admin.models import DocumentSequence
+
+
+def last_sequence_value(queryset, field, prefix, year):
+    """
+    Return the highest count already used in ``<prefix>-<year>-<count>``
+    numbers of ``field``, used to seed a sequence created over existing data.
+    """
+    head = f"{prefix}-{year}-"
+    last_value = 0
+    numbers = queryset.filter(**{f"{field}__startswith": head}).values_list(
+        field, flat=True
+    )
+    for number in numbers:
+        count = number[len(head):]
+        if count.isdigit():
+            last_value = max(last_value, int(count))
+    return last_value
+
+
+class DocumentSequenceService:
+    """
+    Per-tenant, per-prefix, per-year document number allocator.
+
+    Each allocation locks the ``DocumentSequence`` row with SELECT ... FOR
+    UPDATE and bumps ``last_value``. Called inside the transaction that saves
+    the document, concurrent creates queue on the row lock and a rolled back
+    create hands its number back, so numbers are unique and gap-free.
+
+    A sequence created for the first time is seeded from the numbers already
+    stored on the document model.
+
+    Methods:
+        reserve(tenant, prefix, seed, count, yearly): Allocate ``count`` values.
+        next_value(tenant, prefix, seed, yearly): Allocate one value.
+        next_number(tenant, prefix, queryset, field): Allocate one
+            ``<prefix>-<year>-<count>`` document number.
+    """
+
+    def reserve(self, tenant, prefix, seed, count=1, yearly=True):
+        year = datetime.now().year if yearly else 0
+        with transaction.atomic():
+            sequences = DocumentSequence.objects.select_for_update()
+            sequence = sequences.filter(tenant=tenant, prefix=prefix, year=year).first()
+            if sequence is None:
+                sequence, _ = sequences.get_or_create(
+                    tenant=tenant,
+                    prefix=prefix,
+                    year=year,
+                    defaults={"last_value": seed(year)},
+                )
+
+            first = sequence.last_value + 1
+            last_value = sequence.last_value + count
+            DocumentSequence.objects.filter(pk=sequence.pk).update(
+                last_value=last_value
+            )
+        return year, range(first, last_value + 1)
+
+    def next_value(self, tenant, prefix, seed, yearly=True):
+        year, values = self.reserve(tenant, prefix, seed, yearly=yearly)
+        return year, values[0]
+
+    def next_number(self, tenant, prefix, queryset, field):
+        year, value = self.next_value(
+            tenant,
+            prefix,
+            lambda year: last_sequence_value(queryset, field, prefix, year),
+        )
+        return f"{prefix}-{year}-{value}"
+
+
+class PreallocatedDocumentSequence(DocumentSequenceService):
+    """
+    Document sequence that reserves blocks of numbers per worker process.
+
+    A block of ``block_size`` values is reserved on a dedicated connection and
+    committed straight away, then handed out from memory, so creates no longer
+    wait on the sequence row lock. Numbers stay unique but are no longer
+    gap-free or strictly in creation order across workers: unused numbers of
+    a block are lost when the process exits, and rolled back creates do not
+    return theirs.
+
+    Enabled with ``DOCUMENT_SEQUENCE_BLOCK_SIZE`` greater than 1.
+    """
+
+    def __init__(self, block_size):
+        self.block_size = block_size
+        self._blocks = {}
+        self._lock = threading.Lock()
+        # Reservations must commit independently of the caller's transaction
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="document-sequence"
+        )
+
+    def _reserve_block(self, tenant, prefix, seed, yearly):
+        try:
+            # The worker's connection starts on the public schema
+            with schema_context(tenant.schema_name):
+                return super().reserve(tenant, prefix, seed, self.block_size, yearly)
+        finally:
+            close_old_connections()
+
+    def next_value(self, tenant, prefix, seed, yearly=True):
+        year = datetime.now().year if yearly else 0
+        key = (tenant.pk, prefix, year)
+        with self._lock:
+            block = self._blocks.setdefault(key, deque())
+            if not block:
+                _, values = self._executor.submit(
+                    self._reserve_block, tenant, prefix, seed, yearly
+                ).result()
+                block.extend(values)
+            return year, block.popleft()
+
+
+def build_document_sequence():
+    block_size = getattr(settings, "DOCUMENT_SEQUENCE_BLOCK_SIZE", 1)
+    if block_size > 1:
+        return PreallocatedDocumentSequence(block_size)
+    return DocumentSequenceService()
+
+
+document_sequence = build_document_sequence()
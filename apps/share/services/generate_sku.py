@@ -0,0 +1,82 @@
+from apps.inventories.models.brand import Brand
+from apps.inventories.models.category import Category
+from apps.share.services.generate_short_name import generate_short_name
+from apps.share.services.master_data import master_data
+
+_UNRESOLVED = object()
+
+
+class GenerateSku:
+    """
+    Helper class to generate SKU based on item attributes.
+
+    Callers creating many variants of one item pass the already resolved
+    ``category_code`` and ``brand_code``, so no lookup runs per variant.
+    """
+
+    def __init__(
+        self,
+        item_title,
+        tenant,
+        category_id,
+        brand_id,
+        attributes,
+        category_code=_UNRESOLVED,
+        brand_code=_UNRESOLVED,
+    ):
+        self.tenant = tenant
+        self.item_title = item_title
+        self.category_id = category_id
+        self.brand_id = brand_id
+        self.attributes = attributes
+        self.category_code = category_code
+        self.brand_code = brand_code
+
+    # Methods to generate parts of the SKU
+    def get_item_title_short_name(self):
+        short_name = generate_short_name(self.item_title)
+        return short_name
+
+    def get_category_short_name(self):
+        if self.category_code is not _UNRESOLVED:
+            return self.category_code or "NA"
+        category = master_data.get(Category, self.tenant, self.category_id)
+        if category:
+            category_code = category.category_code
+            return category_code
+        else:
+            return "NA"
+
+    def get_brand_code(self):
+        if self.brand_code is not _UNRESOLVED:
+            return self.brand_code or "NA"
+        brand = master_data.get(Brand, self.tenant, self.brand_id)
+        return brand.brand_code if brand else "NA"
+
+    def get_attribute(self):
+        joined_short_name = ""
+        for attribute in self.attributes.get("attribute_list", []):
+            short_name = generate_short_name(attribute.get("value", ""))
+            joined_short_name += "-" + short_name
+        return joined_short_name
+
+    # Generate the final SKU
+    def generate_sku(self):
+        item_title_short_name = self.get_item_title_short_name()
+        category_short_name = self.get_category_short_name()
+        brand_short_name = self.get_brand_code()
+        attribute = self.get_attribute()
+
+        # Check if any component is "None" and exclude it from the SKU
+        components = [
+            item_title_short_name,
+            category_short_name,
+            brand_short_name,
+            attribute,
+        ]
+        filtered_components = [comp for comp in components if comp and comp != "NA"]
+
+        # Join the non-"None" components with "-"
+        sku = "-".join(filtered_components)
+
+        return sku
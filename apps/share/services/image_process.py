@@ -1,14 +1,131 @@
-from PIL import Image, ImageOps
+import math
+import os
 from io import BytesIO
+
+from PIL import Image, ImageOps
 from django.core.files.base import ContentFile
-from django.core.files.storage import default_storage as storage
+from django.core.files.storage import default_storage
 from apps.share.services.tenant_error_logger import TenantLogger
 from apps.share.request_middleware import request_local
 
+# Longest side of each responsive rendition; None keeps the budgeted full size
+RESPONSIVE_SIZES = {"thumbnail": 200, "full": None}
+
+MIN_QUALITY = 30
+MAX_QUALITY = 95
+# Longest side of the proxy used to search the quality
+PROXY_SIZE = 256
+# Quality the first downscale is sized for
+BASE_QUALITY = 85
+# JPEG sources are decoded straight at (at least) this size via DCT scaling
+DECODE_SIZE = 1024
+# Re-encodes allowed when the proxy estimate misses the budget
+MAX_CORRECTIONS = 3
+
+
+def rendition_path(s3_path, name):
+    """
+    Return the storage path of a responsive rendition of ``s3_path``.
+    """
+    if name == "full":
+        return s3_path
+    root, ext = os.path.splitext(s3_path)
+    return f"{root}_{name}{ext}"
+
+
+def _encode(image, quality, format):
+    buffer = BytesIO()
+    image.save(buffer, format=format, quality=quality, optimize=True)
+    return buffer.getvalue()
+
+
+def _resize(image, scale):
+    if scale >= 1:
+        return image
+    size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+    return image.resize(size, Image.LANCZOS, reducing_gap=2.0)
+
+
+def _search_quality(proxy, budget_per_pixel, format):
+    # Binary search the highest quality whose proxy bytes per pixel fit
+    low, high = MIN_QUALITY, MAX_QUALITY
+    best = MIN_QUALITY
+    while low <= high:
+        quality = (low + high) // 2
+        bytes_per_pixel = len(_encode(proxy, quality, format)) / (
+            proxy.width * proxy.height
+        )
+        if bytes_per_pixel <= budget_per_pixel:
+            best = quality
+            low = quality + 1
+        else:
+            high = quality - 1
+    return best
+
+
+def encode_image(image_file, target_size_kb=55, format="JPEG", sizes=RESPONSIVE_SIZES):
+    """
+    Encode an image into size-targeted responsive renditions in one decode.
+
+    The image is decoded (JPEGs at a reduced scale), EXIF-transposed and
+    converted to RGB once. A small
+    proxy gives the bytes per pixel of the image at ``BASE_QUALITY``, from
+    which the full rendition is downscaled (keeping the aspect ratio) so its
+    pixel count fits the byte budget. The JPEG quality is then binary-searched
+    on the proxy instead of re-encoding the full image. Only if the proxy
+    estimate misses the budget is the full image shrunk and re-encoded.
+
+    Returns a dict mapping each name in ``sizes`` to the encoded bytes, or None
+    if the budget cannot be met.
+    """
+    target_bytes = target_size_kb * 1024
+    with Image.open(image_file) as source:
+        # No budget needs the full sensor resolution, so skip decoding it
+        source.draft("RGB", (DECODE_SIZE, DECODE_SIZE))
+        image = ImageOps.exif_transpose(source).convert("RGB")
+
+    proxy = image.copy()
+    proxy.thumbnail((PROXY_SIZE, PROXY_SIZE))
+    bytes_per_pixel = len(_encode(proxy, BASE_QUALITY, format)) / (
+        proxy.width * proxy.height
+    )
+    pixels = image.width * image.height
+    image = _resize(image, math.sqrt(target_bytes / (pixels * bytes_per_pixel)))
 
-def image_processing(s3_path, target_size_kb=55, format="JPEG"):
-    request = getattr(request_local, "request", None)
-    tenant_logger = TenantLogger(request)
+    quality = _search_quality(
+        proxy, target_bytes / (image.width * image.height), format
+    )
+
+    full = _encode(image, quality, format)
+    for _ in range(MAX_CORRECTIONS):
+        if len(full) <= target_bytes:
+            break
+        image = _resize(image, math.sqrt(target_bytes / len(full)) * 0.95)
+        full = _encode(image, quality, format)
+    else:
+        if len(full) > target_bytes:
+            return None
+
+    renditions = {}
+    for name, max_side in sizes.items():
+        if max_side is None:
+            renditions[name] = full
+        else:
+            rendition = image.copy()
+            rendition.thumbnail((max_side, max_side))
+            renditions[name] = _encode(rendition, quality, format)
+    return renditions
+
+
+def image_processing(
+    s3_path, target_size_kb=55, format="JPEG", storage=None, tenant_logger=None
+):
+    # Background workers pass their own storage and tenant logger, since there
+    # is no request to build a TenantLogger from
+    storage = storage or default_storage
+    if tenant_logger is None:
+        request = getattr(request_local, "request", None)
+        tenant_logger = TenantLogger(request)
     # Validate input parameters
     if target_size_kb <= 0:
         raise ValueError("Target size must be greater than zero.")
@@ -20,43 +137,22 @@ def image_processing(s3_path, target_size_kb=55, format="JPEG"):
         tenant_logger.error(f"File not found at S3 path: {s3_path}")
         return None
 
-    processed_image = Image.open(image_file)
-
-    max_quality = 95  # Adjust as needed
-    size = 1000
-
-    # Initialize variables
-    quality = max_quality
-
-    # Define the maximum number of optimization iterations
-    max_iterations = 20
+    with image_file:
+        renditions = encode_image(image_file, target_size_kb, format)
 
-    for iteration in range(max_iterations):
-        buffer = BytesIO()
-
-        # Convert the image to RGB mode before saving as JPEG
-        rgb_image = ImageOps.exif_transpose(processed_image.convert("RGB"))
-
-        rgb_image.save(buffer, format=format, quality=quality)
-        image_size_kb = len(buffer.getvalue()) / 1024
-
-        if image_size_kb <= target_size_kb:
-            # Overwrite the original image in S3
-            try:
-                storage.delete(s3_path)
-                storage.save(s3_path, ContentFile(buffer.getvalue()))
-                return s3_path  # Return the path of the overwritten image in S3
-            except Exception as e:
-                tenant_logger.error(f"Error saving image to S3: {e}")
-                return None
-        else:
-            processed_image = processed_image.resize((size, size))
-            size -= 100
-
-        # Reduce quality for the next iteration
-        quality -= 5  # You can adjust this step size as needed
+    if renditions is None:
+        tenant_logger.error(
+            "Maximum optimization iterations reached. Target size not achieved."
+        )
+        return None
 
-    tenant_logger.error(
-        "Maximum optimization iterations reached. Target size not achieved."
-    )
-    return None
\ No newline at end of file
+    # Overwrite the original image and store the other renditions beside it
+    try:
+        for name, content in renditions.items():
+            path = rendition_path(s3_path, name)
+            storage.delete(path)
+            storage.save(path, ContentFile(content))
+        return s3_path  # Return the path of the overwritten image in S3
+    except Exception as e:
+        tenant_logger.error(f"Error saving image to S3: {e}")
+        return None
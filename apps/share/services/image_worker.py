@@ -0,0 +1,111 @@
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+from django_tenants.utils import get_public_schema_name, schema_context
+
+from apps.share.services.image_process import image_processing
+from apps.share.services.server_logger import ServerLogger
+from apps.share.services.tenant_log_registry import tenant_log_registry
+
+IMAGE_STATUS_PENDING = "pending"
+IMAGE_STATUS_PROCESSING = "processing"
+IMAGE_STATUS_DONE = "done"
+IMAGE_STATUS_FAILED = "failed"
+
+IMAGE_STATUS_CHOICES = [
+    (IMAGE_STATUS_PENDING, "Pending"),
+    (IMAGE_STATUS_PROCESSING, "Processing"),
+    (IMAGE_STATUS_DONE, "Done"),
+    (IMAGE_STATUS_FAILED, "Failed"),
+]
+
+
+class ImageProcessingPool:
+    """
+    Bounded worker pool that recompresses uploaded images off the request.
+
+    Jobs are submitted once the surrounding transaction commits. A worker runs
+    ``image_processing`` against ``storage`` and records the outcome in the
+    ``image_status`` field of the model row, which clients poll to know when
+    the optimized image is available.
+
+    Worker threads open their own connection, which starts on the public
+    schema, so each job runs in its tenant's schema. A job that fails
+    outright is logged to the server error log.
+
+    With ``max_workers=0`` jobs run inline in the calling thread.
+
+    Methods:
+        submit(model, pk, path, tenant): Queue an image for processing.
+        process(model, pk, path, tenant): Process an image in the current thread.
+        shutdown(): Wait for the running jobs and stop the workers.
+    """
+
+    image_field = "item_image"
+
+    def __init__(self, max_workers=2, storage=None):
+        self.max_workers = max_workers
+        self.storage = storage or default_storage
+        self._executor = None
+        if max_workers:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="image-processing"
+            )
+
+    def submit(self, model, pk, path, tenant):
+        transaction.on_commit(lambda: self._dispatch(model, pk, path, tenant))
+
+    def _dispatch(self, model, pk, path, tenant):
+        if self._executor is None:
+            self.process(model, pk, path, tenant)
+        else:
+            future = self._executor.submit(self._run, model, pk, path, tenant)
+            future.add_done_callback(self._log_failure)
+
+    def _run(self, model, pk, path, tenant):
+        schema_name = (
+            tenant.schema_name if tenant is not None else get_public_schema_name()
+        )
+        try:
+            with schema_context(schema_name):
+                return self.process(model, pk, path, tenant)
+        finally:
+            close_old_connections()
+
+    @staticmethod
+    def _log_failure(future):
+        error = future.exception()
+        if error is not None:
+            ServerLogger().error(f"Image processing job failed: {error!r}")
+
+    def process(self, model, pk, path, tenant):
+        rows = model.objects.filter(pk=pk, **{self.image_field: path})
+        rows.update(image_status=IMAGE_STATUS_PROCESSING)
+
+        tenant_logger = tenant_log_registry.get_logger(tenant)
+        try:
+            result = image_processing(
+                path, storage=self.storage, tenant_logger=tenant_logger
+            )
+        except Exception as e:
+            tenant_logger.error(f"Error processing image {path}: {e}")
+            result = None
+
+        # Filtering on the path leaves the row alone if a newer upload replaced it
+        rows.update(
+            image_status=IMAGE_STATUS_DONE if result else IMAGE_STATUS_FAILED
+        )
+        return result
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+
+image_processing_pool = ImageProcessingPool(
+    max_workers=getattr(settings, "IMAGE_PROCESSING_WORKERS", 2)
+)
+atexit.register(image_processing_pool.shutdown)
@@ -0,0 +1,110 @@
+from django.db import transaction
+
+from apps.inventories.models.item import Item, ItemLineAtribute
+from apps.inventories.models.stock_price import StockPrice
+from apps.share.request_middleware import request_local
+from apps.share.services.generate_sku import GenerateSku
+from apps.share.services.image_worker import (
+    IMAGE_STATUS_PENDING,
+    image_processing_pool,
+)
+
+
+class ItemVariantCreator:
+    """
+    Create every variant of a new item with a constant number of queries.
+
+    The item data is validated once and the category and brand codes are
+    resolved from the validated rows, so the SKUs of all variants are built in
+    memory. The items, their attribute rows and their price rows are then
+    written with one ``bulk_create`` each inside a single transaction. Uploaded
+    images are stored with the items and processed after commit, like
+    ``Item.save`` does for a single item.
+
+    Methods:
+        create(validated_data, attribute_list, images, price): Create one item
+            per attribute set and return the items, in attribute order.
+    """
+
+    def __init__(self, tenant):
+        self.tenant = tenant
+
+    def get_codes(self, validated_data):
+        category = validated_data.get("category")
+        brand = validated_data.get("brand")
+        category_code = category.category_code if category else None
+        # Only the tenant's own brands contribute to the SKU, as before
+        brand_code = (
+            brand.brand_code if brand and brand.tenant_id == self.tenant.id else None
+        )
+        return category_code, brand_code
+
+    def create(self, validated_data, attribute_list, images, price):
+        validated_data = dict(validated_data)
+        validated_data.pop("item_image", None)
+        # The generated SKU replaces one sent with the item, as before
+        validated_data.pop("sku", None)
+        category_code, brand_code = self.get_codes(validated_data)
+        request = getattr(request_local, "request", None)
+        user = getattr(request, "user", None)
+        if user is not None and not user.is_authenticated:
+            user = None
+
+        items = []
+        for number, attributes in enumerate(attribute_list):
+            sku = GenerateSku(
+                validated_data.get("item_title", ""),
+                self.tenant,
+                None,
+                None,
+                attributes,
+                category_code=category_code,
+                brand_code=brand_code,
+            ).generate_sku()
+            item_image = images[number] if number < len(images) else None
+            items.append(
+                Item(
+                    **validated_data,
+                    tenant=self.tenant,
+                    sku=sku,
+                    item_image=item_image,
+                    image_status=IMAGE_STATUS_PENDING if item_image else None,
+                    created_by=user,
+                    updated_by=user,
+                )
+            )
+
+        with transaction.atomic():
+            # Stores the uploaded files while inserting the rows
+            Item.objects.bulk_create(items)
+            item_attributes = ItemLineAtribute.objects.bulk_create(
+                ItemLineAtribute(
+                    tenant=self.tenant,
+                    item=item,
+                    option_name=attributes.get("option_name", ""),
+                    attributes=attributes,
+                    created_by=user,
+                    updated_by=user,
+                )
+                for item, attributes in zip(items, attribute_list)
+            )
+            StockPrice.objects.bulk_create(
+                StockPrice(
+                    tenant=self.tenant,
+                    item=item,
+                    sales_price=price,
+                    created_by=user,
+                    updated_by=user,
+                )
+                for item in items
+            )
+            for item in items:
+                if item.item_image:
+                    image_processing_pool.submit(
+                        Item, item.pk, item.item_image.name, self.tenant
+                    )
+
+        # ItemSerializer reads the attributes from here instead of querying
+        for item, item_attribute in zip(items, item_attributes):
+            item.prefetched_attributes = [item_attribute]
+        return items
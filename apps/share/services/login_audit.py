@@ -0,0 +1,217 @@
+import atexit
+import queue
+import socket
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections
+from user_agents import parse
+
+from apps.share.services.server_logger import ServerLogger
+from apps.users.models import UserLogInfo
+
+LOGIN_AUDIT_BATCH_SIZE = 100
+LOGIN_AUDIT_FLUSH_INTERVAL = 0.5
+LOGIN_AUDIT_FLUSH_TIMEOUT = 5
+PUBLIC_IP_HOST = "api.ipify.org"
+PUBLIC_IP_CACHE_TIMEOUT = 60 * 60
+
+
+def build_device_info(user_agent_string, client_ip, public_ip=None):
+    """
+    Build the ``UserLogInfo.device_info`` payload from a raw user agent string.
+    """
+    user_agent = parse(user_agent_string or "")
+    return {
+        "client_ip": client_ip,
+        "public_ip_address": public_ip,
+        "is_mobile": user_agent.is_mobile,
+        "is_tablet": user_agent.is_tablet,
+        "is_touch_capable": user_agent.is_touch_capable,
+        "is_pc": user_agent.is_pc,
+        "is_bot": user_agent.is_bot,
+        "browser": user_agent.browser,
+        "browser_family": user_agent.browser.family,
+        "browser_version": user_agent.browser.version,
+        "browser_version_string": user_agent.browser.version_string,
+        "os": user_agent.os,
+        "os_family": user_agent.os.family,
+        "os_version": user_agent.os.version,
+        "os_version_string": user_agent.os.version_string,
+        "device": user_agent.device,
+        "device_family": user_agent.device.family,
+    }
+
+
+class PublicIpResolver:
+    """
+    Optional, cached public IP lookup.
+
+    The lookup is disabled unless ``USER_LOG_PUBLIC_IP_LOOKUP`` is enabled, and
+    it only ever runs on the login audit writer thread. A resolved (or failed)
+    lookup is reused for ``timeout`` seconds.
+
+    Methods:
+        resolve(): Return the cached public IP address, or None.
+    """
+
+    def __init__(self, host=PUBLIC_IP_HOST, timeout=PUBLIC_IP_CACHE_TIMEOUT):
+        self.host = host
+        self.timeout = timeout
+        self._address = None
+        self._expires_at = 0
+
+    @property
+    def enabled(self):
+        return getattr(settings, "USER_LOG_PUBLIC_IP_LOOKUP", False)
+
+    def resolve(self):
+        if not self.enabled:
+            return None
+
+        now = time.monotonic()
+        if now >= self._expires_at:
+            try:
+                self._address = socket.gethostbyname(self.host)
+            except OSError:
+                self._address = None
+            self._expires_at = now + self.timeout
+        return self._address
+
+
+class LoginAuditWriter:
+    """
+    In-process queue that writes ``UserLogInfo`` rows in batches.
+
+    The login request only captures the user, the raw user agent and the client
+    address. A daemon thread parses the user agent, adds the optional public IP
+    and inserts the queued rows with a single ``bulk_create`` per batch.
+
+    ``login_time`` is stamped by the model when the batch is written, so it can
+    trail the actual login by up to ``flush_interval`` seconds.
+
+    With ``start_worker=False`` (``USER_LOG_ASYNC`` disabled) nothing runs in
+    the background and entries are written on the next ``flush()``.
+
+    The queue is per process: a login recorded by another worker process is
+    only visible once that process has written it.
+
+    Methods:
+        record(user, request): Queue a login entry for the request.
+        flush(timeout): Write every queued entry in the calling thread, then
+            wait up to ``timeout`` seconds for a batch the worker thread
+            already took.
+        stop(): Stop the worker thread and write what is left.
+    """
+
+    def __init__(
+        self,
+        batch_size=LOGIN_AUDIT_BATCH_SIZE,
+        flush_interval=LOGIN_AUDIT_FLUSH_INTERVAL,
+        ip_resolver=None,
+        start_worker=True,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.ip_resolver = ip_resolver or PublicIpResolver()
+        self.start_worker = start_worker
+        self._queue = queue.SimpleQueue()
+        self._write_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        # Entries recorded but not yet written, queued or in a batch
+        self._pending = 0
+        self._written = threading.Condition()
+
+    def record(self, user, request):
+        with self._written:
+            self._pending += 1
+        self._queue.put(
+            (
+                user.id,
+                request.META.get("HTTP_USER_AGENT", ""),
+                request.META.get("REMOTE_ADDR"),
+            )
+        )
+        if self.start_worker and self._thread is None:
+            self._start()
+
+    def flush(self, timeout=LOGIN_AUDIT_FLUSH_TIMEOUT):
+        batch = self._drain()
+        while batch:
+            self._write(batch)
+            batch = self._drain()
+
+        with self._written:
+            self._written.wait_for(lambda: self._pending <= 0, timeout=timeout)
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._stopped.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="login-audit-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                entry = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            batch = [entry] + self._drain(self.batch_size - 1)
+            try:
+                self._write(batch)
+            except Exception as e:
+                # A failed audit batch must never take the writer down
+                ServerLogger().error(e)
+            finally:
+                close_old_connections()
+
+    def _drain(self, limit=None):
+        limit = self.batch_size if limit is None else limit
+        batch = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _write(self, batch):
+        try:
+            public_ip = self.ip_resolver.resolve()
+            with self._write_lock:
+                UserLogInfo.objects.bulk_create(
+                    [
+                        UserLogInfo(
+                            user_id=user_id,
+                            device_info=build_device_info(
+                                user_agent, client_ip, public_ip
+                            ),
+                        )
+                        for user_id, user_agent, client_ip in batch
+                    ]
+                )
+        finally:
+            # Written or lost, the batch no longer holds up a flush
+            with self._written:
+                self._pending -= len(batch)
+                self._written.notify_all()
+
+
+login_audit_writer = LoginAuditWriter(
+    start_worker=getattr(settings, "USER_LOG_ASYNC", True)
+)
+atexit.register(login_audit_writer.stop)
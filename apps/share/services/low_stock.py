@@ -0,0 +1,104 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, FloatField, OuterRef, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.inventories.models.item import Item
+from apps.inventories.models.low_stock import LowStockAlert, LowStockCheck
+from apps.inventories.models.stock_summary import StockSummary
+
+
+class LowStockService:
+    """
+    Keeps a tenant's low stock alerts in step with its stock.
+
+    An item is low when it has a ``threshold_qty`` above zero and its stock
+    on hand, summed over all warehouses from the stock summary (already in
+    base units), is at or below it. Items with no stock count as zero on
+    hand.
+
+    ``check`` evaluates items in one query, joining each to the sum of its
+    summary rows, and writes the result as LowStockAlert rows. After the
+    first check of a tenant it only revisits the items that changed, or
+    whose summary rows changed, since the previous check, less
+    ``settings.LOW_STOCK_RECHECK_OVERLAP`` seconds for transactions still
+    open at the time. Changes that touch neither, e.g. deleting a
+    warehouse, are picked up by a ``full`` check.
+
+    Methods:
+        low_items(items): The items of a queryset that are low, annotated
+            with ``on_hand_qty``.
+        check(tenant, full=False): Bring the tenant's alerts up to date and
+            return how many of the checked items are low.
+    """
+
+    def on_hand(self):
+        totals = (
+            StockSummary.objects.filter(item=OuterRef("pk"))
+            .values("item")
+            .annotate(total=Sum("on_hand_qty"))
+            .values("total")
+        )
+        return Coalesce(Subquery(totals), 0.0, output_field=FloatField())
+
+    def low_items(self, items):
+        return (
+            items.filter(threshold_qty__gt=0)
+            .annotate(on_hand_qty=self.on_hand())
+            .filter(on_hand_qty__lte=F("threshold_qty"))
+        )
+
+    def changed_since(self, tenant, since):
+        summaries = StockSummary.objects.filter(tenant=tenant, edited_at__gte=since)
+        return Q(edited_at__gte=since) | Q(pk__in=summaries.values("item"))
+
+    def check(self, tenant, full=False):
+        with transaction.atomic():
+            last_check, _ = LowStockCheck.objects.get_or_create(tenant=tenant)
+            # Concurrent checks of a tenant run one after the other
+            last_check = LowStockCheck.objects.select_for_update().get(
+                pk=last_check.pk
+            )
+            started_at = timezone.now()
+
+            items = Item.objects.filter(tenant=tenant)
+            if last_check.checked_at is not None and not full:
+                since = last_check.checked_at - timedelta(
+                    seconds=settings.LOW_STOCK_RECHECK_OVERLAP
+                )
+                items = items.filter(self.changed_since(tenant, since))
+
+            low = list(
+                self.low_items(items).values_list("id", "on_hand_qty", "threshold_qty")
+            )
+
+            # Checked items that are no longer low
+            LowStockAlert.objects.filter(tenant=tenant, item__in=items).exclude(
+                item__in=self.low_items(items).values("pk")
+            ).delete()
+            LowStockAlert.objects.bulk_create(
+                [
+                    LowStockAlert(
+                        tenant=tenant,
+                        item_id=item_id,
+                        on_hand_qty=on_hand_qty,
+                        threshold_qty=threshold_qty,
+                    )
+                    for item_id, on_hand_qty, threshold_qty in low
+                ],
+                batch_size=1000,
+                update_conflicts=True,
+                unique_fields=["tenant", "item"],
+                update_fields=["on_hand_qty", "threshold_qty", "edited_at"],
+            )
+
+            last_check.checked_at = started_at
+            last_check.save(update_fields=["checked_at", "edited_at"])
+
+        return len(low)
+
+
+low_stock = LowStockService()
@@ -0,0 +1,116 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.client_admin.models import Preference
+from apps.inventories.models.brand import Brand
+from apps.inventories.models.category import Category
+from apps.inventories.models.item_attribute import ItemAttribute
+from apps.inventories.models.uom import UOM
+from apps.inventories.models.warehouse import Warehouse
+from apps.share.services.cache_version import (
+    get_cache_version,
+    invalidate_cache_version,
+)
+
+MASTER_DATA_VERSION_KEY = "master_data:{model}:{tenant_id}:version"
+MASTER_DATA_CACHE_KEY = "master_data:{model}:{tenant_id}:{version}"
+
+# The related rows each model's representation reads, cached with the rows
+MASTER_DATA_MODELS = {
+    UOM: {},
+    Warehouse: {"select_related": ("tenant", "created_by", "updated_by")},
+    Brand: {},
+    Category: {},
+    ItemAttribute: {"prefetch_related": ("item_attribute",)},
+    Preference: {},
+}
+
+
+def get_master_data_version(model, tenant_id):
+    """
+    Return the current cache version of a tenant's rows of a master data
+    model.
+    """
+    return get_cache_version(
+        MASTER_DATA_VERSION_KEY.format(
+            model=model._meta.label_lower, tenant_id=tenant_id
+        )
+    )
+
+
+def invalidate_master_data(model, tenant_id):
+    """
+    Invalidate a tenant's cached rows of a master data model by bumping its
+    version, now and on commit.
+    """
+    invalidate_cache_version(
+        MASTER_DATA_VERSION_KEY.format(
+            model=model._meta.label_lower, tenant_id=tenant_id
+        )
+    )
+
+
+class MasterData:
+    """
+    Read-through cache of a tenant's reference rows: UOMs, warehouses,
+    brands, categories, item attributes and the preference.
+
+    Each (tenant, model) pair is loaded with one query, newest first like the
+    list endpoints and with the related rows its representation reads, and cached under the pair's
+    version. Saves and deletes bump the version, see
+    ``apps.inventories.signals`` and ``apps.client_admin.signals``; code
+    changing rows with ``QuerySet.update`` calls ``invalidate_master_data``.
+    Every read returns fresh copies, so callers may change them.
+
+    Methods:
+        all(model, tenant): Every row of the tenant.
+        get(model, tenant, pk): One row by id, or None.
+        first(model, tenant, **values): The first row with the given field
+            values, or None.
+        last(model, tenant): The row with the highest id, like
+            ``QuerySet.last`` on an unordered queryset, or None.
+    """
+
+    def load(self, model, tenant_id):
+        options = MASTER_DATA_MODELS[model]
+        return list(
+            model.objects.filter(tenant_id=tenant_id)
+            .select_related(*options.get("select_related", ()))
+            .prefetch_related(*options.get("prefetch_related", ()))
+            .order_by("-created_at", "-id")
+        )
+
+    def all(self, model, tenant):
+        key = MASTER_DATA_CACHE_KEY.format(
+            model=model._meta.label_lower,
+            tenant_id=tenant.id,
+            version=get_master_data_version(model, tenant.id),
+        )
+        rows = cache.get(key)
+        if rows is None:
+            rows = self.load(model, tenant.id)
+            cache.set(key, rows, settings.MASTER_DATA_CACHE_TIMEOUT)
+        return rows
+
+    def get(self, model, tenant, pk):
+        try:
+            pk = int(pk)
+        except (TypeError, ValueError):
+            return None
+        return next((row for row in self.all(model, tenant) if row.pk == pk), None)
+
+    def first(self, model, tenant, **values):
+        return next(
+            (
+                row
+                for row in self.all(model, tenant)
+                if all(getattr(row, field) == value for field, value in values.items())
+            ),
+            None,
+        )
+
+    def last(self, model, tenant):
+        return max(self.all(model, tenant), key=lambda row: row.pk, default=None)
+
+
+master_data = MasterData()
@@ -0,0 +1,85 @@
+from django.conf import settings
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+
+from apps.share.services.cache_version import (
+    get_cache_version,
+    invalidate_cache_version,
+)
+from apps.share.views import get_request_tenant_user
+
+PERMISSION_VERSION_KEY = "group_permission:version"
+PERMISSION_CACHE_KEY = "group_permission:{version}:{user_id}"
+
+
+def get_permission_version():
+    """
+    Return the current permission cache version.
+    """
+    return get_cache_version(PERMISSION_VERSION_KEY)
+
+
+def invalidate_permissions():
+    """
+    Invalidate every cached permission set by bumping the cache version, now
+    and on commit.
+    """
+    invalidate_cache_version(PERMISSION_VERSION_KEY)
+
+
+class PermissionResolver:
+    """
+    Resolve the tenant role and group permission codenames of a user.
+
+    The result is loaded from the request's TenantUser and one Permission query,
+    stored in the versioned cache, and memoized on the request, so warm
+    permission checks run no queries at all.
+
+    Methods:
+        resolve(request): Return the permission data for ``request.user``.
+        load(request): Load the permission data from the database.
+    """
+
+    request_attr = "_group_permissions"
+
+    def resolve(self, request):
+        resolved = getattr(request, self.request_attr, None)
+        if resolved is not None:
+            return resolved
+
+        user = request.user
+        key = PERMISSION_CACHE_KEY.format(
+            version=get_permission_version(), user_id=user.id
+        )
+        resolved = cache.get(key)
+        if resolved is None:
+            resolved = self.load(request)
+            cache.set(key, resolved, settings.PERMISSION_CACHE_TIMEOUT)
+
+        setattr(request, self.request_attr, resolved)
+        return resolved
+
+    def load(self, request):
+        user = request.user
+        # Shares the request-scoped TenantUser lookup with the views
+        tenant_user = get_request_tenant_user(request)
+        if tenant_user is None:
+            return {"is_tenant_user": False, "is_superuser": False, "codenames": frozenset()}
+
+        if tenant_user.is_superuser:
+            codenames = frozenset()
+        else:
+            codenames = frozenset(
+                Permission.objects.filter(customgroup__users=user)
+                .values_list("codename", flat=True)
+                .distinct()
+            )
+
+        return {
+            "is_tenant_user": True,
+            "is_superuser": tenant_user.is_superuser,
+            "codenames": codenames,
+        }
+
+
+permission_resolver = PermissionResolver()
@@ -0,0 +1,113 @@
+from collections import defaultdict
+from datetime import date
+
+from django.db.models import Q
+
+from apps.inventories.models.stock import Stock
+
+# Quantities are floats; anything below this is treated as fully allocated
+QUANTITY_TOLERANCE = 1e-9
+
+
+class InsufficientStock(Exception):
+    """
+    Raised when the unlocked lots of a warehouse cannot cover an invoice line.
+    """
+
+    def __init__(self, line):
+        self.line = line
+        super().__init__(
+            f"Item Stock Not Found: item {line['item_id']}, unit {line['unit']}, "
+            f"qty {line['qty']}"
+        )
+
+
+class StockAllocator:
+    """
+    First-expiry-first-out stock allocation for all lines of an invoice.
+
+    Candidate lots of every (item, uom) pair on the invoice are fetched in one
+    ``SELECT ... FOR UPDATE SKIP LOCKED`` query ordered by expiry, so lots held
+    by a concurrent invoice are never double-sold. Each line draws from as many
+    lots as it needs, and the decrements are written with one ``bulk_update``.
+    Must run inside the invoice transaction, which keeps the lots locked.
+
+    Methods:
+        allocate(lines): Allocate and decrement stock, returning the plan.
+    """
+
+    def __init__(self, tenant, warehouse_id):
+        self.tenant = tenant
+        self.warehouse_id = warehouse_id
+
+    def candidate_lots(self, lines):
+        pairs = Q()
+        for item_id, uom_id in {(line["item_id"], line["unit"]) for line in lines}:
+            pairs |= Q(item_id=item_id, uom_id=uom_id)
+
+        lots = defaultdict(list)
+        stocks = (
+            Stock.objects.select_for_update(skip_locked=True)
+            .filter(
+                pairs,
+                tenant=self.tenant,
+                source_id=self.warehouse_id,
+                quantity__gt=0,
+                exp_date__gte=date.today(),
+            )
+            .order_by("exp_date", "id")
+        )
+        for stock in stocks:
+            lots[(stock.item_id, stock.uom_id)].append(stock)
+        return lots
+
+    def allocate(self, lines):
+        """
+        Allocate stock for ``lines`` (dicts with ``item_id``, ``unit`` and
+        ``qty``) and return one plan entry per line listing the lots used.
+
+        Raises InsufficientStock, without writing anything, if any line cannot
+        be covered.
+        """
+        if not lines:
+            return []
+
+        lots = self.candidate_lots(lines)
+        touched = {}
+        plan = []
+        for line in lines:
+            remaining = float(line["qty"])
+            allocations = []
+            for stock in lots[(int(line["item_id"]), int(line["unit"]))]:
+                if remaining <= QUANTITY_TOLERANCE:
+                    break
+                if stock.quantity <= QUANTITY_TOLERANCE:
+                    continue
+                taken = min(stock.quantity, remaining)
+                stock.quantity -= taken
+                remaining -= taken
+                touched[stock.id] = stock
+                allocations.append(
+                    {
+                        "stock": stock.id,
+                        "stock_identity": stock.stock_identity,
+                        "lot_number": stock.lot_number,
+                        "exp_date": stock.exp_date,
+                        "qty": taken,
+                    }
+                )
+
+            if remaining > QUANTITY_TOLERANCE:
+                raise InsufficientStock(line)
+
+            plan.append(
+                {
+                    "item_id": line["item_id"],
+                    "unit": line["unit"],
+                    "qty": float(line["qty"]),
+                    "lots": allocations,
+                }
+            )
+
+        Stock.objects.bulk_update(touched.values(), ["quantity"])
+        return plan
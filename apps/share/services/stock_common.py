@@ -2,6 +2,7 @@ from django.db import transaction
 from django.core.exceptions import ObjectDoesNotExist
 
 from apps.share.services.stock_manager import StockManager
+from apps.share.services.stock_ledger import StockEntry, StockLedger
 
 from apps.inventories.models.stock_price import StockPrice
 
@@ -12,46 +13,20 @@ def manage_stock(stock_id):
 
 
 def stock_exists_obj(tenant, obj, identity):
-    try:
-        non_pack_qty = obj['non_pack_qty']
-    except:
-        non_pack_qty = 0
-
-    try:
-        des_stock = tenant.stock_base_models.get(
-            source_id=obj['recvd_stock'], stock_identity=identity, item=obj['item'])
-        des_stock.quantity += obj['recvd_qty']
-        # des_stock.non_pack_qty += non_pack_qty
-        des_stock.last_recvd_date = obj['recvd_date']
-        des_stock.save()
-        stock_price = tenant.stockprice_base_models.get(
-            item=des_stock.item)
-        des_stock.item_price = stock_price
-        stock_price.unit_price = obj['cost_per_unit']
-        stock_price.save()
+    """
+    Add ``obj['recvd_qty']`` to the stock row matching ``identity``, creating
+    it if needed. Callers with several lines should use ``stock_exists_objs``.
+    """
+    return stock_exists_objs(tenant, [(obj, identity)])[0]
 
-    except:
-        stock_manager = manage_stock(stock_id=None)
-        stock_obj = stock_manager.stock_transfer(
-            tenant=tenant,
-            stock_identity=identity,
-            quantity=obj['recvd_qty'],
-            lot_number=obj['lot_number'],
-            exp_date=obj['exp_date'],
-            source_id=obj['recvd_stock'],
-            item_id=obj['item'],
-            per_pack_qty=obj['per_pack_qty'],
-            uom_id=obj['uom'],
-            non_pack_qty=non_pack_qty,
-            last_recvd_date=obj['recvd_date'],
-        )
-        des_stock = stock_manager.stock_create_or_update(stock_obj)
-        stock_price, _ = StockPrice.objects.update_or_create(item=des_stock.item,
-                                                             defaults={"tenant": tenant, "item": des_stock.item,  "sales_price": obj['cost_per_unit']})
-        des_stock.item_price = stock_price
-        des_stock.save()
 
-    return des_stock
+def stock_exists_objs(tenant, objs):
+    """
+    Bulk ``stock_exists_obj`` for a list of ``(obj, identity)`` pairs, applied
+    with a constant number of queries.
+    """
+    entries = [StockEntry.from_obj(obj, identity) for obj, identity in objs]
+    return StockLedger(tenant).apply(entries)
 
 
 def stock_exists(tenant, recvd_stock_id, production_identity, item_id, uom_id, recvd_qty, lot_number, exp_date, per_pack_qty, non_pack_qty, last_unit_price, date):
@@ -0,0 +1,239 @@
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from django.db.models import Case, DateTimeField, F, FloatField, Q, Value, When
+
+from apps.inventories.models.stock import Stock
+from apps.inventories.models.stock_price import StockPrice
+from apps.share.request_middleware import request_local
+from apps.share.views import generate_stock_identity
+
+
+class StockEntry(NamedTuple):
+    """
+    One stock movement: ``qty`` is added to the (warehouse, item,
+    stock_identity) row. The remaining fields are only used when the row has
+    to be created.
+    """
+
+    warehouse_id: int
+    item_id: int
+    stock_identity: str
+    qty: float
+    price: float
+    uom_id: Any = None
+    lot_number: Any = None
+    exp_date: Any = None
+    per_pack_qty: float = 0
+    non_pack_qty: float = 0
+    recvd_date: Any = None
+
+    @classmethod
+    def from_obj(cls, obj, identity):
+        """
+        Build an entry from the ``stock_exists_obj`` dict format.
+        """
+        return cls(
+            warehouse_id=int(obj["recvd_stock"]),
+            item_id=int(obj["item"]),
+            stock_identity=identity,
+            qty=float(obj["recvd_qty"]),
+            price=obj["cost_per_unit"],
+            uom_id=obj["uom"],
+            lot_number=obj["lot_number"],
+            exp_date=obj["exp_date"],
+            per_pack_qty=obj["per_pack_qty"],
+            non_pack_qty=obj.get("non_pack_qty", 0),
+            recvd_date=obj["recvd_date"],
+        )
+
+
+class StockLedger:
+    """
+    Set-based stock upsert for a batch of stock movements.
+
+    An entry matches the row with its own ``stock_identity`` or, failing
+    that, the row with the identity ``Stock.save()`` gives a row created from
+    it, so a row created here is found again by the same entries. Missing
+    rows are inserted empty with one ``bulk_create`` that skips rows a
+    concurrent transaction inserted first, linked to their item's
+    ``StockPrice``, which is created or re-priced in bulk, and read back.
+    Every row's quantity is then moved with a single ``UPDATE ... SET
+    quantity = quantity + CASE ...``. The number of queries does not depend
+    on the number of entries.
+
+    Methods:
+        apply(entries): Apply the entries and return the Stock row of each.
+    """
+
+    unique_fields = ["tenant", "source", "item", "stock_identity"]
+
+    def __init__(self, tenant):
+        self.tenant = tenant
+
+    def apply(self, entries):
+        if not entries:
+            return []
+
+        # Entries hitting the same row are merged; the last one wins for dates
+        merged = OrderedDict()
+        for entry in entries:
+            key = self.key(entry)
+            if key in merged:
+                entry = entry._replace(qty=merged[key].qty + entry.qty)
+            merged[key] = entry
+
+        rows = self.existing_rows(merged)
+        missing = OrderedDict(
+            (key, entry) for key, entry in merged.items() if key not in rows
+        )
+        rows.update(self.create_rows(missing))
+        self.update_rows(rows, merged)
+
+        return [rows[self.key(entry)] for entry in entries]
+
+    @staticmethod
+    def key(row):
+        if isinstance(row, Stock):
+            return (row.source_id, row.item_id, row.stock_identity)
+        return (int(row.warehouse_id), int(row.item_id), row.stock_identity)
+
+    def stored_key(self, entry):
+        """
+        The key of the row created from ``entry``: the identity Stock.save()
+        would compute, with the entry's identity as the fallback when the uom
+        is unknown.
+        """
+        identity = (
+            generate_stock_identity(
+                entry.uom_id, entry.lot_number, entry.per_pack_qty, entry.exp_date
+            )
+            if entry.uom_id
+            else entry.stock_identity
+        )
+        return (int(entry.warehouse_id), int(entry.item_id), identity)
+
+    def fetch_rows(self, keys):
+        lookup = Q()
+        for warehouse_id, item_id, identity in keys:
+            lookup |= Q(source_id=warehouse_id, item_id=item_id, stock_identity=identity)
+
+        rows = {}
+        for stock in Stock.objects.filter(lookup, tenant=self.tenant):
+            rows.setdefault(self.key(stock), stock)
+        return rows
+
+    def existing_rows(self, merged):
+        keys = set(merged)
+        keys.update(self.stored_key(entry) for entry in merged.values())
+        found = self.fetch_rows(keys)
+
+        rows = {}
+        for key, entry in merged.items():
+            stock = found.get(key) or found.get(self.stored_key(entry))
+            if stock is not None:
+                rows[key] = stock
+        return rows
+
+    def update_rows(self, rows, merged):
+        if not rows:
+            return
+
+        # Several entries may resolve to one row
+        quantity_deltas = OrderedDict()
+        recvd_dates = OrderedDict()
+        for key, stock in rows.items():
+            entry = merged[key]
+            stock.quantity += entry.qty
+            quantity_deltas[stock.pk] = quantity_deltas.get(stock.pk, 0) + entry.qty
+            if entry.recvd_date is not None:
+                stock.last_recvd_date = entry.recvd_date
+                recvd_dates[stock.pk] = entry.recvd_date
+
+        Stock.objects.filter(pk__in=list(quantity_deltas)).update(
+            quantity=F("quantity")
+            + Case(
+                *[When(pk=pk, then=Value(qty)) for pk, qty in quantity_deltas.items()],
+                default=Value(0.0),
+                output_field=FloatField(),
+            ),
+            last_recvd_date=Case(
+                *[
+                    When(pk=pk, then=Value(date, output_field=DateTimeField()))
+                    for pk, date in recvd_dates.items()
+                ],
+                default=F("last_recvd_date"),
+                output_field=DateTimeField(),
+            ),
+        )
+
+    def upsert_prices(self, entries):
+        # New stock rows re-price their item, like StockPrice.update_or_create did
+        prices = OrderedDict((entry.item_id, entry.price) for entry in entries)
+
+        existing = {}
+        for stock_price in StockPrice.objects.filter(item_id__in=prices):
+            existing.setdefault(stock_price.item_id, stock_price)
+
+        for item_id, stock_price in existing.items():
+            stock_price.sales_price = prices[item_id]
+            stock_price.tenant = self.tenant
+        StockPrice.objects.bulk_update(existing.values(), ["sales_price", "tenant"])
+
+        created = StockPrice.objects.bulk_create(
+            [
+                StockPrice(tenant=self.tenant, item_id=item_id, sales_price=price)
+                for item_id, price in prices.items()
+                if item_id not in existing
+            ]
+        )
+        existing.update((stock_price.item_id, stock_price) for stock_price in created)
+        return existing
+
+    def create_rows(self, missing):
+        if not missing:
+            return {}
+
+        prices = self.upsert_prices(missing.values())
+        # bulk_create skips BaseModel.save, which stamps the request user
+        request = getattr(request_local, "request", None)
+        user = getattr(request, "user", None)
+        if user is not None and not user.is_authenticated:
+            user = None
+
+        stocks = OrderedDict()
+        for entry in missing.values():
+            stored_key = self.stored_key(entry)
+            if stored_key in stocks:
+                continue
+            # Created empty; update_rows adds the quantity like for any row
+            stocks[stored_key] = Stock(
+                tenant=self.tenant,
+                source_id=entry.warehouse_id,
+                item_id=entry.item_id,
+                item_price=prices[entry.item_id],
+                uom_id=entry.uom_id,
+                stock_identity=stored_key[2],
+                quantity=0,
+                lot_number=entry.lot_number,
+                exp_date=entry.exp_date,
+                per_pack_qty=entry.per_pack_qty,
+                non_pack_qty=entry.non_pack_qty,
+                last_recvd_date=entry.recvd_date,
+                created_by=user,
+                updated_by=user,
+            )
+
+        # A row inserted by a concurrent transaction in the meantime is kept
+        # as it is instead of failing the unique constraint
+        Stock.objects.bulk_create(
+            stocks.values(),
+            update_conflicts=True,
+            unique_fields=self.unique_fields,
+            update_fields=["edited_at"],
+        )
+        # Upserts do not return primary keys, so the rows are read back
+        created = self.fetch_rows(stocks)
+        return {
+            key: created[self.stored_key(entry)] for key, entry in missing.items()
+        }
@@ -0,0 +1,44 @@
+from django.db import connection, transaction
+
+from apps.inventories.models.stock_summary import StockSummary
+
+
+class StockSummaryService:
+    """
+    Reads and regenerates the per-warehouse stock on hand of items.
+
+    The summary rows are kept in step with ``INV_Stock`` by database
+    triggers, so reads here are one indexed query however many lots an item
+    has. ``rebuild`` recomputes them from Stock, for a tenant or for all
+    tenants, e.g. after stock was loaded with the triggers disabled.
+
+    Methods:
+        rebuild(tenant=None): Regenerate the summary rows from Stock.
+        by_item(tenant, item_ids): The summary rows of some items, grouped
+            by item id.
+    """
+
+    def rebuild(self, tenant=None):
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                # Writers wait for the rebuild, so no stock change lands
+                # between the scan and the new rows
+                cursor.execute('LOCK TABLE "INV_Stock" IN SHARE MODE')
+                cursor.execute(
+                    "SELECT inv_stock_summary_refresh(%s::uuid, NULL)",
+                    [str(tenant.id) if tenant is not None else None],
+                )
+
+    def by_item(self, tenant, item_ids):
+        summaries = {}
+        rows = (
+            StockSummary.objects.filter(tenant=tenant, item_id__in=item_ids)
+            .select_related("warehouse")
+            .order_by("warehouse_id")
+        )
+        for summary in rows:
+            summaries.setdefault(summary.item_id, []).append(summary)
+        return summaries
+
+
+stock_summary = StockSummaryService()
@@ -0,0 +1,93 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+TENANT_LOG_DIR = "tenant_logs"
+TENANT_LOG_FORMAT = "{levelname} {asctime} {message} [Method: {method}, Path: {path}]"
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Fill in the request fields used by the tenant log format.
+
+    Records logged without ``extra={"method": ..., "path": ...}`` would
+    otherwise fail to format once they reach the file handler.
+    """
+
+    def filter(self, record):
+        if not hasattr(record, "method"):
+            record.method = "-"
+        if not hasattr(record, "path"):
+            record.path = "-"
+        return True
+
+
+class TenantLogRegistry:
+    """
+    Process-wide registry of tenant loggers.
+
+    Each ``tenant_<name>`` logger is configured exactly once per process. The
+    logger only gets a ``QueueHandler``; the actual ``FileHandler`` is owned by a
+    ``QueueListener`` thread, so request threads never block on disk and only
+    one file descriptor is held per tenant.
+
+    Methods:
+        get_logger(tenant): Return the configured logger for the tenant.
+        stop(): Flush and stop every listener (registered with ``atexit``).
+    """
+
+    def __init__(self, log_dir=TENANT_LOG_DIR):
+        self.log_dir = log_dir
+        self._loggers = {}
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def get_logger(self, tenant):
+        name = f"tenant_{tenant}"
+
+        # Fast path: no locking once the tenant logger exists
+        logger = self._loggers.get(name)
+        if logger is not None:
+            return logger
+
+        with self._lock:
+            logger = self._loggers.get(name)
+            if logger is None:
+                logger = self._build_logger(name, tenant)
+                self._loggers[name] = logger
+        return logger
+
+    def _build_logger(self, name, tenant):
+        os.makedirs(self.log_dir, exist_ok=True)
+
+        file_handler = logging.FileHandler(os.path.join(self.log_dir, f"{tenant}.log"))
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(logging.Formatter(TENANT_LOG_FORMAT, style="{"))
+
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        self._listeners.append(listener)
+
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.addFilter(RequestContextFilter())
+
+        logger = logging.getLogger(name)
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(queue_handler)
+        return logger
+
+    def stop(self):
+        with self._lock:
+            for listener in self._listeners:
+                listener.stop()
+                for handler in listener.handlers:
+                    handler.close()
+            self._listeners = []
+
+
+tenant_log_registry = TenantLogRegistry()
+atexit.register(tenant_log_registry.stop)
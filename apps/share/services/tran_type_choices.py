@@ -0,0 +1,73 @@
+from django.core.cache import cache
+
+from apps.finance.models.inc_exp_type import IncExpType
+from apps.finance.models.transaction import Transaction
+from apps.share.services.cache_version import (
+    get_cache_version,
+    invalidate_cache_version,
+)
+
+TRAN_TYPE_VERSION_KEY = "tran_type_choices:{tenant_id}:version"
+TRAN_TYPE_CACHE_KEY = "tran_type_choices:{tenant_id}:{version}"
+TRAN_TYPE_CACHE_TIMEOUT = 60 * 60
+
+
+def get_tran_type_version(tenant_id):
+    """
+    Return the current transaction type cache version of a tenant.
+    """
+    return get_cache_version(TRAN_TYPE_VERSION_KEY.format(tenant_id=tenant_id))
+
+
+def invalidate_tran_type_choices(tenant_id):
+    """
+    Invalidate a tenant's cached transaction types by bumping its version,
+    now and on commit.
+    """
+    invalidate_cache_version(TRAN_TYPE_VERSION_KEY.format(tenant_id=tenant_id))
+
+
+class TranTypeChoices:
+    """
+    The ``tran_type`` choices of a tenant's transactions: the built in
+    ``Transaction.TYPE`` followed by the tenant's income and expense types.
+
+    The income and expense types are read on first use, not when the models
+    are imported, and cached per tenant; saving or deleting an IncExpType
+    bumps the tenant's cache version, see ``apps.finance.signals``.
+
+    Methods:
+        choices(tenant_id): The (code, label) pairs.
+        label(tenant_id, code): The label of one code, or the code itself
+            when it is unknown, like ``get_FOO_display``.
+    """
+
+    def load(self, tenant_id):
+        return list(
+            IncExpType.objects.filter(tenant_id=tenant_id)
+            .exclude(code=None)
+            .order_by("id")
+            .values_list("code", "type")
+        )
+
+    def inc_exp_types(self, tenant_id):
+        key = TRAN_TYPE_CACHE_KEY.format(
+            tenant_id=tenant_id, version=get_tran_type_version(tenant_id)
+        )
+        types = cache.get(key)
+        if types is None:
+            types = self.load(tenant_id)
+            cache.set(key, types, TRAN_TYPE_CACHE_TIMEOUT)
+        return types
+
+    def choices(self, tenant_id):
+        return list(Transaction.TYPE) + self.inc_exp_types(tenant_id)
+
+    def label(self, tenant_id, code):
+        labels = dict(Transaction.TYPE)
+        if code in labels:
+            return labels[code]
+        return dict(self.inc_exp_types(tenant_id)).get(code, code)
+
+
+tran_type_choices = TranTypeChoices()
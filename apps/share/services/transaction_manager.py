@@ -19,8 +19,9 @@ class TransactionManager:
 
     def transaction_create_or_update(self, tran_group, amount, tran_type, tran_head):
         obj = self.transaction_obj(tran_group, amount, tran_type, tran_head)
+        # Numbers are only unique within a tenant
         transaction, created = Transaction.objects.update_or_create(
-            tran_number=self.tran_number, defaults=obj)
+            tenant=self.tenant, tran_number=self.tran_number, defaults=obj)
 
         if created:
             print("New Transaction Created")
@@ -0,0 +1,243 @@
+import tempfile
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from apps.finance.models.inc_exp_type import IncExpType
+from apps.finance.models.transaction import Transaction
+from apps.inventories.models.brand import Brand
+from apps.inventories.models.uom import UOM
+from apps.inventories.models.warehouse import Warehouse
+from apps.share.services.master_data import (
+    MASTER_DATA_CACHE_KEY,
+    get_master_data_version,
+    master_data,
+)
+from apps.share.services.permission_resolver import (
+    get_permission_version,
+    invalidate_permissions,
+)
+from apps.share.test.base import BaseTestCase
+from apps.share.views import get_primary_warehouse
+
+
+class KeysetPaginationTestCase(BaseTestCase):
+    url = "/inventory/brand/"
+
+    def setUp(self):
+        super().setUp()
+        self.brands = [self.get_or_create_brand(number) for number in range(1, 8)]
+        # Tied timestamps are ordered by id
+        Brand.objects.filter(id__in=[3, 4, 5]).update(
+            created_at=self.brands[2].created_at
+        )
+
+    def expected_ids(self):
+        return list(
+            Brand.objects.order_by("-created_at", "-id").values_list("id", flat=True)
+        )
+
+    def test_cursor_walks_every_row_once_in_both_directions(self):
+        pages = []
+        url = self.url + "?page_size=3"
+        while url:
+            response = self.client.get(url)
+            self.assertNotIn("count", response.data)
+            pages.append([brand["id"] for brand in response.data["results"]])
+            last = response.data
+            url = response.data["next"]
+
+        self.assertEqual(sum(pages, []), self.expected_ids())
+
+        response = self.client.get(last["previous"])
+        self.assertEqual([brand["id"] for brand in response.data["results"]], pages[-2])
+
+    def test_page_number_mode_is_opt_in(self):
+        response = self.client.get(self.url, {"page": 1, "page_size": 3})
+
+        self.assertEqual(response.data["count"], 7)
+        self.assertEqual(
+            [brand["id"] for brand in response.data["results"]],
+            self.expected_ids()[:3],
+        )
+
+    def test_invalid_cursor_is_not_found(self):
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_transactions_keep_page_number_pagination(self):
+        for _ in range(3):
+            Transaction.objects.create(
+                tenant=self.tenant, tran_type=1011, tran_group=103, tran_head=6
+            )
+
+        response = self.client.get("/finance/transaction/", {"page_size": 2})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(len(response.data["results"]), 2)
+
+    def test_transactions_follow_a_cursor_when_asked(self):
+        transactions = [
+            Transaction.objects.create(
+                tenant=self.tenant, tran_type=1011, tran_group=103, tran_head=6
+            )
+            for _ in range(3)
+        ]
+
+        response = self.client.get(
+            "/finance/transaction/", {"cursor": "", "page_size": 2}
+        )
+        self.assertNotIn("count", response.data)
+        ids = [transaction["id"] for transaction in response.data["results"]]
+
+        response = self.client.get(response.data["next"])
+        ids += [transaction["id"] for transaction in response.data["results"]]
+
+        self.assertIsNone(response.data["next"])
+        self.assertEqual(
+            sorted(ids), sorted(transaction.id for transaction in transactions)
+        )
+
+
+class TranTypeChoicesTestCase(BaseTestCase):
+    def create_transaction(self, tran_type):
+        return Transaction.objects.create(
+            tenant=self.tenant, tran_type=tran_type, tran_group=103, tran_head=6
+        )
+
+    def test_built_in_types_need_no_query(self):
+        transaction = self.create_transaction(1011)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(transaction.get_tran_type_display(), "Salary")
+
+    def test_inc_exp_types_are_cached_until_they_change(self):
+        inc_exp_type = IncExpType.objects.create(tenant=self.tenant, type="Fuel")
+        transaction = self.create_transaction(inc_exp_type.code)
+
+        self.assertEqual(transaction.get_tran_type_display(), "Fuel")
+        with self.assertNumQueries(0):
+            self.assertEqual(transaction.get_tran_type_display(), "Fuel")
+
+        inc_exp_type.type = "Transport"
+        inc_exp_type.save()
+
+        self.assertEqual(transaction.get_tran_type_display(), "Transport")
+
+        inc_exp_type.delete()
+
+        self.assertEqual(transaction.get_tran_type_display(), inc_exp_type.code)
+
+
+class MasterDataTestCase(BaseTestCase):
+    def test_rows_are_cached_until_they_change(self):
+        self.get_or_create_uom(1)
+
+        self.assertEqual([uom.id for uom in master_data.all(UOM, self.tenant)], [1])
+        with self.assertNumQueries(0):
+            self.assertEqual(master_data.get(UOM, self.tenant, 1).id, 1)
+
+        self.get_or_create_uom(2)
+
+        self.assertEqual(
+            {uom.id for uom in master_data.all(UOM, self.tenant)}, {1, 2}
+        )
+
+        UOM.objects.get(id=1).delete()
+
+        self.assertIsNone(master_data.get(UOM, self.tenant, 1))
+
+    def test_rows_cached_before_commit_are_dropped_on_commit(self):
+        stale = [self.get_or_create_uom(1)]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.get_or_create_uom(2)
+            # A reader outside the transaction would cache the old rows here
+            cache.set(
+                MASTER_DATA_CACHE_KEY.format(
+                    model=UOM._meta.label_lower,
+                    tenant_id=self.tenant.id,
+                    version=get_master_data_version(UOM, self.tenant.id),
+                ),
+                stale,
+            )
+
+        self.assertEqual(
+            {uom.id for uom in master_data.all(UOM, self.tenant)}, {1, 2}
+        )
+
+    def test_primary_warehouse_is_read_through_the_cache(self):
+        warehouse = self.get_or_create_warehouse(1)
+        self.get_or_create_warehouse(2)
+        warehouse.is_primary = True
+        warehouse.save()
+
+        self.assertEqual(get_primary_warehouse(self.tenant).id, 1)
+        with self.assertNumQueries(0):
+            self.assertEqual(get_primary_warehouse(self.tenant).id, 1)
+
+    def test_primary_warehouse_change_through_the_api_is_seen(self):
+        self.get_or_create_warehouse(1)
+        self.get_or_create_warehouse(2)
+        Warehouse.objects.filter(id=1).update(is_primary=True)
+        get_primary_warehouse(self.tenant)
+
+        response = self.client.put(
+            "/inventory/warehouse/2/",
+            {"warehouse_name": "main", "warehouse_sn": "main", "is_primary": True},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_primary_warehouse(self.tenant).id, 2)
+
+    def test_warm_list_endpoint_does_not_query_the_table(self):
+        for number in range(1, 4):
+            self.get_or_create_brand(number)
+        self.client.get("/inventory/brand/")
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/inventory/brand/")
+
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertFalse(
+            any('"INV_Brand"' in query["sql"] for query in queries.captured_queries)
+        )
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": tempfile.mkdtemp(),
+            }
+        }
+    )
+    def test_file_backend(self):
+        brand = self.get_or_create_brand(1)
+
+        self.assertEqual(master_data.get(Brand, self.tenant, 1).brand_name, brand.brand_name)
+
+        brand.brand_name = "renamed"
+        brand.save()
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(master_data.get(Brand, self.tenant, 1).brand_name, "renamed")
+            master_data.get(Brand, self.tenant, 1)
+        self.assertEqual(len(queries), 1)
+
+
+class PermissionInvalidationTestCase(BaseTestCase):
+    def test_version_is_bumped_again_on_commit(self):
+        before = get_permission_version()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            invalidate_permissions()
+            # A request resolving now caches pre-commit rows under this one
+            during = get_permission_version()
+
+        self.assertNotEqual(during, before)
+        self.assertNotEqual(get_permission_version(), during)
@@ -1,2 +1,118 @@
+import os
+import tempfile
+from io import BytesIO
+from unittest import mock
 
-# Create your tests here.
+from django.db import connection
+from django.test import SimpleTestCase
+from PIL import Image
+
+from apps.inventories.models.item import Item
+from apps.share.services.document_sequence import (
+    DocumentSequenceService,
+    PreallocatedDocumentSequence,
+)
+from apps.share.services.image_process import encode_image
+from apps.share.services.image_worker import ImageProcessingPool
+from apps.share.services.tenant_log_registry import TenantLogRegistry
+
+
+class TenantLogRegistryTestCase(SimpleTestCase):
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.registry = TenantLogRegistry(log_dir=self.log_dir)
+
+    def tearDown(self):
+        self.registry.stop()
+
+    def test_logger_is_configured_once(self):
+        logger = self.registry.get_logger("tenant_a")
+
+        for _ in range(100):
+            self.assertIs(self.registry.get_logger("tenant_a"), logger)
+
+        self.assertEqual(len(logger.handlers), 1)
+
+    def test_records_are_written_once(self):
+        logger = self.registry.get_logger("tenant_b")
+        for _ in range(10):
+            self.registry.get_logger("tenant_b")
+
+        logger.error("boom", extra={"method": "GET", "path": "/item/"})
+        self.registry.stop()
+
+        with open(os.path.join(self.log_dir, "tenant_b.log")) as log_file:
+            lines = log_file.read().splitlines()
+
+        self.assertEqual(len(lines), 1)
+        self.assertIn("[Method: GET, Path: /item/]", lines[0])
+
+
+class EncodeImageTestCase(SimpleTestCase):
+    def photo(self, width, height):
+        noise = Image.frombytes("RGB", (width, height), os.urandom(width * height * 3))
+        image_io = BytesIO()
+        noise.save(image_io, format="PNG")
+        image_io.seek(0)
+        return image_io
+
+    def test_renditions_fit_budget_and_keep_aspect_ratio(self):
+        renditions = encode_image(self.photo(1600, 800), target_size_kb=55)
+
+        self.assertLessEqual(len(renditions["full"]), 55 * 1024)
+        full = Image.open(BytesIO(renditions["full"]))
+        thumbnail = Image.open(BytesIO(renditions["thumbnail"]))
+        self.assertAlmostEqual(full.width / full.height, 2, delta=0.05)
+        self.assertEqual(max(thumbnail.size), 200)
+
+
+class ImageProcessingThreadTestCase(SimpleTestCase):
+    def setUp(self):
+        self.pool = ImageProcessingPool(max_workers=1, storage=mock.Mock())
+        self.addCleanup(self.pool.shutdown)
+        self.tenant = mock.Mock(schema_name="tenants")
+
+    def test_jobs_run_in_the_tenant_schema(self):
+        schemas = []
+
+        def process(*args):
+            schemas.append(connection.schema_name)
+
+        with mock.patch.object(self.pool, "process", side_effect=process):
+            self.pool._dispatch(Item, 1, "item.png", self.tenant)
+            self.pool.shutdown()
+
+        self.assertEqual(schemas, ["tenants"])
+
+    def test_failed_jobs_are_logged(self):
+        with mock.patch.object(
+            self.pool, "process", side_effect=RuntimeError("boom")
+        ), mock.patch("apps.share.services.image_worker.ServerLogger") as logger:
+            self.pool._dispatch(Item, 1, "item.png", self.tenant)
+            self.pool.shutdown()
+
+        logger.return_value.error.assert_called_once()
+        self.assertIn("boom", logger.return_value.error.call_args[0][0])
+
+
+class PreallocatedDocumentSequenceTestCase(SimpleTestCase):
+    def test_blocks_are_reserved_in_the_tenant_schema(self):
+        sequence = PreallocatedDocumentSequence(block_size=3)
+        self.addCleanup(sequence._executor.shutdown)
+        tenant = mock.Mock(pk=1, schema_name="tenants")
+        schemas = []
+
+        def reserve(*args):
+            schemas.append(connection.schema_name)
+            return 0, range(1, 4)
+
+        with mock.patch.object(
+            DocumentSequenceService, "reserve", side_effect=reserve
+        ):
+            values = [
+                sequence.next_value(tenant, "TRF", None, yearly=False)[1]
+                for _ in range(4)
+            ]
+
+        self.assertEqual(values, [1, 2, 3, 1])
+        self.assertEqual(schemas, ["tenants", "tenants"])
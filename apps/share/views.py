@@ -1,27 +1,66 @@
 from django.db.models import Q
 
 from apps.clients.models import TenantUser
+from apps.share.request_middleware import request_local
 
 import datetime
 import random
 
+# Sentinel marking a request whose tenant user has not been resolved yet
+_UNRESOLVED = object()
+
+
+def get_request_tenant_user(request):
+    """
+    Resolve the TenantUser row of the request user once per request.
+
+    The row (with its tenant) is stored on the underlying Django request as
+    ``tenant_user``, so every helper, view and permission class working on the
+    same request shares a single query.
+    """
+    http_request = getattr(request, "_request", request)
+    tenant_user = getattr(http_request, "tenant_user", _UNRESOLVED)
+
+    if tenant_user is _UNRESOLVED:
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            tenant_user = (
+                TenantUser.objects.select_related("tenant")
+                .filter(user=user)
+                .order_by("pk")
+                .first()
+            )
+        else:
+            tenant_user = None
+        http_request.tenant_user = tenant_user
+
+    return tenant_user
+
 
 def validate_tenant_user(tenant, user):
+    request = getattr(request_local, "request", None)
+    if request is not None and getattr(request, "user", None) == user:
+        tenant_user = get_request_tenant_user(request)
+        return (
+            tenant is not None
+            and tenant_user is not None
+            and tenant_user.tenant_id == tenant.pk
+        )
+
     return TenantUser.objects.filter(Q(tenant=tenant) & Q(user=user)).exists()
 
 
 def get_tenant_user(self):
-    return self.request.user.user_tenant_users.all().first()
+    return get_request_tenant_user(self.request)
 
 
 def get_primary_warehouse(tenant):
-    warehouse_list = tenant.warehouse_base_models.all()
-    for warehouse in warehouse_list:
-        if warehouse.is_primary:
-            return warehouse
+    # Imported here, the models import this module
+    from apps.inventories.models.warehouse import Warehouse
+    from apps.share.services.master_data import master_data
 
-    # If no primary warehouse is found, you can return None or raise an exception
-    return None
+    # If no primary warehouse is found, None is returned
+    return master_data.first(Warehouse, tenant, is_primary=True)
 
 
 def generate_stock_identity(uom_id, lot_number, per_pack_qty, exp_date):
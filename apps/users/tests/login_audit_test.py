@@ -0,0 +1,74 @@
+import threading
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from apps.share.services.login_audit import LoginAuditWriter, PublicIpResolver
+from apps.users.models import User, UserLogInfo
+from apps.users.views.auth.user_log_info import UserLogInfoView
+
+
+class LoginAuditWriterTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="audit@example.com", password="testpassword"
+        )
+        self.request = SimpleNamespace(
+            META={"HTTP_USER_AGENT": "Mozilla/5.0", "REMOTE_ADDR": "10.0.0.1"}
+        )
+
+    def test_queued_logins_are_written_in_one_insert(self):
+        writer = LoginAuditWriter(start_worker=False)
+        for _ in range(5):
+            writer.record(self.user, self.request)
+
+        self.assertEqual(UserLogInfo.objects.count(), 0)
+
+        with self.assertNumQueries(1):
+            writer.flush()
+
+        self.assertEqual(UserLogInfo.objects.filter(user=self.user).count(), 5)
+
+    def test_public_ip_lookup_is_optional_and_cached(self):
+        resolver = PublicIpResolver()
+
+        with mock.patch("socket.gethostbyname", return_value="203.0.113.10") as lookup:
+            self.assertIsNone(resolver.resolve())
+
+            with override_settings(USER_LOG_PUBLIC_IP_LOOKUP=True):
+                self.assertEqual(resolver.resolve(), "203.0.113.10")
+                self.assertEqual(resolver.resolve(), "203.0.113.10")
+
+        lookup.assert_called_once()
+
+    def test_flush_waits_for_a_batch_the_worker_took(self):
+        writer = LoginAuditWriter(start_worker=False)
+        writer.record(self.user, self.request)
+        # Taken off the queue by the worker thread, not yet written
+        batch = writer._drain()
+
+        with mock.patch.object(UserLogInfo.objects, "bulk_create") as bulk_create:
+            worker = threading.Timer(0.1, writer._write, args=(batch,))
+            worker.start()
+            writer.flush()
+            written = bulk_create.called
+            worker.join()
+
+        self.assertTrue(written)
+
+    def test_logout_without_a_written_login(self):
+        UserLogInfoView(self.user).logout_time()
+
+        self.assertEqual(UserLogInfo.objects.count(), 0)
+
+    def test_logout_closes_the_open_session(self):
+        closed = UserLogInfo.objects.create(user=self.user, logout_time=timezone.now())
+        open_session = UserLogInfo.objects.create(user=self.user)
+
+        UserLogInfoView(self.user).logout_time()
+
+        open_session.refresh_from_db()
+        self.assertIsNotNone(open_session.logout_time)
+        self.assertEqual(UserLogInfo.objects.get(id=closed.id).logout_time, closed.logout_time)
@@ -1,7 +1,6 @@
-import socket
-
 from django.utils import timezone
 
+from apps.share.services.login_audit import login_audit_writer
 from apps.users.models import UserLogInfo
 
 
@@ -14,8 +13,7 @@ class UserLogInfoView:
 
     Methods:
     - __init__: Initialize the UserLogInfoView with a user instance.
-    - device_info: Get device information from the request.
-    - login_time: Log user login time with device information.
+    - login_time: Queue the user login time with device information.
     - logout_time: Log user logout time.
     """
 
@@ -29,40 +27,13 @@ class UserLogInfoView:
         self.queryset = UserLogInfo
         self.user = user
 
-    def device_info(self, request):
-        """
-        Get device information from the request.
-
-        Parameters:
-        - request: HTTP request object containing user agent information.
-
-        Returns:
-        - dict: Device information dictionary.
-        """
-        device_info = {
-            "client_ip": request.META.get("REMOTE_ADDR"),
-            "public_ip_address": socket.gethostbyname("api.ipify.org"),
-            "is_mobile": request.user_agent.is_mobile,
-            "is_tablet": request.user_agent.is_tablet,
-            "is_touch_capable": request.user_agent.is_touch_capable,
-            "is_pc": request.user_agent.is_pc,
-            "is_bot": request.user_agent.is_bot,
-            "browser": request.user_agent.browser,
-            "browser_family": request.user_agent.browser.family,
-            "browser_version": request.user_agent.browser.version,
-            "browser_version_string": request.user_agent.browser.version_string,
-            "os": request.user_agent.os,
-            "os_family": request.user_agent.os.family,
-            "os_version": request.user_agent.os.version,
-            "os_version_string": request.user_agent.os.version_string,
-            "device": request.user_agent.device,
-            "device_family": request.user_agent.device.family,
-        }
-        return device_info
-
     def login_time(self, request):
         """
-        Log user login time with device information.
+        Queue the user login with device information.
+
+        The row is written by the login audit writer, in the background unless
+        USER_LOG_ASYNC is disabled, so user agent parsing and the optional
+        public IP lookup stay off the login request.
 
         Parameters:
         - request: HTTP request object.
@@ -70,8 +41,9 @@ class UserLogInfoView:
         Returns:
         - None
         """
-        device_info = self.device_info(request)
-        self.queryset.objects.create(user=self.user, device_info=device_info)
+        login_audit_writer.record(self.user, request)
+        if not login_audit_writer.start_worker:
+            login_audit_writer.flush()
 
     def logout_time(self):
         """
@@ -83,6 +55,16 @@ class UserLogInfoView:
         Returns:
         - None
         """
-        user_log_info = self.queryset.objects.filter(user_id=self.user.id).last()
+        # Make sure a login still waiting in the audit queue is written first
+        login_audit_writer.flush()
+        user_log_info = (
+            self.queryset.objects.filter(user_id=self.user.id, logout_time__isnull=True)
+            .order_by("id")
+            .last()
+        )
+        if user_log_info is None:
+            # The login was recorded by another worker process and is not
+            # written yet, or was never recorded
+            return
         user_log_info.logout_time = timezone.now()
         user_log_info.save()
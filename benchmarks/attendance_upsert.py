@@ -0,0 +1,103 @@
+"""
+Attendance upsert benchmark.
+
+Saves a daily attendance sheet twice for ``--employees`` employees (the
+second save updates every row) through the old per-line path, a lookup plus a
+serializer save for each employee, and through AttendanceUpsert. Prints the
+query count and wall time of each. Runs inside a rolled back transaction
+against the configured database.
+
+Usage:
+    python -m benchmarks.attendance_upsert --employees 1000
+"""
+import argparse
+import os
+import time
+from datetime import datetime
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "conf.settings")
+django.setup()
+
+from django.db import connection, transaction  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+
+from apps.clients.models import ClientModel  # noqa: E402
+from apps.hr.models.attendance import Attendance  # noqa: E402
+from apps.hr.models.employee import Employee  # noqa: E402
+from apps.hr.serializers.attendance import AttendanceSerializer  # noqa: E402
+from apps.share.services.attendance_upsert import AttendanceUpsert  # noqa: E402
+
+DAY = datetime(2023, 7, 10)
+WEEK = 28
+
+
+class Rollback(Exception):
+    pass
+
+
+def per_line(tenant, lines):
+    for line in lines:
+        line = dict(line)
+        attendance = Attendance.objects.filter(
+            employee=line["employee"], date__date=DAY
+        ).first()
+        if attendance:
+            serializer = AttendanceSerializer(attendance, data=line)
+        else:
+            line["date"] = DAY
+            line["week"] = WEEK
+            serializer = AttendanceSerializer(data=line)
+        serializer.is_valid(raise_exception=True)
+        serializer.save(tenant=tenant)
+        serializer.data
+
+
+def upsert(tenant, lines):
+    attendance_upsert = AttendanceUpsert(tenant)
+    lines, errors = attendance_upsert.validate(lines)
+    assert not errors
+    AttendanceSerializer(attendance_upsert.save(lines, DAY, WEEK), many=True).data
+
+
+def measure(label, save, tenant, employees):
+    try:
+        with transaction.atomic():
+            for attend_status, step in ((1, "insert"), (2, "update")):
+                lines = [
+                    {"employee": employee.id, "attend_status": attend_status, "time": "09:00"}
+                    for employee in employees
+                ]
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    save(tenant, lines)
+                    elapsed = (time.perf_counter() - started) * 1000
+                print(f"{label:<10} {step:<8} {len(queries):>8} {elapsed:>10.1f}")
+            raise Rollback
+    except Rollback:
+        pass
+
+
+def run(count):
+    try:
+        with transaction.atomic():
+            tenant = ClientModel.objects.first()
+            employees = Employee.objects.bulk_create(
+                Employee(tenant=tenant, name=f"bench_{n}", emp_wage_type=1)
+                for n in range(count)
+            )
+            print(f"{count} employees")
+            print(f"{'path':<10} {'sheet':<8} {'queries':>8} {'ms':>10}")
+            measure("per line", per_line, tenant, employees)
+            measure("upsert", upsert, tenant, employees)
+            raise Rollback
+    except Rollback:
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=1000)
+    args = parser.parse_args()
+    run(args.employees)
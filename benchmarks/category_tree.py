@@ -0,0 +1,96 @@
+"""
+Category tree benchmark.
+
+Seeds a tenant with a ``--nodes`` category tree (five levels of fan-out) and
+serializes it through the old recursive CategorySerializer, with its query
+per node and count query per child, and through CategoryTree, cold and warm.
+Prints the query count and wall time of each. Runs inside a rolled back
+transaction against the configured database.
+
+Usage:
+    python -m benchmarks.category_tree --nodes 5000
+"""
+import argparse
+import os
+import time
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "conf.settings")
+django.setup()
+
+from django.db import connection, transaction  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+
+from apps.clients.models import ClientModel  # noqa: E402
+from apps.inventories.models.category import Category  # noqa: E402
+from apps.inventories.serializers.category import CategorySerializer  # noqa: E402
+from apps.share.services.category_tree import (  # noqa: E402
+    category_tree,
+    invalidate_category_tree,
+)
+
+FAN_OUT = 6
+
+
+class Rollback(Exception):
+    pass
+
+
+def seed(tenant, count):
+    # Breadth first, so every level is full before the next one starts
+    created = 0
+    level = [None]
+    while created < count:
+        batch = []
+        for parent in level:
+            for _ in range(FAN_OUT):
+                if created + len(batch) >= count:
+                    break
+                name = f"bench_{created + len(batch)}"
+                batch.append(
+                    Category(
+                        tenant=tenant,
+                        category_name=name,
+                        category_code=name,
+                        cat_parent=parent,
+                    )
+                )
+        level = Category.objects.bulk_create(batch)
+        created += len(batch)
+
+
+def measure(label, serialize):
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        serialize()
+        elapsed = (time.perf_counter() - started) * 1000
+    print(f"{label:<16} {len(queries):>8} {elapsed:>10.1f}")
+
+
+def run(nodes):
+    try:
+        with transaction.atomic():
+            tenant = ClientModel.objects.first()
+            seed(tenant, nodes)
+            invalidate_category_tree(tenant.id)
+            roots = tenant.category_base_models.filter(cat_parent=None).order_by(
+                "created_at"
+            )
+
+            print(f"{nodes} categories")
+            print(f"{'path':<16} {'queries':>8} {'ms':>10}")
+            measure("serializer", lambda: CategorySerializer(roots, many=True).data)
+            measure("tree (cold)", lambda: category_tree.tree(tenant))
+            measure("tree (warm)", lambda: category_tree.tree(tenant))
+            raise Rollback
+    except Rollback:
+        # The cached tree describes rolled back rows
+        invalidate_category_tree(tenant.id)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=5000)
+    args = parser.parse_args()
+    run(args.nodes)
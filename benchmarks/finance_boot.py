@@ -0,0 +1,54 @@
+"""
+Worker boot benchmark.
+
+Starts ``--runs`` fresh interpreters that each run ``django.setup()`` and
+prints the mean wall time of the setup and the number of queries executed
+while the apps were loading. Run it on two revisions to compare them; before
+the transaction type choices became lazy, loading the finance models queried
+every income and expense type.
+
+Usage:
+    python -m benchmarks.finance_boot --runs 10
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+CHILD = """
+import json, os, time
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "conf.settings")
+started = time.perf_counter()
+import django
+from django.db import connection
+connection.force_debug_cursor = True
+django.setup()
+elapsed = (time.perf_counter() - started) * 1000
+print(json.dumps({"ms": elapsed, "queries": len(connection.queries)}))
+"""
+
+
+def boot():
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(runs):
+    results = [boot() for _ in range(runs)]
+    times = [result["ms"] for result in results]
+    print(f"{runs} boots")
+    print(f"{'mean ms':>10} {'min ms':>10} {'queries':>8}")
+    print(
+        f"{statistics.mean(times):>10.1f} {min(times):>10.1f} "
+        f"{results[0]['queries']:>8}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+    run(args.runs)
@@ -0,0 +1,93 @@
+"""
+Image encoding benchmark.
+
+Runs the previous 20-pass ``image_processing`` loop and the single-decode
+``encode_image`` over a corpus of images and reports, per image, the CPU time
+and the output size of each. Without ``--corpus`` a synthetic corpus of
+photo-like images of common upload sizes is generated.
+
+Usage:
+    python -m benchmarks.image_encoding --corpus path/to/images --target-kb 55
+"""
+import argparse
+import os
+import time
+from io import BytesIO
+
+from PIL import Image, ImageFilter, ImageOps
+
+from apps.share.services.image_process import encode_image
+
+SYNTHETIC_SIZES = [(640, 480), (1280, 960), (1920, 1080), (3024, 4032), (4000, 3000)]
+
+
+def legacy_encode(image_file, target_size_kb, format="JPEG"):
+    # The loop image_processing used before encode_image, minus the storage I/O
+    processed_image = Image.open(image_file)
+    quality = 95
+    size = 1000
+    for iteration in range(20):
+        buffer = BytesIO()
+        rgb_image = ImageOps.exif_transpose(processed_image.convert("RGB"))
+        rgb_image.save(buffer, format=format, quality=quality)
+        if len(buffer.getvalue()) / 1024 <= target_size_kb:
+            return buffer.getvalue()
+        processed_image = processed_image.resize((size, size))
+        size -= 100
+        quality -= 5
+    return None
+
+
+def synthetic_corpus():
+    for width, height in SYNTHETIC_SIZES:
+        noise = Image.frombytes("RGB", (width, height), os.urandom(width * height * 3))
+        gradient = Image.linear_gradient("L").resize((width, height)).convert("RGB")
+        image = Image.blend(gradient, noise.filter(ImageFilter.BoxBlur(2)), 0.35)
+        buffer = BytesIO()
+        image.save(buffer, format="JPEG", quality=92)
+        yield f"synthetic_{width}x{height}.jpg", buffer.getvalue()
+
+
+def file_corpus(directory):
+    for name in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, name), "rb") as image_file:
+            yield name, image_file.read()
+
+
+def measure(encode, data, target_kb):
+    started = time.process_time()
+    result = encode(BytesIO(data), target_kb)
+    elapsed = time.process_time() - started
+    if isinstance(result, dict):
+        result = result["full"]
+    return elapsed * 1000, len(result) / 1024 if result else None
+
+
+def run(corpus, target_kb):
+    totals = {"legacy": 0.0, "single-pass": 0.0}
+    print(
+        f"{'image':>28} {'legacy ms':>10} {'legacy kb':>10} "
+        f"{'new ms':>10} {'new kb':>10}"
+    )
+    for name, data in corpus:
+        legacy_ms, legacy_kb = measure(legacy_encode, data, target_kb)
+        new_ms, new_kb = measure(encode_image, data, target_kb)
+        totals["legacy"] += legacy_ms
+        totals["single-pass"] += new_ms
+        print(
+            f"{name:>28} {legacy_ms:>10.1f} {legacy_kb or 0:>10.1f} "
+            f"{new_ms:>10.1f} {new_kb or 0:>10.1f}"
+        )
+    print(
+        f"total cpu: legacy {totals['legacy']:.0f}ms, "
+        f"single-pass {totals['single-pass']:.0f}ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", help="directory of sample images")
+    parser.add_argument("--target-kb", type=int, default=55)
+    args = parser.parse_args()
+    corpus = file_corpus(args.corpus) if args.corpus else synthetic_corpus()
+    run(corpus, args.target_kb)
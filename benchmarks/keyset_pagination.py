@@ -0,0 +1,117 @@
+"""
+Keyset pagination benchmark.
+
+Seeds FM_Transaction with ``--rows`` rows (five million by default) for one
+tenant, then times fetching page 1 and page ``--page`` of the newest-first
+transaction list through the old page number paginator (COUNT(*) plus
+OFFSET) and through the default keyset paginator. The keyset pages cost the
+same at any depth; the page number ones grow with the offset. Runs inside a
+rolled back transaction against the configured PostgreSQL database.
+
+Usage:
+    python -m benchmarks.keyset_pagination --rows 5000000 --page 10000
+"""
+import argparse
+import base64
+import json
+import os
+import statistics
+import time
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "conf.settings")
+django.setup()
+
+from django.db import connection, transaction  # noqa: E402
+from rest_framework.request import Request  # noqa: E402
+from rest_framework.test import APIRequestFactory  # noqa: E402
+
+from apps.clients.models import ClientModel  # noqa: E402
+from apps.finance.models.transaction import Transaction  # noqa: E402
+from apps.share.services.custom_pagination import (  # noqa: E402
+    CustomPageNumberPagination,
+    KeysetPagination,
+)
+
+PAGE_SIZE = 50
+REPEATS = 5
+
+
+class Rollback(Exception):
+    pass
+
+
+def seed(rows):
+    tenant = ClientModel.objects.first()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO "{Transaction._meta.db_table}" (
+                tenant_id, tran_number, tran_date, amount, tran_type,
+                tran_group, tran_head, status, created_at, edited_at
+            )
+            SELECT
+                %s, 'TRN-' || n, now(), n %% 1000, 1001, 101, 1, 1,
+                now() - (n || ' seconds')::interval, now()
+            FROM generate_series(1, %s) AS n
+            """,
+            [tenant.id, rows],
+        )
+        cursor.execute(f'ANALYZE "{Transaction._meta.db_table}"')
+    return tenant
+
+
+def request(params):
+    return Request(APIRequestFactory().get("/finance/transaction/", params))
+
+
+def timed(paginator, queryset, params):
+    samples = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        results = paginator.paginate_queryset(queryset, request(params))
+        samples.append((time.perf_counter() - started) * 1000)
+    assert len(results) == PAGE_SIZE
+    return statistics.median(samples)
+
+
+def keyset_cursor(queryset, page):
+    # Position of the last row of the page before ``page``
+    row = queryset.order_by("-created_at", "-id")[(page - 1) * PAGE_SIZE - 1]
+    position = [row.created_at.isoformat(), row.pk]
+    return base64.urlsafe_b64encode(json.dumps({"p": position}).encode()).decode()
+
+
+def run(rows, page):
+    try:
+        with transaction.atomic():
+            tenant = seed(rows)
+            queryset = tenant.transaction_base_models.all().order_by("-created_at")
+
+            print(f"{rows} transactions, {PAGE_SIZE} per page, median of {REPEATS}")
+            print(f"{'paginator':<12} {'page 1 ms':>10} {f'page {page} ms':>14}")
+            page_number = CustomPageNumberPagination()
+            page_number.page_size = PAGE_SIZE
+            print(
+                f"{'page number':<12}"
+                f" {timed(page_number, queryset, {'page': 1}):>10.1f}"
+                f" {timed(page_number, queryset, {'page': page}):>14.1f}"
+            )
+            cursor = keyset_cursor(queryset, page)
+            print(
+                f"{'keyset':<12}"
+                f" {timed(KeysetPagination(), queryset, {'page_size': PAGE_SIZE}):>10.1f}"
+                f" {timed(KeysetPagination(), queryset, {'page_size': PAGE_SIZE, 'cursor': cursor}):>14.1f}"
+            )
+            raise Rollback
+    except Rollback:
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--page", type=int, default=10_000)
+    args = parser.parse_args()
+    run(args.rows, args.page)
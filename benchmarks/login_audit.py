@@ -0,0 +1,84 @@
+"""
+Login audit benchmark.
+
+Compares the login request cost of the old inline device fingerprinting
+(a public IP DNS lookup plus user agent parsing) with queueing the entry on the
+login audit writer. DNS latency is simulated, so the old path's p99 follows it
+while the queued path stays flat.
+
+Usage:
+    python -m benchmarks.login_audit --logins 2000 --dns-latency 50
+"""
+import argparse
+import os
+import statistics
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "conf.settings")
+django.setup()
+
+from apps.share.services import login_audit  # noqa: E402
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36"
+)
+
+
+def percentile(samples, percent):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * percent / 100))]
+
+
+def inline_login(request):
+    public_ip = login_audit.socket.gethostbyname(login_audit.PUBLIC_IP_HOST)
+    login_audit.build_device_info(
+        request.META["HTTP_USER_AGENT"], request.META["REMOTE_ADDR"], public_ip
+    )
+
+
+def measure(login, logins, request):
+    samples = []
+    for _ in range(logins):
+        started = time.perf_counter()
+        login(request)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def run(logins, dns_latency):
+    def slow_dns(host):
+        time.sleep(dns_latency / 1000)
+        return "203.0.113.10"
+
+    request = SimpleNamespace(
+        META={"HTTP_USER_AGENT": USER_AGENT, "REMOTE_ADDR": "10.0.0.1"}
+    )
+    user = SimpleNamespace(id=1)
+    writer = login_audit.LoginAuditWriter(start_worker=False)
+
+    with mock.patch.object(login_audit.socket, "gethostbyname", slow_dns):
+        results = {
+            "inline": measure(inline_login, logins, request),
+            "queued": measure(lambda r: writer.record(user, r), logins, request),
+        }
+
+    print(f"dns latency: {dns_latency}ms, logins: {logins}")
+    print(f"{'path':>8} {'p50 ms':>10} {'p99 ms':>10} {'mean ms':>10}")
+    for path, samples in results.items():
+        print(
+            f"{path:>8} {percentile(samples, 50):>10.3f} "
+            f"{percentile(samples, 99):>10.3f} {statistics.mean(samples):>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=2000)
+    parser.add_argument("--dns-latency", type=float, default=50.0)
+    args = parser.parse_args()
+    run(args.logins, args.dns_latency)
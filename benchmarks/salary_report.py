@@ -0,0 +1,97 @@
+"""
+Salary report benchmark.
+
+Seeds employees with two salary rows and a month of attendance each, then
+builds the FilterSalaryListView report for a growing number of employees and
+prints the query count and wall time. The query count stays fixed however many
+employees the report covers. Runs inside a rolled back transaction against the
+configured database.
+
+Usage:
+    python -m benchmarks.salary_report --employees 2000
+"""
+import argparse
+import os
+import time
+from datetime import datetime
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "conf.settings")
+django.setup()
+
+from django.db import connection, transaction  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+
+from apps.clients.models import ClientModel  # noqa: E402
+from apps.hr.models.attendance import Attendance  # noqa: E402
+from apps.hr.models.employee import Employee  # noqa: E402
+from apps.hr.models.salary import Salary  # noqa: E402
+from apps.hr.views.filtered_salary_list import FilterSalaryListView  # noqa: E402
+
+FROM_DATE = datetime(2023, 7, 1)
+TO_DATE = datetime(2023, 7, 31, 23, 59, 59)
+
+
+class Rollback(Exception):
+    pass
+
+
+def seed(tenant, count):
+    employees = Employee.objects.bulk_create(
+        Employee(tenant=tenant, name=f"bench_{n}", emp_wage_type=1, salary=6000)
+        for n in range(count)
+    )
+    Salary.objects.bulk_create(
+        Salary(
+            tenant=tenant,
+            employee=employee,
+            dt_from=FROM_DATE,
+            dt_to=TO_DATE,
+            salary=2000,
+            advance=500,
+            bonus=100,
+            deduct=50,
+        )
+        for employee in employees
+        for _ in range(2)
+    )
+    Attendance.objects.bulk_create(
+        Attendance(
+            tenant=tenant,
+            employee=employee,
+            date=datetime(2023, 7, day),
+            attend_status=1 + day % 3,
+        )
+        for employee in employees
+        for day in range(1, 31)
+    )
+
+
+def run(employees):
+    try:
+        with transaction.atomic():
+            tenant = ClientModel.objects.first()
+            view = FilterSalaryListView()
+            print(f"{'employees':>10} {'queries':>8} {'ms':>10}")
+            seeded = 0
+            for count in sorted({10, employees // 10, employees}):
+                seed(tenant, count - seeded)
+                seeded = count
+                queryset = Employee.objects.filter(tenant=tenant, emp_wage_type=1)
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    rows = view.salary_report(queryset, FROM_DATE, TO_DATE)
+                    elapsed = (time.perf_counter() - started) * 1000
+                assert len(rows) >= count
+                print(f"{count:>10} {len(queries):>8} {elapsed:>10.1f}")
+            raise Rollback
+    except Rollback:
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=2000)
+    args = parser.parse_args()
+    run(args.employees)
@@ -0,0 +1,129 @@
+"""
+Stock index benchmark.
+
+Seeds INV_Stock with ``--rows`` rows (one million by default) spread over a
+few tenants, warehouses and items, then prints the EXPLAIN ANALYZE plan and
+timing of each stock access path: the stock ledger identity lookup, the FEFO
+lot selection of invoice allocation and the warehouse stock listing. Each
+plan should use its composite index instead of scanning the table. Runs
+inside a rolled back transaction against the configured PostgreSQL database.
+
+Usage:
+    python -m benchmarks.stock_indexes --rows 1000000
+"""
+import argparse
+import os
+from datetime import date
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "conf.settings")
+django.setup()
+
+from django.db import connection, transaction  # noqa: E402
+
+from apps.clients.models import ClientModel  # noqa: E402
+from apps.inventories.models.item import Item  # noqa: E402
+from apps.inventories.models.stock import Stock  # noqa: E402
+from apps.inventories.models.uom import UOM  # noqa: E402
+from apps.inventories.models.warehouse import Warehouse  # noqa: E402
+
+WAREHOUSES = 20
+ITEMS = 5000
+
+
+class Rollback(Exception):
+    pass
+
+
+def seed(rows):
+    tenant = ClientModel.objects.first()
+    uom = UOM.objects.create(tenant=tenant, uom_name="bench")
+    warehouses = Warehouse.objects.bulk_create(
+        Warehouse(tenant=tenant, warehouse_name=f"bench_{n}", warehouse_sn=f"b{n}")
+        for n in range(WAREHOUSES)
+    )
+    items = Item.objects.bulk_create(
+        Item(tenant=tenant, item_title=f"bench_{n}", uom=uom) for n in range(ITEMS)
+    )
+
+    # Rows are generated in the database; a third of the lots are sold out
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO "{Stock._meta.db_table}" (
+                tenant_id, source_id, item_id, uom_id, stock_identity,
+                lot_number, exp_date, quantity, per_pack_qty, non_pack_qty,
+                created_at, edited_at
+            )
+            SELECT
+                %s,
+                (%s::int[])[1 + n %% %s],
+                (%s::int[])[1 + (n / %s) %% %s],
+                %s,
+                'bench-' || n,
+                'L' || n,
+                CURRENT_DATE + (n %% 720),
+                CASE WHEN n %% 3 = 0 THEN 0 ELSE n %% 50 + 1 END,
+                0,
+                0,
+                now() - (n || ' seconds')::interval,
+                now()
+            FROM generate_series(1, %s) AS n
+            """,
+            [
+                tenant.id,
+                [warehouse.id for warehouse in warehouses],
+                WAREHOUSES,
+                [item.id for item in items],
+                WAREHOUSES,
+                ITEMS,
+                uom.id,
+                rows,
+            ],
+        )
+        cursor.execute(f'ANALYZE "{Stock._meta.db_table}"')
+    return tenant, warehouses[0], items[0], uom
+
+
+def run(rows):
+    try:
+        with transaction.atomic():
+            tenant, warehouse, item, uom = seed(rows)
+            identity = Stock.objects.filter(source=warehouse, item=item).values_list(
+                "stock_identity", flat=True
+            )[0]
+            plans = {
+                "stock ledger lookup": Stock.objects.filter(
+                    tenant=tenant,
+                    source=warehouse,
+                    item=item,
+                    stock_identity=identity,
+                ),
+                "FEFO allocation": Stock.objects.filter(
+                    tenant=tenant,
+                    source=warehouse,
+                    item=item,
+                    uom=uom,
+                    quantity__gt=0,
+                    exp_date__gte=date.today(),
+                ).order_by("exp_date", "id"),
+                "warehouse listing": Stock.objects.filter(
+                    tenant=tenant, source=warehouse
+                ).order_by("-created_at")[:50],
+            }
+
+            print(f"{rows} stock rows")
+            for label, queryset in plans.items():
+                print(f"\n== {label}")
+                print(queryset.explain(analyze=True))
+            raise Rollback
+    except Rollback:
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+    run(args.rows)
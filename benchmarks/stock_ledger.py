@@ -0,0 +1,108 @@
+"""
+Stock ledger benchmark.
+
+Receives a multi-line receipt into stock twice: once line by line, as the old
+per-line stock_exists_obj did, and once through a single StockLedger batch.
+Half of the lines hit existing stock rows and half create new ones. Reports
+the query count and wall time of each; the batch stays at a constant number of
+queries however many lines the receipt has. Runs inside a rolled back
+transaction against the configured database.
+
+Usage:
+    python -m benchmarks.stock_ledger --lines 200
+"""
+import argparse
+import os
+import time
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "conf.settings")
+django.setup()
+
+from django.db import connection, transaction  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+
+from apps.clients.models import ClientModel  # noqa: E402
+from apps.inventories.models.item import Item  # noqa: E402
+from apps.inventories.models.uom import UOM  # noqa: E402
+from apps.inventories.models.warehouse import Warehouse  # noqa: E402
+from apps.share.services.stock_ledger import StockEntry, StockLedger  # noqa: E402
+from apps.share.views import generate_stock_identity  # noqa: E402
+
+
+class Rollback(Exception):
+    pass
+
+
+def receipt_entries(warehouse, uom, items, lot_number):
+    return [
+        StockEntry(
+            warehouse_id=warehouse.id,
+            item_id=item.id,
+            stock_identity=generate_stock_identity(uom.id, lot_number, 0, "2030-01-01"),
+            qty=10,
+            price=5,
+            uom_id=uom.id,
+            lot_number=lot_number,
+            exp_date="2030-01-01",
+            recvd_date="2030-01-01T00:00:00Z",
+        )
+        for item in items
+    ]
+
+
+def measure(label, apply, tenant, warehouse, uom, items):
+    try:
+        with transaction.atomic():
+            # Half of the lines land on rows that already exist
+            StockLedger(tenant).apply(
+                receipt_entries(warehouse, uom, items[: len(items) // 2], "B1")
+            )
+            entries = receipt_entries(warehouse, uom, items, "B1")
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                apply(tenant, entries)
+                elapsed = (time.perf_counter() - started) * 1000
+            print(f"{label:<12} {len(queries):>8} {elapsed:>10.1f}")
+            raise Rollback
+    except Rollback:
+        pass
+
+
+def per_line(tenant, entries):
+    for entry in entries:
+        StockLedger(tenant).apply([entry])
+
+
+def batched(tenant, entries):
+    StockLedger(tenant).apply(entries)
+
+
+def run(lines):
+    try:
+        with transaction.atomic():
+            tenant = ClientModel.objects.first()
+            warehouse = Warehouse.objects.create(
+                tenant=tenant, warehouse_name="bench", warehouse_sn="bench"
+            )
+            uom = UOM.objects.create(tenant=tenant, uom_name="bench")
+            items = Item.objects.bulk_create(
+                Item(tenant=tenant, item_title=f"bench_{number}", uom=uom)
+                for number in range(lines)
+            )
+
+            print(f"{lines} receipt lines")
+            print(f"{'path':<12} {'queries':>8} {'ms':>10}")
+            measure("per line", per_line, tenant, warehouse, uom, items)
+            measure("batched", batched, tenant, warehouse, uom, items)
+            raise Rollback
+    except Rollback:
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=200)
+    args = parser.parse_args()
+    run(args.lines)
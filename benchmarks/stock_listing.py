@@ -0,0 +1,124 @@
+"""
+Stock listing benchmark.
+
+Seeds a warehouse with each of ``--rows`` stock rows (spread over 100 priced
+items) and serializes the listing three ways: the old StockSerializer read
+with only ``select_related("item", "uom")``, StockSerializer with every
+relation joined, and the projected StockRowSerializer. Prints the query
+count, wall time and peak traced memory of each. Runs inside a rolled back
+transaction against the configured database; the old path runs two queries
+per row, so it is slow at 100k rows.
+
+Usage:
+    python -m benchmarks.stock_listing --rows 10000 100000
+"""
+import argparse
+import os
+import time
+import tracemalloc
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "conf.settings")
+django.setup()
+
+from django.db import connection, transaction  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+
+from apps.clients.models import ClientModel  # noqa: E402
+from apps.inventories.models.item import Item  # noqa: E402
+from apps.inventories.models.stock import Stock  # noqa: E402
+from apps.inventories.models.stock_price import StockPrice  # noqa: E402
+from apps.inventories.models.uom import UOM  # noqa: E402
+from apps.inventories.models.warehouse import Warehouse  # noqa: E402
+from apps.inventories.serializers.stock import (  # noqa: E402
+    StockRowSerializer,
+    StockSerializer,
+)
+
+ITEMS = 100
+
+
+class Rollback(Exception):
+    pass
+
+
+def seed(tenant, count):
+    warehouse = Warehouse.objects.create(
+        tenant=tenant, warehouse_name="bench", warehouse_sn="bench"
+    )
+    uom = UOM.objects.create(tenant=tenant, uom_name="bench")
+    items = Item.objects.bulk_create(
+        Item(tenant=tenant, item_title=f"bench_{n}", uom=uom) for n in range(ITEMS)
+    )
+    prices = StockPrice.objects.bulk_create(
+        StockPrice(tenant=tenant, item=item, sales_price=10) for item in items
+    )
+    Stock.objects.bulk_create(
+        (
+            Stock(
+                tenant=tenant,
+                source=warehouse,
+                item=items[n % ITEMS],
+                item_price=prices[n % ITEMS],
+                uom=uom,
+                stock_identity=f"bench_{n}",
+                quantity=10,
+            )
+            for n in range(count)
+        ),
+        batch_size=5000,
+    )
+    return warehouse
+
+
+def old(stocks):
+    return stocks.select_related("item", "uom")
+
+
+def joined(stocks):
+    return stocks.select_related("item__uom", "item_price", "uom")
+
+
+def measure(label, serializer_class, queryset, request):
+    tracemalloc.start()
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        serializer_class(queryset, many=True, context={"request": request}).data
+        elapsed = (time.perf_counter() - started) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<8} {len(queries):>8} {elapsed:>10.1f} {peak / 1024 / 1024:>10.1f}"
+    )
+
+
+def run(counts):
+    request = RequestFactory().get("/")
+    tenant = ClientModel.objects.first()
+    for count in counts:
+        try:
+            with transaction.atomic():
+                warehouse = seed(tenant, count)
+                stocks = Stock.objects.filter(source=warehouse).order_by("-created_at")
+                print(f"{count} stock rows")
+                print(f"{'path':<8} {'queries':>8} {'ms':>10} {'peak MB':>10}")
+                measure("old", StockSerializer, old(stocks), request)
+                measure("joined", StockSerializer, joined(stocks), request)
+                measure(
+                    "rows",
+                    StockRowSerializer,
+                    StockRowSerializer.setup_eager_loading(stocks),
+                    request,
+                )
+                raise Rollback
+        except Rollback:
+            pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+    run(args.rows)
@@ -0,0 +1,55 @@
+"""
+Tenant logger benchmark.
+
+Simulates requests going through ``TenantLoggerMiddleware.configure_logging``
+(the tenant log registry) and reports, per window of requests, the number of
+open file descriptors and the mean per-request latency. Both should stay flat.
+
+Usage:
+    python -m benchmarks.tenant_logging --requests 100000 --tenants 5
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from apps.share.services.tenant_log_registry import TenantLogRegistry
+
+
+def open_fd_count():
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except FileNotFoundError:
+        return -1
+
+
+def run(requests, tenants, window):
+    with tempfile.TemporaryDirectory() as log_dir:
+        registry = TenantLogRegistry(log_dir=log_dir)
+        extra = {"method": "GET", "path": "/inventory/item/"}
+        started = time.perf_counter()
+
+        print(f"{'requests':>10} {'open fds':>10} {'mean us/request':>16}")
+        for start in range(0, requests, window):
+            window_started = time.perf_counter()
+            for number in range(start, min(start + window, requests)):
+                logger = registry.get_logger(f"tenant{number % tenants}")
+                logger.info("request %s", number, extra=extra)
+            elapsed = time.perf_counter() - window_started
+            done = min(start + window, requests)
+            print(
+                f"{done:>10} {open_fd_count():>10} "
+                f"{elapsed / (done - start) * 1_000_000:>16.2f}"
+            )
+
+        registry.stop()
+        print(f"total: {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--tenants", type=int, default=5)
+    parser.add_argument("--window", type=int, default=10_000)
+    args = parser.parse_args()
+    run(args.requests, args.tenants, args.window)
@@ -102,6 +102,8 @@ TENANT_DOMAIN_MODEL = "clients.DomainModel"  # app.Model
 DEFAULT_TENANT_DOMAIN = "localhost"
 TENANT_SUBFOLDER_PREFIX = "clients"
 ORIGINAL_BACKEND = "django.contrib.gis.db.backends.postgis"
+# Only send SET search_path when the schema changes, not before every query
+TENANT_LIMIT_SET_CALLS = True
 
 SITE_ID = 1
 AUTH_USER_MODEL = "users.User"
@@ -115,6 +117,8 @@ REST_FRAMEWORK = {
         "apps.users.custom_authentication.CustomAuthentication",
     ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
+    # Keyset cursors by default; ?page= opts in to page numbers
+    "DEFAULT_PAGINATION_CLASS": "apps.share.services.custom_pagination.KeysetPagination",
 }
 
 CORS_ALLOW_CREDENTIALS = True
@@ -179,6 +183,40 @@ DATABASES = {
 
 DATABASE_ROUTERS = ("django_tenants.routers.TenantSyncRouter",)
 
+# Cache for permissions and tenant master data. "file" (the default) shares
+# the cache, and its invalidations, between the workers of a host. "locmem"
+# is per process: other workers see a change only once their entry expires,
+# so only use it with a single worker, e.g. in development. Redis is not
+# required
+CACHE_BACKEND = config("CACHE_BACKEND", default="file")
+if CACHE_BACKEND == "file":
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": config("CACHE_LOCATION", default=os.path.join(BASE_DIR, "cache")),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+# Seconds a user's group permissions are cached. A per process cache never
+# sees another worker's invalidation, so a revoked permission would be
+# honoured there until the entry expires; keep it short unless shared
+PERMISSION_CACHE_TIMEOUT = config(
+    "PERMISSION_CACHE_TIMEOUT",
+    default=60 * 60 if CACHE_BACKEND != "locmem" else 30,
+    cast=int,
+)
+# Seconds a tenant's cached UOMs, warehouses, brands, categories, item
+# attributes and preference are kept
+MASTER_DATA_CACHE_TIMEOUT = config("MASTER_DATA_CACHE_TIMEOUT", default=300, cast=int)
+# Seconds before the last low stock check that the next one looks back, so
+# stock changes committed by transactions open during a check are not missed
+LOW_STOCK_RECHECK_OVERLAP = config("LOW_STOCK_RECHECK_OVERLAP", default=300, cast=int)
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -303,6 +341,20 @@ SIMPLE_JWT = {
     "AUTH_COOKIE_SAMESITE": "Lax",
     # This can be 'Lax', 'Strict', or None to disable the flag.
 }
+# Login audit: write UserLogInfo rows from a background batch writer and
+# optionally enrich them with a cached public IP lookup
+USER_LOG_ASYNC = config("USER_LOG_ASYNC", default=True, cast=bool)
+USER_LOG_PUBLIC_IP_LOOKUP = config("USER_LOG_PUBLIC_IP_LOOKUP", default=False, cast=bool)
+
+# Number of background workers recompressing uploaded item images
+# (0 processes them inline)
+IMAGE_PROCESSING_WORKERS = config("IMAGE_PROCESSING_WORKERS", default=2, cast=int)
+
+# Document numbers are allocated gap-free from a locked row per tenant, prefix
+# and year; a block size above 1 pre-allocates numbers per worker instead
+# (faster, but numbers may skip)
+DOCUMENT_SEQUENCE_BLOCK_SIZE = config("DOCUMENT_SEQUENCE_BLOCK_SIZE", default=1, cast=int)
+
 # SESSION_COOKIE_DOMAIN = '.localhost'
 # CSRF_COOKIE_DOMAIN = '.localhost'
 